@@ -0,0 +1,146 @@
+"""
+Check and benchmark CachedStockDataFetcher against a stubbed API client.
+
+The stub serves seeded synthetic histories that grow as a fake clock
+advances, and counts every call. The checks cover a cold miss, a warm hit
+with no API call, a stale entry topped up with one compact call, a gap
+too wide for a compact window, a corrupt file, and LRU eviction. Then
+cold and warm reads of a universe are timed.
+
+Usage:
+python benchmarks/bench_cache.py [n_symbols] [n_bars]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.data_cache import CachedStockDataFetcher
+from modules.data_fetcher import AlphaVantageStockDataFetcher
+from modules.synthetic import generate_raw_alpha_vantage
+
+DAY = 24 * 3600
+
+
+class StubTimeSeries:
+    """
+    Stands in for alpha_vantage's TimeSeries: per-symbol histories of which
+    only the first `available` bars have "happened" yet.
+    """
+
+    def __init__(self, n_bars: int, available: int):
+        self.n_bars = n_bars
+        self.available = available
+        self.calls = []
+        self._raw = {}
+
+    def get_daily(self, symbol, outputsize="compact"):
+        self.calls.append((symbol, outputsize))
+        if symbol not in self._raw:
+            self._raw[symbol] = generate_raw_alpha_vantage(self.n_bars, seed=sum(map(ord, symbol)))
+        # Raw frames are newest first: drop the bars that have not happened yet
+        raw = self._raw[symbol].iloc[self.n_bars - self.available:]
+        return (raw.head(100) if outputsize == "compact" else raw), {}
+
+    def expected(self, symbol) -> pd.DataFrame:
+        """
+        Full history up to now, formatted like the fetcher does.
+        """
+        self.get_daily(symbol, "full")
+        self.calls.pop()
+        raw = self._raw[symbol].iloc[self.n_bars - self.available:]
+        return AlphaVantageStockDataFetcher(api_key="bench-cache", ts=self)._format_data(raw)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(ts, cache_dir, clock, **kwargs) -> CachedStockDataFetcher:
+    fetcher = AlphaVantageStockDataFetcher(api_key="bench-cache", ts=ts, calls_per_minute=1e9)
+    return CachedStockDataFetcher(fetcher, cache_dir=cache_dir, ttl=DAY, clock=clock, **kwargs)
+
+
+def check_behaviour():
+    clock = Clock()
+    ts = StubTimeSeries(n_bars=2_000, available=1_000)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = make_cache(ts, cache_dir, clock)
+
+        # Cold miss: one full download
+        df = cache.get_daily_data("AAA.BSE", outputsize="full")
+        assert ts.calls == [("AAA.BSE", "full")]
+        pd.testing.assert_frame_equal(df, ts.expected("AAA.BSE"))
+
+        # Warm hit within the TTL: no call, same data, also from a new instance
+        cache = make_cache(ts, cache_dir, clock)
+        pd.testing.assert_frame_equal(cache.get_daily_data("AAA.BSE", outputsize="full"), df)
+        assert cache.get_daily_data("AAA.BSE").equals(df.tail(100).reset_index(drop=True))
+        assert len(ts.calls) == 1
+
+        # Stale: three new bars arrive, one compact call tops the entry up
+        clock.now += 2 * DAY
+        ts.available += 3
+        df = cache.get_daily_data("AAA.BSE", outputsize="full")
+        assert ts.calls[1:] == [("AAA.BSE", "compact")]
+        pd.testing.assert_frame_equal(df, ts.expected("AAA.BSE"))
+
+        # Stale with a gap wider than the compact window: compact, then full
+        clock.now += 2 * DAY
+        ts.available += 250
+        df = cache.get_daily_data("AAA.BSE", outputsize="full")
+        assert ts.calls[2:] == [("AAA.BSE", "compact"), ("AAA.BSE", "full")]
+        pd.testing.assert_frame_equal(df, ts.expected("AAA.BSE"))
+
+        # A corrupt file is dropped and refetched
+        with open(os.path.join(cache_dir, "daily__AAA.BSE.parquet"), "wb") as f:
+            f.write(b"not parquet")
+        pd.testing.assert_frame_equal(cache.get_daily_data("AAA.BSE", outputsize="full"), df)
+        assert ts.calls[-1] == ("AAA.BSE", "full")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Room for about one entry: reading a second symbol evicts the first
+        cache = make_cache(ts, cache_dir, clock)
+        cache.get_daily_data("AAA.BSE", outputsize="full")
+        entry_bytes = cache._index["daily__AAA.BSE"]["bytes"]
+        cache = make_cache(ts, cache_dir, clock, max_bytes=int(entry_bytes * 1.5))
+        clock.now += 1
+        cache.get_daily_data("BBB.BSE", outputsize="full")
+        assert set(cache._index) == {"daily__BBB.BSE"}
+        assert not os.path.exists(os.path.join(cache_dir, "daily__AAA.BSE.parquet"))
+
+
+if __name__ == "__main__":
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n_bars = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+
+    check_behaviour()
+    print("Cache behaviour checks passed.")
+
+    symbols = [f"SYN{i:04d}.BSE" for i in range(n_symbols)]
+    ts = StubTimeSeries(n_bars=n_bars, available=n_bars)
+    for symbol in symbols:
+        ts.expected(symbol)  # Generate up front, outside the timings
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = make_cache(ts, cache_dir, Clock())
+        timings = {}
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            for symbol in symbols:
+                cache.get_daily_data(symbol, outputsize="full")
+            timings[label] = time.perf_counter() - start
+        assert len(ts.calls) == n_symbols, "warm pass hit the API"
+
+    print(f"{n_symbols} symbols x {n_bars} bars")
+    print(f"cold (stub API + Parquet write): {timings['cold']:.3f}s, {n_symbols} calls")
+    print(f"warm (Parquet read):             {timings['warm']:.3f}s, 0 calls")
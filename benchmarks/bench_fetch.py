@@ -0,0 +1,146 @@
+"""
+Check and benchmark concurrent Alpha Vantage fetching against a local fake server.
+
+The server speaks the TIME_SERIES_DAILY JSON format, adds a fixed
+latency per request, answers a quota notice on the first request of some
+symbols and an error for an invalid one. The checks cover correct data
+for every symbol, one retry per throttled symbol, no retry for the
+invalid symbol, and that base_url leaves other clients pointing at the
+real API. Then a universe is fetched serially and concurrently, and under
+a tight quota to show the rate limiter sets the pace.
+
+Usage:
+python benchmarks/bench_fetch.py [n_symbols] [latency_ms]
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.data_fetcher import AlphaVantageStockDataFetcher
+from modules.synthetic import generate_raw_alpha_vantage
+
+N_BARS = 250
+
+
+class FakeAlphaVantage(ThreadingHTTPServer):
+    """
+    Minimal TIME_SERIES_DAILY endpoint with per-symbol request counts.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency=0.05, throttle_once=(), invalid=()):
+        super().__init__(("127.0.0.1", 0), FakeHandler)
+        self.latency = latency
+        self.throttle_once = set(throttle_once)
+        self.invalid = set(invalid)
+        self.requests = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/query?"
+
+    def respond(self, params: dict) -> dict:
+        symbol = params["symbol"][0]
+        with self._lock:
+            self.requests[symbol] += 1
+            count = self.requests[symbol]
+        time.sleep(self.latency)
+
+        if symbol in self.invalid:
+            return {"Error Message": "Invalid API call. Please retry or visit the documentation."}
+        if symbol in self.throttle_once and count == 1:
+            return {"Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."}
+
+        raw = expected_raw(symbol)
+        series = {
+            date.strftime("%Y-%m-%d"): {column: f"{value:.4f}" for column, value in row.items()}
+            for date, row in raw.iterrows()
+        }
+        return {"Meta Data": {"2. Symbol": symbol}, "Time Series (Daily)": series}
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps(self.server.respond(parse_qs(urlparse(self.path).query))).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def expected_raw(symbol: str) -> pd.DataFrame:
+    return generate_raw_alpha_vantage(N_BARS, seed=sum(map(ord, symbol)))
+
+
+def timed_batch(server, symbols, api_key, calls_per_minute, max_workers):
+    fetcher = AlphaVantageStockDataFetcher(api_key=api_key, calls_per_minute=calls_per_minute,
+                                           base_url=server.url)
+    start = time.perf_counter()
+    frames = fetcher.get_daily_data_batch(symbols, max_workers=max_workers)
+    return frames, time.perf_counter() - start
+
+
+def check_behaviour(server):
+    from alpha_vantage.alphavantage import AlphaVantage
+
+    default_url = AlphaVantage._ALPHA_VANTAGE_API_URL
+    symbols = ["AAA.BSE", "BBB.BSE", "CCC.BSE", "BAD.BSE"]
+    server.throttle_once.add("BBB.BSE")
+    server.invalid.add("BAD.BSE")
+
+    frames, _ = timed_batch(server, symbols, "bench-fetch-check", 6_000, max_workers=4)
+    reference = AlphaVantageStockDataFetcher(api_key="bench-fetch-check", ts=object())
+    for symbol in ["AAA.BSE", "BBB.BSE", "CCC.BSE"]:
+        pd.testing.assert_frame_equal(frames[symbol], reference._format_data(expected_raw(symbol)),
+                                      check_exact=False, rtol=1e-4)
+    assert frames["BAD.BSE"].empty
+    assert server.requests == Counter({"AAA.BSE": 1, "BBB.BSE": 2, "CCC.BSE": 1, "BAD.BSE": 1}), server.requests
+
+    # The override is per client: the library default and other clients are untouched
+    assert AlphaVantage._ALPHA_VANTAGE_API_URL == default_url
+    other = AlphaVantageStockDataFetcher(api_key="bench-fetch-other")
+    assert "_handle_api_call" not in vars(other.ts)
+
+
+if __name__ == "__main__":
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+
+    server = FakeAlphaVantage(latency=latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    check_behaviour(server)
+    print("Fake-server checks passed.")
+
+    symbols = [f"SYN{i:04d}.BSE" for i in range(n_symbols)]
+    for symbol in symbols:
+        expected_raw(symbol)
+
+    print(f"{n_symbols} symbols, {latency * 1000:.0f} ms per request")
+    _, serial = timed_batch(server, symbols, "bench-fetch-serial", 60_000, max_workers=1)
+    print(f"serial,      unlimited quota: {serial:.2f}s")
+    frames, concurrent = timed_batch(server, symbols, "bench-fetch-pool", 60_000, max_workers=8)
+    assert all(not df.empty for df in frames.values())
+    print(f"8 workers,   unlimited quota: {concurrent:.2f}s ({serial / concurrent:.1f}x)")
+
+    quota = 1_200
+    _, limited = timed_batch(server, symbols, "bench-fetch-quota", quota, max_workers=8)
+    floor = (n_symbols - 1) * 60 / quota
+    assert limited >= floor * 0.95, "rate limiter let calls through faster than the quota"
+    print(f"8 workers, {quota}/min quota:   {limited:.2f}s (quota floor {floor:.2f}s)")
+    server.shutdown()
@@ -0,0 +1,85 @@
+"""
+Enforce the import-time budget of the modules package.
+
+Each module is imported in a fresh interpreter. The check fails (exit code 1)
+if a module takes longer than BASELINE + BUDGET_SECONDS to import, where
+BASELINE is the cost of importing numpy and pandas alone, or if importing it
+loads one of the heavy optional dependencies that must stay lazy.
+
+Usage:
+python benchmarks/bench_import.py [--repeat 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULES = [
+    "modules.bars", "modules.config", "modules.data_cache", "modules.data_fetcher", "modules.feature_store",
+    "modules.file_fetchers", "modules.google_sheets_writer", "modules.indicators",
+    "modules.inference", "modules.instrumentation", "modules.ledger", "modules.live_signals",
+    "modules.ml_model", "modules.optimizer", "modules.portfolio", "modules.rate_limiter",
+    "modules.reporting", "modules.resampler", "modules.robustness", "modules.scheduler",
+    "modules.screener", "modules.strategy", "modules.synthetic", "modules.telegram_notifier",
+    "modules.universe_runner",
+]
+
+# Must not be imported as a side effect of importing any module above
+LAZY_DEPENDENCIES = [
+    "alpha_vantage", "gspread", "oauth2client", "sklearn", "joblib",
+    "matplotlib", "seaborn", "requests", "dotenv",
+]
+
+# Allowed import time on top of numpy + pandas
+BUDGET_SECONDS = 0.15
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    """
+    Best-of-`repeat` import time of `module` in a fresh interpreter.
+    """
+    runs = []
+    for _ in range(repeat):
+        code = PROBE.format(module=module, lazy=LAZY_DEPENDENCIES)
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, text=True)
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return min(runs, key=lambda r: r["seconds"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    baseline = measure("numpy, pandas", args.repeat)["seconds"]
+    limit = baseline + BUDGET_SECONDS
+    print(f"baseline (numpy + pandas): {baseline:.3f}s, budget per module: {limit:.3f}s\n")
+
+    failures = []
+    print(f"{'module':<30} {'time (s)':>9}  status")
+    for module in MODULES:
+        result = measure(module, args.repeat)
+        problems = []
+        if result["seconds"] > limit:
+            problems.append("over budget")
+        if result["loaded"]:
+            problems.append("loads " + ", ".join(result["loaded"]))
+        print(f"{module:<30} {result['seconds']:>9.3f}  {'; '.join(problems) or 'ok'}")
+        if problems:
+            failures.append(module)
+
+    if failures:
+        print(f"\n[FAIL] {len(failures)} module(s) over the import budget: {', '.join(failures)}")
+        sys.exit(1)
+    print("\nAll modules within the import budget.")
@@ -0,0 +1,65 @@
+"""
+Measure per-symbol memory of the compact bar layout against the original one.
+
+For each size, runs _format_data followed by TradingStrategy and
+StockMlModel construction, and reports the peak traced allocation and the
+bytes held by the resulting bar frame. The original path (float64 columns,
+reversed copy, dropna, df.copy() per consumer) is reproduced inline.
+
+Usage:
+python benchmarks/bench_memory.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.bars import Bars
+from modules.data_fetcher import AlphaVantageStockDataFetcher
+from modules.ml_model import StockMlModel
+from modules.strategy import TradingStrategy
+from modules.synthetic import generate_raw_alpha_vantage
+
+
+def original_pipeline(raw):
+    """
+    Reference implementation: the original _format_data and defensive copies.
+    """
+    df = raw.rename(columns=AlphaVantageStockDataFetcher.RAW_COLUMNS)
+    df = df[::-1].reset_index()
+    df.dropna(inplace=True)
+    held = (df, df.copy(), df.copy())  # TradingStrategy and StockMlModel copies
+    return df, held
+
+
+def compact_pipeline(raw):
+    fetcher = AlphaVantageStockDataFetcher(api_key="benchmark", ts=object())
+    df = fetcher._format_data(raw)
+    bars = Bars.from_frame(df)
+    held = (bars, TradingStrategy(bars), StockMlModel(bars))
+    return df, held
+
+
+def peak_mb(pipeline, raw) -> tuple:
+    """
+    Peak traced memory of one run and the bytes of the bar frame it returns.
+    """
+    tracemalloc.start()
+    df, held = pipeline(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 ** 2, df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+if __name__ == "__main__":
+    print(f"{'bars':>8} {'orig peak (MB)':>15} {'new peak (MB)':>14} "
+          f"{'orig frame (MB)':>16} {'new frame (MB)':>15}")
+
+    for n_bars in (5_000, 50_000, 500_000):
+        raw = generate_raw_alpha_vantage(n_bars, freq="15min", volatility=0.002, drift=0.0)
+        peak_mb(compact_pipeline, raw)  # warm up lazy imports and caches
+        before_peak, before_frame = peak_mb(original_pipeline, raw)
+        after_peak, after_frame = peak_mb(compact_pipeline, raw)
+        print(f"{n_bars:>8} {before_peak:>15.2f} {after_peak:>14.2f} "
+              f"{before_frame:>16.2f} {after_frame:>15.2f}")
@@ -0,0 +1,55 @@
+"""
+Benchmark headless report rendering as the history grows.
+
+Renders a full symbol report (signal and equity charts plus HTML) and the
+StockMlModel feature chart for increasingly long histories, and checks
+that LTTB keeps the extremes of the series. Render time and file size
+should stay roughly flat once the history exceeds the point budget.
+
+Usage:
+python benchmarks/bench_reporting.py [max_bars]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.ml_model import StockMlModel
+from modules.reporting import ReportWriter, lttb
+from modules.synthetic import generate_ohlcv
+
+
+if __name__ == "__main__":
+    max_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    # LTTB keeps a spike a strided downsample would step over
+    y = np.zeros(100_000)
+    y[12_345] = 1.0
+    assert 12_345 in lttb(np.arange(len(y)), y, 1_000)
+
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= max_bars]
+    with tempfile.TemporaryDirectory() as output_dir:
+        writer = ReportWriter(output_dir)
+        # Warm up matplotlib (font cache, imports) outside the timings
+        writer.symbol_report("WARMUP", generate_ohlcv(500, freq="15min"), oversold=40)
+
+        print(f"{'bars':>10} {'report':>9} {'report KB':>10} {'features':>9} {'features KB':>12}")
+        for n_bars in sizes:
+            df = generate_ohlcv(n_bars, freq="15min")
+
+            start = time.perf_counter()
+            report = writer.symbol_report(f"SYN{n_bars}", df, oversold=40)["Report"]
+            report_time = time.perf_counter() - start
+
+            model = StockMlModel(df)
+            model.engineer_features()
+            start = time.perf_counter()
+            features = model.visualize_data(output_dir=output_dir)
+            features_time = time.perf_counter() - start
+
+            print(f"{n_bars:>10} {report_time:>8.2f}s {os.path.getsize(report) / 1024:>10.0f} "
+                  f"{features_time:>8.2f}s {os.path.getsize(features) / 1024:>12.0f}")
@@ -0,0 +1,148 @@
+"""
+Check and benchmark incremental updates of BarResampler.
+
+A 5min history with gaps is streamed into a resampler in uneven chunks.
+Some chunks start inside the stored history and revise the bars they
+overlap. After every update, each memoized timeframe must equal a
+from-scratch resample of the history so far, and bars handed out before
+the update must be unchanged. At the end the timeframes must match pandas
+resample. A ResampledStockDataFetcher that ingests a revised tail must
+also leave earlier frames and Bars untouched. Then the cost of a one-bar update is timed as
+the history grows, and it should stay flat.
+
+Usage:
+python benchmarks/bench_resampler.py [n_bars]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.bars import Bars
+from modules.resampler import BarResampler, ResampledStockDataFetcher, resample_bars
+from modules.synthetic import generate_ohlcv
+
+INTERVALS = ("15min", "60min", "daily")
+OFFSET = 15
+FIELDS = ("timestamps", "open", "high", "low", "close", "volume")
+
+
+def history(n_bars: int, seed=0) -> Bars:
+    df = generate_ohlcv(n_bars, seed=seed, freq="5min", drift=0.0, volatility=0.002)
+    # Drop some bars so buckets are uneven and some are empty
+    rng = np.random.default_rng(seed)
+    df = df[rng.random(len(df)) > 0.1].reset_index(drop=True)
+    return Bars.from_frame(df, symbol="SYN")
+
+
+def assert_bars_equal(got: Bars, expected: Bars, label: str):
+    assert len(got) == len(expected), (label, len(got), len(expected))
+    for name in FIELDS:
+        np.testing.assert_array_equal(getattr(got, name), getattr(expected, name), err_msg=f"{label}: {name}")
+
+
+def revised(bars: Bars, start: int, stop: int) -> Bars:
+    """
+    bars[start:stop] with moved closes, as a refreshed compact window would bring.
+    """
+    s = slice(start, stop)
+    return Bars(bars.timestamps[s], bars.open[s], bars.high[s], bars.low[s],
+                bars.close[s] * 1.01, bars.volume[s], symbol=bars.symbol)
+
+
+def pandas_resample(bars: Bars, interval: str) -> pd.DataFrame:
+    kwargs = dict(rule="1D") if interval == "daily" else dict(rule=interval, offset=f"{OFFSET}min")
+    df = bars.to_frame().set_index("date").astype("float64")
+    out = df.resample(**kwargs).agg(
+        {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"})
+    return out[df["Close"].resample(**kwargs).count() > 0]
+
+
+def check_equivalence(n_bars: int):
+    full = history(n_bars)
+    resampler = BarResampler(revised(full, 0, 500), "5min", OFFSET)
+    for interval in INTERVALS:
+        resampler.get(interval)
+    expected = revised(full, 0, 500)
+
+    rng = np.random.default_rng(1)
+    position = 500
+    while position < len(full):
+        stop = min(len(full), position + int(rng.integers(1, 40)))
+        # Every third chunk also revises up to 30 bars already stored
+        start = position - int(rng.integers(0, 30)) if rng.random() < 1 / 3 else position
+        chunk = full if rng.random() < 0.5 else revised(full, 0, len(full))
+        update = Bars(*(getattr(chunk, name)[start:stop] for name in FIELDS), symbol="SYN")
+
+        handed_out = [resampler.base] + [resampler.get(interval) for interval in INTERVALS]
+        frozen = [Bars(*(getattr(b, name).copy() for name in FIELDS)) for b in handed_out]
+
+        assert resampler.update(update) == stop - start
+        for bars, copy in zip(handed_out, frozen):
+            assert_bars_equal(bars, copy, f"snapshot at {stop}")
+        expected = Bars(*(np.concatenate([getattr(expected, name)[:start], getattr(update, name)])
+                          for name in FIELDS), symbol="SYN")
+        assert_bars_equal(resampler.base, expected, f"base at {stop}")
+        for interval in INTERVALS:
+            assert_bars_equal(resampler.get(interval), resample_bars(expected, interval, OFFSET),
+                              f"{interval} at {stop}")
+        position = stop
+
+    for interval in INTERVALS:
+        reference = pandas_resample(expected, interval)
+        got = resampler.get(interval).to_frame().set_index("date").astype("float64")
+        pd.testing.assert_frame_equal(got, reference, check_freq=False, check_index_type=False,
+                                      check_names=False)
+
+
+class StaticFetcher:
+    def __init__(self, df):
+        self.df = df
+
+    def get_intraday_data(self, symbol, interval="5min", outputsize="compact"):
+        return self.df
+
+
+def check_fetcher_snapshots(n_bars: int):
+    df = history(n_bars).to_frame()
+    fetcher = ResampledStockDataFetcher(StaticFetcher(df), "5min", OFFSET, ttl=None)
+    frame = fetcher.get_intraday_data("SYN", "15min", outputsize="full")
+    bars = fetcher.get_bars("SYN", "5min")
+    frame_copy, bars_copy = frame.copy(), Bars(*(getattr(bars, name).copy() for name in FIELDS))
+
+    tail = df.tail(20).assign(Close=df["Close"].tail(20) * 1.01)
+    assert fetcher.ingest("SYN", tail) == 20
+    pd.testing.assert_frame_equal(frame, frame_copy)
+    assert_bars_equal(bars, bars_copy, "fetcher snapshot")
+    assert not any(getattr(bars, name).flags.writeable for name in FIELDS)
+    assert fetcher.get_bars("SYN", "5min").close[-1] == np.float32(df["Close"].iloc[-1] * 1.01)
+
+
+def update_cost(n_bars: int, repeat=200) -> float:
+    full = history(n_bars + repeat)
+    head = len(full) - repeat
+    resampler = BarResampler(Bars(*(getattr(full, name)[:head] for name in FIELDS), symbol="SYN"),
+                             "5min", OFFSET)
+    for interval in INTERVALS:
+        resampler.get(interval)
+
+    start = time.perf_counter()
+    for i in range(head, len(full)):
+        resampler.update(Bars(*(getattr(full, name)[i:i + 1] for name in FIELDS), symbol="SYN"))
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    check_equivalence(20_000)
+    check_fetcher_snapshots(5_000)
+    print("Incremental resample checks passed.")
+
+    print(f"{'base bars':>10} {'per update (us)':>16}")
+    for n in sorted({10_000, n_bars // 10, n_bars}):
+        print(f"{n:>10} {update_cost(n) * 1e6:>16.1f}")
@@ -0,0 +1,247 @@
+"""
+Check and benchmark GoogleSheetsLogger against an in-memory fake spreadsheet.
+
+The fake implements the gspread Spreadsheet calls the logger uses, records
+every call, and can fail the next calls with a given HTTP status. The
+checks cover:
+- a first two-tab run in a constant number of calls, with a 429 retried
+- a repeat run (new logger) that appends only new rows
+- a flush that runs out of retries and keeps its writes staged, then
+  succeeds on the next flush without duplicating rows
+- a replaced tab whose title has spaces, quotes and "!" cleared and
+  rewritten in place
+- a TradeLedger mirror that keeps the same trades under two parameter
+  sets apart, and that a second ledger holding the same trades adds
+  nothing to
+Then API calls and time are compared with the old clear-and-rewrite per
+symbol as the universe grows.
+
+Usage:
+python benchmarks/bench_sheets.py [n_symbols]
+"""
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.google_sheets_writer import GoogleSheetsLogger
+from modules.ledger import TradeLedger
+from modules.strategy import TradingStrategy
+from modules.synthetic import generate_universe
+
+
+class FakeResponse:
+    def __init__(self, code: int):
+        self.code = code
+        self.text = f"HTTP {code}"
+
+    def json(self):
+        return {"error": {"code": self.code, "message": self.text, "status": "FAKE"}}
+
+
+class FakeSpreadsheet:
+    """
+    In-memory stand-in for gspread.Spreadsheet: tab -> list of rows.
+    """
+
+    def __init__(self):
+        self.tabs = {}
+        self.calls = []
+        self.fail = {}  # method name -> HTTP statuses to raise on its next calls
+
+    def _record(self, name):
+        from gspread.exceptions import APIError
+
+        self.calls.append(name)
+        if self.fail.get(name):
+            raise APIError(FakeResponse(self.fail[name].pop(0)))
+
+    def fetch_sheet_metadata(self):
+        self._record("fetch_sheet_metadata")
+        return {"sheets": [
+            {"properties": {"title": title, "sheetId": i,
+                            "gridProperties": {"rowCount": tab["rows"], "columnCount": tab["cols"]}}}
+            for i, (title, tab) in enumerate(self.tabs.items())
+        ]}
+
+    def batch_update(self, body):
+        self._record("batch_update")
+        replies = []
+        for request in body["requests"]:
+            if "addSheet" in request:
+                props = request["addSheet"]["properties"]
+                grid = props["gridProperties"]
+                self.tabs[props["title"]] = {"rows": grid["rowCount"], "cols": grid["columnCount"], "values": []}
+                replies.append({"addSheet": {"properties": {**props, "sheetId": len(self.tabs) - 1}}})
+            else:
+                props = request["updateSheetProperties"]["properties"]
+                tab = list(self.tabs.values())[props["sheetId"]]
+                tab["rows"] = props["gridProperties"]["rowCount"]
+                tab["cols"] = props["gridProperties"]["columnCount"]
+                replies.append({})
+        return {"replies": replies}
+
+    def values_batch_get(self, ranges, params=None):
+        self._record("values_batch_get")
+        return {"valueRanges": [{"values": [list(r) for r in self.tabs[_tab(name)]["values"]]}
+                                for name in ranges]}
+
+    def values_batch_clear(self, body):
+        self._record("values_batch_clear")
+        for name in body["ranges"]:
+            self.tabs[_tab(name)]["values"] = []
+
+    def values_batch_update(self, body):
+        self._record("values_batch_update")
+        for item in body["data"]:
+            tab = self.tabs[_tab(item["range"])]
+            start = int(re.search(r"!A(\d+)$", item["range"]).group(1)) - 1
+            assert start + len(item["values"]) <= tab["rows"], "write past the grid"
+            values = tab["values"]
+            values.extend([[]] * max(0, start - len(values)))
+            values[start:start + len(item["values"])] = [list(r) for r in item["values"]]
+
+    def frame(self, tab) -> pd.DataFrame:
+        header, *rows = self.tabs[tab]["values"]
+        return pd.DataFrame(rows, columns=header)
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+
+    def open(self, name):
+        self.spreadsheet.calls.append("open")
+        return self.spreadsheet
+
+
+def _tab(range_name: str) -> str:
+    """
+    Tab title of an A1 range, quoted ('My Tab'!A1) or not (Summary).
+    """
+    quoted = re.fullmatch(r"'((?:[^']|'')*)'(?:!.*)?", range_name)
+    if quoted:
+        return quoted.group(1).replace("''", "'")
+    return range_name.rsplit("!", 1)[0] if "!" in range_name else range_name
+
+
+def trade_logs(frames: dict) -> dict:
+    logs = {}
+    for symbol, df in frames.items():
+        log = TradingStrategy(df, oversold=50).backtest_signals(holding_period=5)
+        log.insert(0, "Symbol", symbol)
+        logs[symbol] = log
+    return logs
+
+
+def summary_row(symbol, log) -> pd.DataFrame:
+    return pd.DataFrame({"Symbol": [symbol], "Total Trades": [len(log)],
+                         "Total P&L (₹)": [float(log["Profit ₹"].sum())]})
+
+
+def run(logger, logs: dict):
+    logger.queue_dataframe(pd.concat([summary_row(s, log) for s, log in logs.items()], ignore_index=True),
+                           "Summary", mode="replace")
+    for log in logs.values():
+        logger.queue_dataframe(log, "Trade Log", mode="append")
+    return logger.flush()
+
+
+def check_behaviour():
+    logs = trade_logs(generate_universe(2, 3_000))
+    first = {s: log.iloc[:-2] for s, log in logs.items()}
+    sheet = FakeSpreadsheet()
+
+    # First run: open, metadata, add both tabs, one write; the write gets a 429 once
+    sheet.fail = {"values_batch_update": [429]}
+    assert run(GoogleSheetsLogger("bench", client=FakeClient(sheet)), first)
+    assert sheet.calls == ["open", "fetch_sheet_metadata", "batch_update",
+                           "values_batch_update", "values_batch_update"], sheet.calls
+    expected_rows = sum(len(log) for log in first.values())
+    assert len(sheet.frame("Trade Log")) == expected_rows
+
+    # Repeat run with a new logger: one read of the append tab, only the new rows land
+    sheet.calls.clear()
+    logger = GoogleSheetsLogger("bench", client=FakeClient(sheet))
+    assert run(logger, logs)
+    assert sheet.calls == ["open", "fetch_sheet_metadata", "values_batch_get",
+                           "values_batch_clear", "values_batch_update"], sheet.calls
+    all_rows = sum(len(log) for log in logs.values())
+    assert len(sheet.frame("Trade Log")) == all_rows
+    assert len(sheet.frame("Summary")) == len(logs)
+
+    # Out of retries: flush fails and keeps the writes; the next flush lands them once
+    more = {s: pd.concat([log, log.tail(1).assign(**{"Buy Date": log["Buy Date"].iloc[-1] + pd.Timedelta(days=1)})],
+                         ignore_index=True) for s, log in logs.items()}
+    logger = GoogleSheetsLogger("bench", client=FakeClient(sheet), max_retries=1)
+    sheet.fail = {"values_batch_update": [503, 503]}
+    assert not run(logger, more)
+    assert logger._pending
+    assert logger.flush()
+    assert len(sheet.frame("Trade Log")) == all_rows + len(logs)
+    assert not sheet.frame("Trade Log").duplicated().any()
+
+
+def check_awkward_title():
+    sheet = FakeSpreadsheet()
+    title = "P&L 'daily' view!"
+    for n in (3, 2):
+        logger = GoogleSheetsLogger("bench", client=FakeClient(sheet))
+        logger.queue_dataframe(pd.DataFrame({"Symbol": [f"S{i}" for i in range(n)]}), title, mode="replace")
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert logger.flush()
+    assert list(sheet.tabs) == [title]
+    assert sheet.frame(title)["Symbol"].tolist() == ["S0", "S1"]
+
+
+def check_ledger_mirror():
+    logs = trade_logs(generate_universe(2, 3_000))
+    params = [{"oversold": 50}, {"oversold": 50, "fast_window": 10}]
+    sheet = FakeSpreadsheet()
+
+    def mirrored_by(ledger):
+        for p in params:
+            for symbol, log in logs.items():
+                ledger.record_trades(symbol, log.drop(columns="Symbol"), params=p, holding_period=5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert ledger.mirror(GoogleSheetsLogger("bench", client=FakeClient(sheet)))
+        ledger.close()
+        return sheet.frame("Trade Log")
+
+    # Same trades, two parameter sets: both mirrored
+    rows = mirrored_by(TradeLedger(":memory:"))
+    assert len(rows) == len(params) * sum(len(log) for log in logs.values())
+    assert rows["Params"].nunique() == len(params)
+
+    # Another ledger with the same trades: the rows already in the tab are recognized
+    assert len(mirrored_by(TradeLedger(":memory:"))) == len(rows)
+
+
+if __name__ == "__main__":
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    check_behaviour()
+    check_awkward_title()
+    check_ledger_mirror()
+    print("Fake-spreadsheet checks passed.")
+
+    print(f"{'symbols':>8} {'rows':>7} {'batched calls':>14} {'time (s)':>9} {'per-symbol calls':>17}")
+    for n in sorted({10, n_symbols // 4, n_symbols}):
+        logs = trade_logs(generate_universe(n, 2_000))
+        sheet = FakeSpreadsheet()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(GoogleSheetsLogger("bench", client=FakeClient(sheet)), logs)
+        elapsed = time.perf_counter() - start
+
+        # The replaced write_dataframe: open, worksheet lookup, clear and write,
+        # for each symbol's Trade Log and Summary
+        per_symbol = 4 * 2 * n
+        rows = sum(len(log) for log in logs.values())
+        print(f"{n:>8} {rows:>7} {len(sheet.calls):>14} {elapsed:>9.3f} {per_symbol:>17}")
@@ -0,0 +1,103 @@
+"""
+Benchmark the vectorized signal engine against the original per-row loop.
+
+Checks that both produce the same signal frame, then times them at
+1k, 10k and 100k bars. A random walk rarely dips below RSI 30 on the
+exact bar of a crossover, so equivalence is also checked at a looser
+threshold over several seeds, where every size produces signals.
+
+Usage:
+python benchmarks/bench_signals.py
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.strategy import TradingStrategy
+from modules.synthetic import generate_ohlcv
+
+
+def loop_signals(strategy: TradingStrategy) -> pd.DataFrame:
+    """
+    Reference implementation: the original per-row loop.
+    """
+    strategy.compute_indicators()
+    df = strategy.df
+    buy_signals = []
+
+    for i in range(1, len(df)):
+        rsi = df.loc[i, 'RSI']
+        ma20_prev = df.loc[i - 1, 'MA20']
+        ma50_prev = df.loc[i - 1, 'MA50']
+        ma20_now = df.loc[i, 'MA20']
+        ma50_now = df.loc[i, 'MA50']
+
+        if (
+            pd.notna(rsi) and pd.notna(ma20_prev) and pd.notna(ma50_prev) and
+            rsi < strategy.oversold and
+            ma20_prev < ma50_prev and ma20_now > ma50_now
+        ):
+            buy_signals.append(df.loc[i, 'date'])
+
+    signals = df[df['date'].isin(buy_signals)].copy()
+    signals['Signal'] = 'BUY'
+    return signals
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    """
+    Return the best wall-clock time of `repeat` calls to fn.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# Thresholds checked against the loop; the looser one guarantees signals
+THRESHOLDS = (30, 60)
+SEEDS = (0, 1, 2)
+
+
+def check_equivalence(n_bars: int) -> dict:
+    """
+    Compare the loop and the vectorized engine over SEEDS x THRESHOLDS.
+
+    Returns:
+    dict: Threshold -> total signals found across seeds
+    """
+    found = {}
+    for oversold in THRESHOLDS:
+        found[oversold] = 0
+        for seed in SEEDS:
+            df = generate_ohlcv(n_bars, seed=seed, freq="15min", drift=0.0, volatility=0.015)
+            expected = loop_signals(TradingStrategy(df, oversold=oversold))
+            actual = TradingStrategy(df, oversold=oversold).generate_signals()
+            pd.testing.assert_frame_equal(actual, expected)
+            found[oversold] += len(actual)
+    return found
+
+
+if __name__ == "__main__":
+    print(f"{'bars':>8} {'signals':>12} {'loop (s)':>10} {'vector (s)':>11} {'speedup':>8}")
+
+    for n_bars in (1_000, 10_000, 100_000):
+        found = check_equivalence(n_bars)
+        assert found[THRESHOLDS[-1]] > 0, f"no signals at {n_bars} bars; the check proves nothing"
+
+        df = generate_ohlcv(n_bars, freq="15min")
+        loop_time = best_of(lambda: loop_signals(TradingStrategy(df)), repeat=1)
+        vector_time = best_of(lambda: TradingStrategy(df).generate_signals())
+
+        counts = "/".join(str(found[t]) for t in THRESHOLDS)
+        print(
+            f"{n_bars:>8} {counts:>12} {loop_time:>10.4f} "
+            f"{vector_time:>11.4f} {loop_time / vector_time:>7.0f}x"
+        )
+    print(f"\nsignals: total over seeds {SEEDS} at RSI < {' / '.join(map(str, THRESHOLDS))}")
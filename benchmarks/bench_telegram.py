@@ -0,0 +1,164 @@
+"""
+Check and benchmark TelegramAlertQueue against a local mock Bot API server.
+
+The server accepts sendMessage posts, records the delivered texts and
+plays back scripted error responses. The checks cover:
+- a burst enqueued without blocking and delivered as merged messages
+- a 429 waited out for parameters.retry_after, then delivered
+- a chat that stays rate limited is given up on after max_retries, and
+  the alert queued behind it is still delivered
+- a 5xx retried, a 4xx dropped without retry
+- close() flushing what is still queued
+Then enqueue latency is compared with a blocking send per alert.
+
+Usage:
+python benchmarks/bench_telegram.py [n_alerts] [latency_ms]
+"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.telegram_notifier import MAX_MESSAGE_LENGTH, TelegramAlertQueue, TelegramNotifier
+
+
+class MockBotAPI(ThreadingHTTPServer):
+    """
+    sendMessage endpoint with scripted failures.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency=0.0):
+        super().__init__(("127.0.0.1", 0), MockHandler)
+        self.latency = latency
+        self.script = []      # (status, body) answered to the next requests, in order
+        self.delivered = []   # Texts accepted with 200
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self, script=()):
+        with self.lock:
+            self.script = list(script)
+            self.delivered = []
+            self.requests = 0
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.requests += 1
+            status, body = self.server.script.pop(0) if self.server.script else (200, {"ok": True})
+            if status == 200:
+                self.server.delivered.append(form["text"][0])
+
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def too_many_requests(retry_after):
+    return 429, {"ok": False, "error_code": 429, "description": "Too Many Requests",
+                 "parameters": {"retry_after": retry_after}}
+
+
+def delivered_after(server, queue, alerts) -> list:
+    for alert in alerts:
+        queue.send_alert(alert)
+    queue.close()
+    return server.delivered
+
+
+def check_behaviour(server, notifier):
+    def make_queue(**kwargs):
+        return TelegramAlertQueue(notifier, **{"min_interval": 0.01, "batch_window": 0.05, **kwargs})
+
+    # Burst: merged into messages under the size limit, nothing lost or reordered
+    server.reset()
+    alerts = [f"BUY SYN{i:04d}.BSE " + "x" * 300 for i in range(50)]
+    delivered = delivered_after(server, make_queue(), alerts)
+    assert all(len(m) <= MAX_MESSAGE_LENGTH for m in delivered)
+    assert "\n\n".join(delivered).split("\n\n") == alerts
+    assert len(delivered) < len(alerts) / 5
+
+    # One 429: wait out retry_after, then deliver
+    server.reset([too_many_requests(0.3)])
+    start = time.monotonic()
+    assert delivered_after(server, make_queue(), ["after 429"]) == ["after 429"]
+    assert time.monotonic() - start >= 0.3 and server.requests == 2
+
+    # Rate limited for good: give up after max_retries; the next alert still goes out
+    server.reset([too_many_requests(0.05)] * 3)
+    queue = make_queue(max_retries=3, batch_window=0.0)
+    queue.send_alert("stuck")
+    time.sleep(0.5)
+    assert delivered_after(server, queue, ["next"]) == ["next"] and server.requests == 4
+
+    # 5xx retried with backoff; 4xx dropped without a retry
+    server.reset([(500, {"ok": False})])
+    queue = make_queue(batch_window=0.0)
+    queue.send_alert("after 500")
+    time.sleep(0.2)
+    assert server.requests == 1
+    queue.close()
+    assert server.delivered == ["after 500"] and server.requests == 2
+
+    server.reset([(400, {"ok": False, "description": "Bad Request"})])
+    assert delivered_after(server, make_queue(), ["rejected"]) == [] and server.requests == 1
+
+
+if __name__ == "__main__":
+    n_alerts = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+
+    server = MockBotAPI()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    notifier = TelegramNotifier(token="bench", chat_id="1", api_base=server.url)
+
+    check_behaviour(server, notifier)
+    print("Mock Bot API checks passed.")
+
+    server.latency = latency
+    alerts = [f"BUY SYN{i:04d}.BSE at 101.25, RSI 27.4" for i in range(n_alerts)]
+
+    server.reset()
+    start = time.perf_counter()
+    for alert in alerts:
+        notifier.send_alert(alert)
+    blocking = time.perf_counter() - start
+    assert len(server.delivered) == n_alerts
+
+    server.reset()
+    queue = TelegramAlertQueue(notifier, min_interval=0.01, batch_window=0.05)
+    start = time.perf_counter()
+    for alert in alerts:
+        queue.send_alert(alert)
+    enqueue = time.perf_counter() - start
+    queue.close()
+    total = time.perf_counter() - start
+    assert "\n\n".join(server.delivered).split("\n\n") == alerts
+
+    print(f"{n_alerts} alerts, {latency * 1000:.0f} ms per request")
+    print(f"blocking send_alert:  {blocking:.3f}s in the caller, {n_alerts} messages")
+    print(f"TelegramAlertQueue:   {enqueue * 1000:.2f}ms in the caller, "
+          f"{len(server.delivered)} messages, delivered after {total:.3f}s")
+    server.shutdown()
@@ -0,0 +1,80 @@
+"""
+Benchmark UniverseBacktester scaling across CPU cores.
+
+First checks that a universe mixing float64 and compact float32 bars, and
+different datetime units, gives the same trades through the pool as one
+TradingStrategy per symbol. Then runs the same synthetic universe serially
+and through the process pool with 1, 2, 4, ... workers, reporting speedup
+and parallel efficiency.
+
+Usage:
+python benchmarks/bench_universe.py [n_symbols] [n_bars]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.bars import compact_bars
+from modules.strategy import TradingStrategy
+from modules.synthetic import generate_universe
+from modules.universe_runner import UniverseBacktester
+
+
+def serial_run(frames: dict, holding_period=5) -> pd.DataFrame:
+    """
+    Baseline: the per-symbol Python loop the runner replaces.
+    """
+    logs = []
+    for symbol, df in frames.items():
+        log = TradingStrategy(df).backtest_signals(holding_period=holding_period)
+        if not log.empty:
+            log.insert(0, "Symbol", symbol)
+            logs.append(log)
+    return pd.concat(logs, ignore_index=True) if logs else pd.DataFrame()
+
+
+def check_mixed_dtypes():
+    frames = generate_universe(12, 2_000)
+    for i, symbol in enumerate(frames):
+        if i % 2:
+            frames[symbol] = compact_bars(frames[symbol])
+        if i % 3 == 0:
+            frames[symbol] = frames[symbol].assign(date=frames[symbol]['date'].astype('datetime64[s]'))
+    assert any(df['Close'].dtype == np.float32 for df in frames.values())
+    pd.testing.assert_frame_equal(UniverseBacktester(frames, max_workers=2).run(), serial_run(frames),
+                                  check_exact=True)
+
+
+if __name__ == "__main__":
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    n_bars = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+
+    check_mixed_dtypes()
+    print("Mixed-dtype universe matches the per-symbol loop.")
+
+    frames = generate_universe(n_symbols, n_bars)
+
+    start = time.perf_counter()
+    expected = serial_run(frames)
+    serial_time = time.perf_counter() - start
+    print(f"{n_symbols} symbols x {n_bars} bars, serial loop: {serial_time:.2f}s")
+
+    cores = os.cpu_count() or 1
+    workers = sorted({1, cores} | {2 ** k for k in range(cores.bit_length()) if 2 ** k <= cores})
+
+    print(f"{'workers':>8} {'time (s)':>9} {'speedup':>8} {'efficiency':>11}")
+    base_time = None
+    for n_workers in workers:
+        start = time.perf_counter()
+        trades = UniverseBacktester(frames, max_workers=n_workers).run()
+        elapsed = time.perf_counter() - start
+        base_time = base_time or elapsed
+
+        pd.testing.assert_frame_equal(trades, expected)
+        speedup = base_time / elapsed
+        print(f"{n_workers:>8} {elapsed:>9.2f} {speedup:>7.2f}x {speedup / n_workers:>10.0%}")
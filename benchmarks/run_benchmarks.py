@@ -0,0 +1,159 @@
+"""
+Benchmark every pipeline stage on seeded synthetic data.
+
+Times and measures peak traced memory for _format_data, compute_indicators,
+generate_signals, backtest_signals, engineer_features and train_and_evaluate
+at several data sizes, then appends the run to benchmarks/history.json and
+flags stages that got slower than the previous run. Each stage is timed on
+its own: generate_signals excludes the compute_indicators it calls.
+
+history.json holds machine-specific timings, so it is git-ignored.
+
+Usage:
+python benchmarks/run_benchmarks.py [--sizes 1000 10000 100000] [--repeat 3]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.data_fetcher import AlphaVantageStockDataFetcher
+from modules.ml_model import StockMlModel
+from modules.strategy import TradingStrategy, buy_signal_mask
+from modules.synthetic import generate_ohlcv, generate_raw_alpha_vantage
+
+HISTORY_PATH = os.path.join(os.path.dirname(__file__), "history.json")
+
+# Slowdown versus the previous run that gets reported as a regression
+REGRESSION_THRESHOLD = 0.20
+
+
+def stage_functions(n_bars: int, seed: int) -> dict:
+    """
+    Build (setup, run) pairs for each stage. setup() is untimed and returns
+    the argument passed to run().
+    """
+    fetcher = AlphaVantageStockDataFetcher(api_key="benchmark", ts=object())
+    bars = generate_ohlcv(n_bars, seed=seed, freq="15min")
+    raw = generate_raw_alpha_vantage(n_bars, seed=seed, freq="15min")
+
+    def engineered_model():
+        model = StockMlModel(bars)
+        model.engineer_features()
+        return model
+
+    def indicators_done():
+        strategy = TradingStrategy(bars)
+        strategy.compute_indicators()
+        return strategy
+
+    def signals_only(strategy):
+        # generate_signals() minus its compute_indicators() call, which is
+        # already its own stage
+        df = strategy.df
+        mask = buy_signal_mask(df['RSI'].to_numpy(dtype=float), df[strategy.fast_col].to_numpy(dtype=float),
+                               df[strategy.slow_col].to_numpy(dtype=float), oversold=strategy.oversold)
+        df[mask].assign(Signal='BUY')
+
+    return {
+        "_format_data": (lambda: raw.copy(), fetcher._format_data),
+        "compute_indicators": (lambda: TradingStrategy(bars), lambda s: s.compute_indicators()),
+        "generate_signals": (indicators_done, signals_only),
+        "backtest_signals": (lambda: TradingStrategy(bars), lambda s: s.backtest_signals(holding_period=5)),
+        "engineer_features": (lambda: StockMlModel(bars), lambda m: m.engineer_features()),
+        "train_and_evaluate": (engineered_model, lambda m: m.train_and_evaluate()),
+    }
+
+
+def measure(setup, run, repeat: int) -> dict:
+    """
+    Best-of-`repeat` wall time, plus peak traced memory from one extra run.
+    """
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        times.append(time.perf_counter() - start)
+
+    arg = setup()
+    tracemalloc.start()
+    run(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": min(times), "peak_mb": peak / 1024 ** 2}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def load_history() -> list:
+    try:
+        with open(HISTORY_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def report_regressions(previous: dict, results: list):
+    """
+    Print stages that are more than REGRESSION_THRESHOLD slower than last time.
+    """
+    baseline = {(r["stage"], r["bars"]): r["seconds"] for r in previous["results"]}
+    for r in results:
+        before = baseline.get((r["stage"], r["bars"]))
+        if before and r["seconds"] > before * (1 + REGRESSION_THRESHOLD):
+            print(f"[REGRESSION] {r['stage']} @ {r['bars']} bars: "
+                  f"{before:.4f}s -> {r['seconds']:.4f}s (vs {previous['commit']})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-save", action="store_true", help="Do not append to history.json")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'stage':<20} {'bars':>8} {'time (s)':>10} {'peak (MB)':>10}")
+    for n_bars in args.sizes:
+        for stage, (setup, run) in stage_functions(n_bars, args.seed).items():
+            # Stages print progress; keep the report readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats = measure(setup, run, args.repeat)
+            results.append({"stage": stage, "bars": n_bars, **stats})
+            print(f"{stage:<20} {n_bars:>8} {stats['seconds']:>10.4f} {stats['peak_mb']:>10.1f}")
+
+    history = load_history()
+    if history:
+        report_regressions(history[-1], results)
+
+    if not args.no_save:
+        history.append({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "results": results,
+        })
+        with open(HISTORY_PATH, "w") as f:
+            json.dump(history, f, indent=1)
+        print(f"\nSaved run to {HISTORY_PATH}")
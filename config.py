@@ -1,5 +0,0 @@
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Headless entry point: run the strategy on a schedule for a universe of symbols.
+
+Usage:
+python main.py --config universe.json              # run as a daemon
+python main.py --config universe.json --once daily # run one job now and exit
+"""
+import argparse
+
+from modules.data_fetcher import DataFetcherFactory
+from modules.scheduler import Checkpoint, Job, Pipeline, Scheduler, load_universe
+
+
+def build_scheduler(config: dict, fetch_workers=4) -> Scheduler:
+    fetcher = DataFetcherFactory.get_data_fetcher(config["source"], **config["source_options"])
+
+    sheets = None
+    if config.get("sheet_name"):
+        from modules.google_sheets_writer import GoogleSheetsLogger
+        sheets = GoogleSheetsLogger(sheet_name=config["sheet_name"])
+
+    notifier = None
+    if config.get("telegram"):
+        from modules.telegram_notifier import TelegramAlertQueue, TelegramNotifier
+        notifier = TelegramAlertQueue(TelegramNotifier())
+
+    ledger = None
+    if config.get("ledger"):
+        from modules.ledger import TradeLedger
+        ledger = TradeLedger(config["ledger"])
+
+    pipeline = Pipeline(
+        fetcher,
+        sheets=sheets,
+        notifier=notifier,
+        checkpoint=Checkpoint(config["checkpoint"]),
+        holding_period=config["holding_period"],
+        strategy_params=config["strategy"],
+        fetch_workers=fetch_workers,
+        ledger=ledger,
+    )
+    jobs = [Job.from_config(job) for job in config["jobs"]]
+    return Scheduler(pipeline, jobs, config["symbols"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--config", default="universe.json", help="Universe config (JSON)")
+    parser.add_argument("--once", metavar="JOB", help="Run this job immediately, then exit")
+    parser.add_argument("--fetch-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    scheduler = build_scheduler(load_universe(args.config), fetch_workers=args.fetch_workers)
+    scheduler.install_signal_handlers()
+    try:
+        if args.once:
+            jobs = {job.name: job for job in scheduler.jobs}
+            if args.once not in jobs:
+                parser.error(f"Unknown job '{args.once}'; choose from {', '.join(jobs)}")
+            print(scheduler.run_job(jobs[args.once]))
+        else:
+            scheduler.run_forever()
+    finally:
+        if scheduler.pipeline.notifier is not None:
+            scheduler.pipeline.notifier.close()
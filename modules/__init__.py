@@ -0,0 +1,8 @@
+"""
+Algo-trading building blocks: data fetchers, indicators, the RSI + MA
+strategy, backtesters, ML models and Sheets/Telegram sinks.
+
+Submodules are not imported here, so `import modules.strategy` loads only
+what the strategy needs. Heavy optional dependencies (alpha_vantage, gspread,
+scikit-learn, matplotlib) are imported by the functions that use them.
+"""
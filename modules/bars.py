@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Prices to 7 significant digits (paise up to ₹99,999) at half the bytes of float64
+PRICE_DTYPE = np.float32
+VOLUME_DTYPE = np.int64
+
+# Rows returned for outputsize="compact", matching the Alpha Vantage API
+COMPACT_ROWS = 100
+
+
+def compact_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast an OHLCV frame to the compact dtypes: float32 prices, int64 volume.
+
+    Columns that already have the target dtype are shared, not copied.
+
+    Parameters:
+    df (pd.DataFrame): Frame with 'date', 'Open', 'High', 'Low', 'Close', 'Volume'
+
+    Returns:
+    pd.DataFrame: Frame with compact dtypes
+    """
+    dtypes = {col: PRICE_DTYPE for col in PRICE_COLUMNS if col in df.columns}
+    if 'Volume' in df.columns:
+        dtypes['Volume'] = VOLUME_DTYPE
+    return df.astype(dtypes, copy=False)
+
+
+def empty_bars() -> pd.DataFrame:
+    """
+    Zero-row OHLCV frame with the compact dtypes.
+    """
+    return compact_bars(pd.DataFrame({
+        'date': pd.Series(dtype='datetime64[ns]'),
+        **{col: pd.Series(dtype=float) for col in PRICE_COLUMNS + ['Volume']},
+    }))
+
+
+class Bars:
+    """
+    Compact, read-only OHLCV container for one symbol.
+
+    Holds one contiguous array per column: int64 epoch nanoseconds, float32
+    prices and int64 volume, oldest bar first. Arrays are marked read-only so
+    TradingStrategy, StockMlModel and other consumers can share them without
+    defensive copies.
+
+    Attributes:
+    symbol (str): Stock symbol
+    timestamps (np.ndarray): int64 nanoseconds since the epoch, ascending
+    open, high, low, close (np.ndarray): float32 prices
+    volume (np.ndarray): int64 volume
+    """
+
+    __slots__ = ('symbol', 'timestamps', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, timestamps, open, high, low, close, volume, symbol=""):
+        self.symbol = symbol
+        self.timestamps = _frozen(timestamps, np.int64)
+        self.open = _frozen(open, PRICE_DTYPE)
+        self.high = _frozen(high, PRICE_DTYPE)
+        self.low = _frozen(low, PRICE_DTYPE)
+        self.close = _frozen(close, PRICE_DTYPE)
+        self.volume = _frozen(volume, VOLUME_DTYPE)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, symbol=None) -> "Bars":
+        """
+        Build from an OHLCV frame with a 'date' column, sorted oldest first.
+
+        Columns already in the compact dtypes are viewed, not copied.
+        """
+        dates = np.asarray(df['date'], dtype='datetime64[ns]')
+        return cls(
+            dates.view(np.int64),
+            df['Open'].to_numpy(), df['High'].to_numpy(), df['Low'].to_numpy(),
+            df['Close'].to_numpy(), df['Volume'].to_numpy(),
+            symbol=df.attrs.get('symbol', '') if symbol is None else symbol,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def dates(self) -> np.ndarray:
+        """
+        Timestamps as datetime64[ns] (a view, no copy).
+        """
+        return self.timestamps.view('datetime64[ns]')
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__[1:])
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        DataFrame view over the arrays in the layout the fetchers return.
+
+        Columns wrap the read-only arrays without copying; adding columns to
+        the frame (e.g. indicators) leaves the Bars untouched.
+        """
+        df = pd.DataFrame({
+            'date': self.dates,
+            'Open': self.open,
+            'High': self.high,
+            'Low': self.low,
+            'Close': self.close,
+            'Volume': self.volume,
+        }, copy=False)
+        df.attrs['symbol'] = self.symbol
+        return df
+
+
+def _frozen(values, dtype) -> np.ndarray:
+    # A fresh view, so freezing it never touches the caller's array
+    array = np.ascontiguousarray(values, dtype=dtype).view()
+    array.flags.writeable = False
+    return array
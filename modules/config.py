@@ -0,0 +1,47 @@
+"""
+Settings read from the environment.
+
+A .env file in the working directory is loaded on first use rather than at
+import, so importing a module never touches the filesystem or the
+environment; values set in the environment take precedence over the file.
+"""
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def env(name: str, default=None):
+    """
+    Value of a setting from the environment or the .env file.
+
+    Parameters:
+    name (str): Variable name, e.g. "ALPHA_VANTAGE_API_KEY"
+    default (str, optional): Returned when the variable is not set
+
+    Returns:
+    str: The value, or `default`
+    """
+    _load_dotenv()
+    return os.getenv(name, default)
+
+
+def alpha_vantage_api_key():
+    return env("ALPHA_VANTAGE_API_KEY")
+
+
+def alpha_vantage_calls_per_minute() -> float:
+    return float(env("ALPHA_VANTAGE_CALLS_PER_MINUTE", "5"))
+
+
+def telegram_bot_token():
+    return env("TELEGRAM_BOT_TOKEN")
+
+
+def telegram_chat_id():
+    return env("TELEGRAM_CHAT_ID")
@@ -0,0 +1,254 @@
+import json
+import os
+import re
+import threading
+import time
+
+import pandas as pd
+
+from .bars import COMPACT_ROWS, compact_bars
+from .data_fetcher import StockDataFetcher
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "data_cache")
+
+
+class CachedStockDataFetcher(StockDataFetcher):
+    """
+    Disk cache in front of any StockDataFetcher.
+
+    Bars are stored as one Parquet file per symbol/interval. Fresh entries are
+    served with no network call; stale entries are topped up with a "compact"
+    fetch and merged, so the full history is only downloaded once.
+
+    Attributes:
+    fetcher (StockDataFetcher): Fetcher used on cache misses and refreshes
+    cache_dir (str): Directory holding the Parquet files and index.json
+    ttl (float): Seconds before a cached entry is considered stale
+    max_bytes (int): Size budget; least recently used entries are evicted past it
+    max_idle (float): Seconds without access after which an entry is evicted
+    """
+
+    def __init__(self, fetcher: StockDataFetcher, cache_dir=DEFAULT_CACHE_DIR,
+                 ttl=12 * 3600, max_bytes=512 * 1024 ** 2, max_idle=30 * 24 * 3600,
+                 clock=time.time):
+        """
+        Initialize the cache.
+
+        Parameters:
+        fetcher (StockDataFetcher): Underlying (network) fetcher
+        cache_dir (str): Cache directory, created if missing
+        ttl (float): Freshness window in seconds
+        max_bytes (int): Maximum total size of cached files in bytes
+        max_idle (float): Evict entries not read for this many seconds
+        clock (callable): Returns the current epoch time; injectable for tests
+        """
+        self.fetcher = fetcher
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_idle = max_idle
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(self.cache_dir, "index.json")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    def get_daily_data(self, symbol: str, outputsize='compact') -> pd.DataFrame:
+        """
+        Return daily bars for a symbol, from cache when possible.
+
+        Parameters:
+        symbol (str): Stock symbol.
+        outputsize (str, optional): "compact" (last 100) or "full"(up to 20 years).
+
+        Returns:
+        pd.DataFrame: Clean and formatted stock data
+        """
+        return self._get(
+            symbol, "daily", outputsize,
+            lambda size: self.fetcher.get_daily_data(symbol, outputsize=size),
+        )
+
+    def get_intraday_data(self, symbol: str, interval="15min", outputsize="compact"):
+        """
+        Return intraday bars for a symbol, from cache when possible.
+
+        Parameters:
+        symbol (str): Stock symbol
+        interval (str): Time interval between two consecutive data points
+        outputsize (str): "compact" (last 100) or "full"
+
+        Returns:
+        pd.DataFrame: Cleaned intraday data.
+        """
+        return self._get(
+            symbol, interval, outputsize,
+            lambda size: self.fetcher.get_intraday_data(symbol, interval=interval, outputsize=size),
+        )
+
+    def invalidate(self, symbol: str, interval="daily"):
+        """
+        Drop a cached entry so the next read goes to the network.
+        """
+        with self._lock:
+            self._remove(self._key(symbol, interval))
+            self._save_index()
+
+    def _get(self, symbol, interval, outputsize, fetch) -> pd.DataFrame:
+        """
+        Serve from cache, fetch on miss, or refresh a stale entry with a compact fetch.
+        """
+        key = self._key(symbol, interval)
+        now = self.clock()
+        want_full = outputsize == "full"
+
+        with self._lock:
+            entry = self._index.get(key)
+        cached = self._read(key) if entry else None
+
+        if cached is not None and (entry["full"] or not want_full):
+            if now - entry["fetched_at"] < self.ttl:
+                self._touch(key, now)
+                return self._window(cached, outputsize)
+
+            fresh = fetch("compact")
+            if fresh.empty:
+                print(f"[CACHE] refresh failed for {symbol} ({interval}), serving stale data")
+                self._touch(key, now)
+                return self._window(cached, outputsize)
+
+            # A compact window that starts after our last bar leaves a gap
+            if fresh['date'].iloc[0] <= cached['date'].iloc[-1]:
+                merged = self._merge(cached, fresh)
+                self._write(key, merged, entry["full"], now)
+                return self._window(merged, outputsize)
+
+        data = fetch("full" if want_full or cached is not None else outputsize)
+        if data.empty:
+            if cached is not None:
+                self._touch(key, now)
+                return self._window(cached, outputsize)
+            return data
+
+        full = want_full or cached is not None
+        if cached is not None:
+            data = self._merge(cached, data)
+        self._write(key, data, full, now)
+        return self._window(data, outputsize)
+
+    @staticmethod
+    def _merge(cached: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge new bars into cached bars; newer values win on overlapping dates.
+        """
+        merged = pd.concat([cached, fresh], ignore_index=True)
+        merged = merged.drop_duplicates(subset='date', keep='last')
+        # Entries cached before the compact layout still hold float64 columns
+        return compact_bars(merged.sort_values('date', ignore_index=True))
+
+    @staticmethod
+    def _window(df: pd.DataFrame, outputsize: str) -> pd.DataFrame:
+        """
+        Trim to the last 100 bars for "compact" requests, like the API does.
+        """
+        if outputsize == "compact":
+            return df.tail(COMPACT_ROWS).reset_index(drop=True)
+        return df
+
+    @staticmethod
+    def _key(symbol: str, interval: str) -> str:
+        """
+        Build a filesystem-safe cache key.
+        """
+        return re.sub(r"[^A-Za-z0-9._-]", "_", f"{interval}__{symbol}")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.parquet")
+
+    def _read(self, key: str):
+        """
+        Load a cached frame, or None if the file is missing or unreadable.
+        """
+        try:
+            return pd.read_parquet(self._path(key))
+        except Exception as e:
+            print(f"[CACHE] failed to read '{key}': {e}")
+            with self._lock:
+                self._remove(key)
+            return None
+
+    def _write(self, key: str, df: pd.DataFrame, full: bool, now: float):
+        """
+        Persist a frame, update the index and apply eviction.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._index[key] = {
+                "fetched_at": now,
+                "last_access": now,
+                "full": full,
+                "bytes": os.path.getsize(path),
+            }
+            self._evict(now, keep=key)
+            self._save_index()
+
+    def _touch(self, key: str, now: float):
+        with self._lock:
+            if key in self._index:
+                self._index[key]["last_access"] = now
+                self._save_index()
+
+    def _evict(self, now: float, keep: str):
+        """
+        Drop idle entries, then least recently used ones until under max_bytes.
+        """
+        for key, entry in list(self._index.items()):
+            if key != keep and now - entry["last_access"] > self.max_idle:
+                self._remove(key)
+
+        by_age = sorted(self._index, key=lambda k: self._index[k]["last_access"])
+        total = sum(entry["bytes"] for entry in self._index.values())
+        for key in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._index[key]["bytes"]
+            self._remove(key)
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+
+#Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    fetcher = CachedStockDataFetcher(DataFetcherFactory.get_data_fetcher("alpha_vantage"))
+
+    # The first call downloads full history; the second is served from disk
+    for _ in range(2):
+        df = fetcher.get_daily_data("RELIANCE.BSE", outputsize="full")
+        print(df.tail())
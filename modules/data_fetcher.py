@@ -1,14 +1,15 @@
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import importlib
+import threading
 
+import numpy as np
 import pandas as pd 
 import time
-from alpha_vantage.timeseries import TimeSeries
-from config import ALPHA_VANTAGE_API_KEY
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
+from . import config
+from .bars import PRICE_DTYPE, VOLUME_DTYPE
+from .instrumentation import metrics
+from .rate_limiter import TokenBucket, backoff_delay
 
 
 
@@ -44,6 +45,38 @@ class StockDataFetcher(ABC):
         pd.DataFrame: DataFrame containing intraday stock data
         """
         pass
+
+    def get_daily_data_batch(self, symbols, outputsize='compact', max_workers=4, as_frame=False):
+        """
+        Fetch daily data for many symbols concurrently.
+
+        Calls are spread over a thread pool; fetchers that talk to a rate-limited
+        API throttle themselves, so wall-clock time is bound by the quota rather
+        than by serial round trips.
+
+        Parameters:
+        symbols (list[str]): Stock symbols
+        outputsize (str): "compact" or "full"
+        max_workers (int): Number of concurrent requests
+        as_frame (bool): Return one long-format frame with a 'symbol' column
+            instead of a per-symbol dict
+
+        Returns:
+        dict[str, pd.DataFrame] or pd.DataFrame: Data per symbol; failed symbols
+            map to an empty frame (and are left out of the long-format frame)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            frames = pool.map(lambda s: self.get_daily_data(s, outputsize=outputsize), symbols)
+            results = dict(zip(symbols, frames))
+
+        if not as_frame:
+            return results
+
+        parts = [df.assign(symbol=symbol) for symbol, df in results.items() if not df.empty]
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
     
 class AlphaVantageStockDataFetcher(StockDataFetcher):
     """
@@ -54,15 +87,54 @@ class AlphaVantageStockDataFetcher(StockDataFetcher):
     
     """
     
-    def __init__(self, api_key=ALPHA_VANTAGE_API_KEY):
+    # One bucket per API key: the quota is per key, not per fetcher instance
+    _rate_limiters = {}
+    _rate_limiters_lock = threading.Lock()
+
+    # Raw alpha_vantage column -> bar column
+    RAW_COLUMNS = {
+        '1. open': 'Open',
+        '2. high': 'High',
+        '3. low': 'Low',
+        '4. close': 'Close',
+        '5. volume': 'Volume',
+    }
+
+    def __init__(self, api_key=None, ts=None, calls_per_minute=None, max_retries=3, base_url=None):
         """
         Intialize Alpha Vantage client.
 
         Args:
-            api_key (str): Your Alpha Vantage API Key.
+            api_key (str, optional): Your Alpha Vantage API Key; defaults to ALPHA_VANTAGE_API_KEY.
+            ts (TimeSeries, optional): Pre-built client, e.g. a stub in offline runs.
+            calls_per_minute (float, optional): Request quota of the API key;
+                defaults to ALPHA_VANTAGE_CALLS_PER_MINUTE (5).
+            max_retries (int): Retries for throttled or failed requests.
+            base_url (str, optional): Override the API endpoint for this client only,
+                e.g. "http://127.0.0.1:8000/query?" for a local fake server.
             
         """
-        self.ts = TimeSeries(key=api_key, output_format='pandas')
+        api_key = api_key or config.alpha_vantage_api_key()
+        calls_per_minute = calls_per_minute or config.alpha_vantage_calls_per_minute()
+        if ts is None:
+            # Imported here: alpha_vantage (and aiohttp) are slow to load and
+            # not needed by offline sources
+            from alpha_vantage.alphavantage import AlphaVantage
+            from alpha_vantage.timeseries import TimeSeries
+
+            ts = TimeSeries(key=api_key, output_format='pandas')
+            if base_url is not None:
+                # alpha_vantage builds URLs from the AlphaVantage class attribute;
+                # rewrite them on this client only, so other clients keep the real API
+                default_url, handle = AlphaVantage._ALPHA_VANTAGE_API_URL, ts._handle_api_call
+                ts._handle_api_call = lambda url: handle(base_url + url[len(default_url):])
+        self.ts = ts
+        self.max_retries = max_retries
+
+        with self._rate_limiters_lock:
+            if api_key not in self._rate_limiters:
+                self._rate_limiters[api_key] = TokenBucket.per_minute(calls_per_minute)
+            self.rate_limiter = self._rate_limiters[api_key]
         
     def get_daily_data(self,symbol: str, outputsize='compact') -> pd.DataFrame:
         """
@@ -76,12 +148,17 @@ class AlphaVantageStockDataFetcher(StockDataFetcher):
         pd.DataFrame: Clean and formatted stock data
         """
         
-        try:
-            data, _ = self.ts.get_daily(symbol=symbol, outputsize=outputsize)
-            return self._format_data(data)
-        except Exception as e:
-            print(f"[ERROR]  failed to fetch daily data: {e}")
-            return pd.DataFrame()
+        with metrics.span("fetch", symbol=symbol, series="daily") as span:
+            try:
+                data, _ = self._call(self.ts.get_daily, symbol=symbol, outputsize=outputsize)
+                df = self._format_data(data)
+                df.attrs['symbol'] = symbol
+                span.set(rows=len(df))
+                return df
+            except Exception as e:
+                metrics.inc("fetch_failures_total", symbol=symbol, series="daily")
+                print(f"[ERROR]  failed to fetch daily data: {e}")
+                return pd.DataFrame()
     
     def get_intraday_data(self, symbol: str, interval="15min", outputsize="compact"):
         """
@@ -94,58 +171,161 @@ class AlphaVantageStockDataFetcher(StockDataFetcher):
         Returns:
         pd.DataFrame: Cleaned intraday data.
         """
-        try:
-            data, _ = self.ts.get_intraday(symbol=symbol, interval=interval, outputsize=outputsize)
-            return self._format_data(data)
-        except Exception as e:
-            print(f"[ERROR] failed to fetch intraday data: {e}")
-            return pd.DataFrame()
+        with metrics.span("fetch", symbol=symbol, series=interval) as span:
+            try:
+                data, _ = self._call(self.ts.get_intraday, symbol=symbol, interval=interval, outputsize=outputsize)
+                df = self._format_data(data)
+                df.attrs['symbol'] = symbol
+                span.set(rows=len(df))
+                return df
+            except Exception as e:
+                metrics.inc("fetch_failures_total", symbol=symbol, series=interval)
+                print(f"[ERROR] failed to fetch intraday data: {e}")
+                return pd.DataFrame()
+
+    def _call(self, method, **kwargs):
+        """
+        Call the API through the rate limiter, retrying throttled or failed requests.
+
+        Parameters:
+        method (callable): TimeSeries method to call
+        **kwargs: Arguments for the method
+
+        Returns:
+        tuple: (data, meta_data) as returned by alpha_vantage
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            metrics.inc("alpha_vantage_api_calls_total", symbol=kwargs.get('symbol'))
+            try:
+                return method(**kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt, base=1 / self.rate_limiter.rate)
+                metrics.inc("alpha_vantage_retries_total", symbol=kwargs.get('symbol'))
+                print(f"[RETRY] {kwargs.get('symbol')}: {e} (retrying in {delay:.1f}s)")
+                time.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Network errors and quota notices are worth retrying; bad symbols are not.
+        """
+        import requests
+
+        if isinstance(error, requests.RequestException):
+            return True
+        message = str(error).lower()
+        return "call frequency" in message or "rate limit" in message
         
     def _format_data(self, df:pd.DataFrame) -> pd.DataFrame:
         """
         format columns names and sort data
 
+        The API returns newest bars first. Each column is read as an ascending
+        view and downcast to the compact bar dtypes (float32 prices, int64
+        volume) in a single copy, so no full-width intermediate frame is built.
+
         Parameters:
         df (pd.DataFrame): Raw dataFrame
 
         Returns:
-        pd.DataFrame: Cleaned DataFrame with renamed columns.
-        """
-        df.rename(columns={
-            '1. open':'Open',
-            '2. high':'High',
-            '3. low':'Low',
-            '4. close':'Close',
-            '5. volume':'Volume',   
-        }, inplace=True)
-        df = df[::-1].reset_index()
-        df.dropna(inplace=True)
-        return df
+        pd.DataFrame: Cleaned DataFrame with renamed columns, oldest bar first.
+        """
+        dates = pd.to_datetime(df.index).to_numpy()
+        # Newest-first is the norm, but don't flip a frame that is already ascending
+        order = slice(None, None, -1) if len(dates) > 1 and dates[0] > dates[-1] else slice(None)
+        dates = dates[order]
+        columns = {name: df[raw].to_numpy()[order] for raw, name in self.RAW_COLUMNS.items()}
+
+        valid = ~np.isnat(dates)
+        for values in columns.values():
+            valid &= ~pd.isna(values)
+        rows = slice(None) if valid.all() else valid
+
+        data = {'date': dates[rows]}
+        for name, values in columns.items():
+            dtype = VOLUME_DTYPE if name == 'Volume' else PRICE_DTYPE
+            data[name] = values[rows].astype(dtype)
+        return pd.DataFrame(data, copy=False)
     
 class DataFetcherFactory:
     """
     Factory class to return appropriate StcokDataFetcher.
+
+    Fetchers register themselves under a source name with the register()
+    decorator, so new sources plug in without touching the factory.
     
     Methods:
-    get_data_fetcher(source: str) -> StockDataFetcher
+    get_data_fetcher(source: str, **kwargs) -> StockDataFetcher
     """
+
+    _registry = {}
+
+    # Modules whose fetchers register on import; loaded on first unknown source
+    PLUGIN_MODULES = (".file_fetchers",)
+    _plugins_loaded = False
+    # Reentrant, so a plugin that looks up a source while importing does not deadlock
+    _plugins_lock = threading.RLock()
+
+    @classmethod
+    def register(cls, source: str):
+        """
+        Class decorator registering a StockDataFetcher under a source name.
+
+        Usage:
+        @DataFetcherFactory.register("my_source")
+        class MyFetcher(StockDataFetcher): ...
+        """
+        def decorator(fetcher_cls):
+            cls._registry[source] = fetcher_cls
+            return fetcher_cls
+        return decorator
+
+    @classmethod
+    def sources(cls) -> list:
+        """
+        Names of all registered sources.
+        """
+        cls._load_plugins()
+        return sorted(cls._registry)
     
-    @staticmethod
-    def get_data_fetcher(source: str) -> StockDataFetcher:
+    @classmethod
+    def get_data_fetcher(cls, source: str, **kwargs) -> StockDataFetcher:
         """
         Return a stock data fetcher based on source name.
 
         Parameters:
         source (str): Source name from where data is fetched
+        **kwargs: Passed to the fetcher's constructor (e.g. root="data/" for file sources)
 
         Returns:
         StockDataFetcher: Concrete fetcher data
         """
-        
-        if source == "alpha_vantage":
-            return AlphaVantageStockDataFetcher()
-        else:
+        if source not in cls._registry:
+            cls._load_plugins()
+        if source not in cls._registry:
             raise ValueError(f"No data fetcher implemented for: {source}")
+        return cls._registry[source](**kwargs)
+
+    @classmethod
+    def _load_plugins(cls):
+        """
+        Import the plugin modules once. Concurrent callers wait for the
+        import to finish; if it fails, the next call tries again.
+        """
+        if cls._plugins_loaded:
+            return
+        with cls._plugins_lock:
+            if cls._plugins_loaded:
+                return
+            for module in cls.PLUGIN_MODULES:
+                importlib.import_module(module, __package__)
+            cls._plugins_loaded = True
+
+
+DataFetcherFactory.register("alpha_vantage")(AlphaVantageStockDataFetcher)
 
 #Example usage       
 if __name__ == "__main__":
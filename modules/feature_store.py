@@ -0,0 +1,329 @@
+import glob
+import math
+import os
+import pickle
+import re
+
+import numpy as np
+import pandas as pd
+
+from .indicators import RollingMean, StreamingMACD, StreamingRSI
+
+DEFAULT_FEATURE_DIR = os.path.join(os.path.dirname(__file__), "..", "feature_store")
+
+
+class FeatureState:
+    """
+    Streaming feature computation for one symbol.
+
+    Produces the StockMlModel features (RSI, MACD, Volume) plus extras one bar
+    at a time, so new bars can be featurized without touching history.
+    """
+
+    FEATURES = ['RSI', 'MACD', 'Volume', 'Return', 'MA_Ratio']
+
+    def __init__(self, rsi_window=14, fast=12, slow=26, ma_window=20):
+        """
+        Parameters:
+        rsi_window (int): RSI lookback window
+        fast (int): MACD fast EMA span
+        slow (int): MACD slow EMA span
+        ma_window (int): Moving average window for MA_Ratio
+        """
+        self.last_date = None
+        self.last_close = math.nan
+        self._rsi = StreamingRSI(rsi_window)
+        self._macd = StreamingMACD(fast, slow)
+        self._ma = RollingMean(ma_window)
+
+    def update(self, date, close: float, volume: float) -> dict:
+        """
+        Ingest one bar and return its feature row.
+        """
+        prev_close = self.last_close
+        ma = self._ma.update(close)
+        row = {
+            "date": date,
+            "Close": close,
+            "Volume": volume,
+            "RSI": self._rsi.update(close),
+            "MACD": self._macd.update(close),
+            "Return": close / prev_close - 1,
+            "MA_Ratio": close / ma - 1,
+        }
+        self.last_date = date
+        self.last_close = close
+        return row
+
+
+class FeatureStore:
+    """
+    Symbol-partitioned, on-disk feature table for pooled model training.
+
+    Each symbol has its own directory of Parquet parts plus the pickled
+    FeatureState, so update() only featurizes bars newer than the last one
+    stored. The next-bar Target is derived at read time, which means stored
+    rows never need rewriting when a later bar arrives.
+
+    The state file also records the range of part numbers it covers, and
+    it is replaced atomically after a new part is in place. That write
+    commits the part: a crash before it leaves a part outside the range,
+    which readers ignore and the next update replaces, so rows are never
+    lost or featurized twice.
+
+    Attributes:
+    root (str): Store directory
+    """
+
+    MAX_PARTS = 16
+
+    def __init__(self, root=DEFAULT_FEATURE_DIR):
+        """
+        Parameters:
+        root (str): Store directory, created if missing
+        """
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def update(self, symbol: str, bars: pd.DataFrame) -> int:
+        """
+        Featurize and persist bars newer than the last one stored for a symbol.
+
+        Parameters:
+        symbol (str): Stock symbol
+        bars (pd.DataFrame): OHLCV frame with 'date', 'Close' and 'Volume'
+
+        Returns:
+        int: Number of new rows written
+        """
+        state, committed = self._load_state(symbol)
+        state = state or FeatureState()
+        if state.last_date is not None:
+            bars = bars[bars['date'] > state.last_date]
+        if bars.empty:
+            return 0
+
+        bars = bars.sort_values('date')
+        rows = [
+            state.update(date, close, volume)
+            for date, close, volume in zip(bars['date'], bars['Close'].to_numpy(dtype=float),
+                                           bars['Volume'].to_numpy(dtype=float))
+        ]
+        features = pd.DataFrame(rows)
+        for col in FeatureState.FEATURES + ['Close']:
+            features[col] = features[col].astype(np.float32)
+
+        os.makedirs(self._partition(symbol), exist_ok=True)
+        self._drop_uncommitted(symbol, committed)
+        first, last = committed or (0, -1)
+        _write_parquet(features, self._part_path(symbol, last + 1))
+        self._save_state(symbol, state, (first, last + 1))
+
+        if last + 2 - first > self.MAX_PARTS:
+            self.compact(symbol)
+        return len(features)
+
+    def symbols(self) -> list:
+        """
+        Symbols present in the store.
+        """
+        return sorted(
+            _unquote(name[len("symbol="):]) for name in os.listdir(self.root)
+            if name.startswith("symbol=")
+        )
+
+    def read(self, symbol: str) -> pd.DataFrame:
+        """
+        Load a symbol's feature rows with the next-bar Target.
+
+        Returns:
+        pd.DataFrame: Features, 'Target' (1 if next Close is higher) and
+            'symbol'; the last bar has no target yet and is NaN
+        """
+        parts = self._parts(symbol, self._load_state(symbol)[1])
+        if not parts:
+            return pd.DataFrame()
+
+        df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        next_close = df['Close'].shift(-1)
+        df['Target'] = (next_close > df['Close']).astype(np.float32).where(next_close.notna())
+        df['symbol'] = symbol
+        return df
+
+    def read_all(self, symbols=None) -> pd.DataFrame:
+        """
+        Long-format feature table for several symbols. Loads everything into
+        memory; prefer iter_batches() for large universes.
+        """
+        frames = [self.read(symbol) for symbol in (symbols or self.symbols())]
+        frames = [df for df in frames if not df.empty]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def iter_batches(self, symbols=None, features=None, shuffle=True, seed=42):
+        """
+        Yield training batches one symbol partition at a time.
+
+        Parameters:
+        symbols (list[str], optional): Symbols to include; defaults to all
+        features (list[str], optional): Feature columns; defaults to FeatureState.FEATURES
+        shuffle (bool): Randomize symbol order
+        seed (int): Seed for the symbol order
+
+        Yields:
+        tuple[np.ndarray, np.ndarray]: float32 features and int8 targets with
+            warm-up and unlabeled rows removed
+        """
+        features = features or FeatureState.FEATURES
+        symbols = list(symbols or self.symbols())
+        if shuffle:
+            np.random.default_rng(seed).shuffle(symbols)
+
+        for symbol in symbols:
+            df = self.read(symbol)
+            if df.empty:
+                continue
+            X = df[features].to_numpy(dtype=np.float32)
+            y = df['Target'].to_numpy()
+            valid = np.isfinite(X).all(axis=1) & ~np.isnan(y)
+            if valid.any():
+                yield np.ascontiguousarray(X[valid]), y[valid].astype(np.int8)
+
+    def train_pooled(self, estimator=None, symbols=None, features=None, epochs=3):
+        """
+        Train one model across the universe with bounded memory.
+
+        A first pass fits a StandardScaler incrementally; each epoch then
+        streams the partitions through the estimator's partial_fit.
+
+        Parameters:
+        estimator: partial_fit-capable classifier; defaults to SGD logistic regression
+        symbols (list[str], optional): Symbols to train on; defaults to all
+        features (list[str], optional): Feature columns
+        epochs (int): Passes over the data
+
+        Returns:
+        sklearn.pipeline.Pipeline: Fitted scaler + estimator, usable with predict/predict_proba
+        """
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import StandardScaler
+
+        estimator = estimator or SGDClassifier(loss="log_loss", alpha=1e-4, random_state=42)
+        scaler = StandardScaler()
+
+        seen = 0
+        for X, _ in self.iter_batches(symbols, features, shuffle=False):
+            scaler.partial_fit(X)
+            seen += len(X)
+        if not seen:
+            raise ValueError("No labeled feature rows to train on.")
+
+        for epoch in range(epochs):
+            for X, y in self.iter_batches(symbols, features, seed=epoch):
+                estimator.partial_fit(scaler.transform(X), y, classes=np.array([0, 1]))
+
+        print(f"Trained on {seen} rows x {epochs} epochs")
+        return Pipeline([("scaler", scaler), ("model", estimator)])
+
+    def compact(self, symbol: str):
+        """
+        Merge a symbol's parts into a single Parquet file.
+
+        The merged part gets the next number and is committed with the state
+        before the old parts are removed, so a crash at any point leaves
+        either the old parts or the merged one in effect.
+        """
+        state, committed = self._load_state(symbol)
+        parts = self._parts(symbol, committed)
+        if len(parts) < 2:
+            return
+        df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        merged = committed[1] + 1
+        _write_parquet(df, self._part_path(symbol, merged))
+        self._save_state(symbol, state, (merged, merged))
+        self._drop_uncommitted(symbol, (merged, merged))
+
+    def _partition(self, symbol: str) -> str:
+        return os.path.join(self.root, f"symbol={_quote(symbol)}")
+
+    def _part_path(self, symbol: str, number: int) -> str:
+        return os.path.join(self._partition(symbol), f"part-{number:05d}.parquet")
+
+    def _numbered_parts(self, symbol: str) -> list:
+        """
+        (number, path) of every part file on disk, committed or not, in order.
+        """
+        paths = glob.glob(os.path.join(self._partition(symbol), "part-*.parquet"))
+        return sorted((int(re.search(r"part-(\d+)\.parquet$", p).group(1)), p) for p in paths)
+
+    def _parts(self, symbol: str, committed) -> list:
+        """
+        Paths of the parts in the committed (first, last) range, in order.
+        """
+        if committed is None:
+            return []
+        first, last = committed
+        return [p for n, p in self._numbered_parts(symbol) if first <= n <= last]
+
+    def _drop_uncommitted(self, symbol: str, committed):
+        first, last = committed or (0, -1)
+        for n, p in self._numbered_parts(symbol):
+            if not first <= n <= last:
+                os.remove(p)
+
+    def _load_state(self, symbol: str) -> tuple:
+        """
+        The symbol's FeatureState and committed (first, last) part range,
+        or (None, None) if nothing has been stored yet.
+        """
+        try:
+            with open(os.path.join(self._partition(symbol), "state.pkl"), "rb") as f:
+                saved = pickle.load(f)
+        except FileNotFoundError:
+            return None, None
+        if isinstance(saved, FeatureState):
+            # Written before the part range was recorded: every part is committed
+            numbers = [n for n, _ in self._numbered_parts(symbol)]
+            return saved, (numbers[0], numbers[-1]) if numbers else (0, -1)
+        return saved["state"], saved["parts"]
+
+    def _save_state(self, symbol: str, state: FeatureState, parts: tuple):
+        path = os.path.join(self._partition(symbol), "state.pkl")
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump({"state": state, "parts": parts}, f)
+        os.replace(f"{path}.tmp", path)
+
+
+def _write_parquet(df: pd.DataFrame, path: str):
+    """
+    Write a Parquet file under a temporary name and move it into place, so
+    a crash never leaves a truncated part.
+    """
+    df.to_parquet(f"{path}.tmp", index=False)
+    os.replace(f"{path}.tmp", path)
+
+
+def _quote(symbol: str) -> str:
+    """
+    Make a symbol safe as a directory name, reversibly.
+    """
+    return re.sub(r"[^A-Za-z0-9._-]", lambda m: f"%{ord(m.group()):02X}", symbol)
+
+
+def _unquote(name: str) -> str:
+    return re.sub(r"%([0-9A-F]{2})", lambda m: chr(int(m.group(1), 16)), name)
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    symbols = ["RELIANCE.BSE", "TCS.BSE", "INFY.BSE"]
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+
+    store = FeatureStore()
+    for symbol, df in fetcher.get_daily_data_batch(symbols, outputsize="full").items():
+        print(f"{symbol}: {store.update(symbol, df)} new rows")
+
+    model = store.train_pooled()
+    print(model)
@@ -0,0 +1,347 @@
+import os
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from .bars import COMPACT_ROWS, PRICE_DTYPE, VOLUME_DTYPE, Bars, compact_bars, empty_bars
+from .data_fetcher import DataFetcherFactory, StockDataFetcher
+from .instrumentation import metrics
+
+# Accepted column spellings -> bar column (covers Alpha Vantage CSV downloads)
+COLUMN_ALIASES = {
+    'date': 'date', 'timestamp': 'date', 'datetime': 'date',
+    'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close', 'volume': 'Volume',
+}
+
+# On-disk record of the memory-mapped bar store: 32 bytes per bar
+BAR_RECORD = np.dtype([
+    ('ts', '<i8'),
+    ('open', PRICE_DTYPE),
+    ('high', PRICE_DTYPE),
+    ('low', PRICE_DTYPE),
+    ('close', PRICE_DTYPE),
+    ('volume', VOLUME_DTYPE),
+])
+
+
+class LocalStockDataFetcher(StockDataFetcher):
+    """
+    Abstract base class for fetchers serving bulk-downloaded history from disk.
+
+    Files live under root/<interval>/, with "daily" for daily bars. All
+    methods accept optional start/end bounds (inclusive) that subclasses
+    push down to the storage layer, so only the needed rows are read.
+
+    Attributes:
+    root (str): Data directory
+    """
+
+    def __init__(self, root: str):
+        """
+        Parameters:
+        root (str): Data directory
+        """
+        self.root = os.path.abspath(root)
+
+    def get_daily_data(self, symbol: str, outputsize='compact', start=None, end=None) -> pd.DataFrame:
+        """
+        Load daily bars for a symbol.
+
+        Parameters:
+        symbol (str): Stock symbol
+        outputsize (str): "compact" (last 100 bars in range) or "full"
+        start, end (str or datetime, optional): Inclusive date bounds
+
+        Returns:
+        pd.DataFrame: Compact OHLCV frame, oldest first; empty if the symbol is unknown
+        """
+        return self._get(symbol, "daily", outputsize, start, end)
+
+    def get_intraday_data(self, symbol: str, interval="15min", outputsize="compact",
+                          start=None, end=None) -> pd.DataFrame:
+        """
+        Load intraday bars for a symbol; see get_daily_data.
+        """
+        return self._get(symbol, interval, outputsize, start, end)
+
+    def _get(self, symbol, interval, outputsize, start, end) -> pd.DataFrame:
+        with metrics.span("fetch", symbol=symbol, series=interval) as span:
+            try:
+                df = self._load(symbol, interval, _timestamp(start), _timestamp(end))
+            except FileNotFoundError:
+                metrics.inc("fetch_failures_total", symbol=symbol, series=interval)
+                print(f"[ERROR] no {interval} data for {symbol} under {self.root}")
+                return pd.DataFrame()
+
+            if outputsize == "compact":
+                df = df.tail(COMPACT_ROWS).reset_index(drop=True)
+            df.attrs['symbol'] = symbol
+            span.set(rows=len(df))
+            return df
+
+    @abstractmethod
+    def _load(self, symbol, interval, start, end) -> pd.DataFrame:
+        """
+        Read bars in [start, end] (None = unbounded), raising FileNotFoundError if absent.
+        """
+        pass
+
+
+@DataFetcherFactory.register("csv")
+class CsvStockDataFetcher(LocalStockDataFetcher):
+    """
+    Serves bars from root/<interval>/<symbol>.csv.
+
+    Files must be sorted by date (either direction). The file is read in
+    chunks; chunks before `start` are dropped as they stream past and
+    reading stops at the first chunk beyond `end`.
+    """
+
+    def __init__(self, root: str, chunksize=50_000):
+        """
+        Parameters:
+        root (str): Data directory
+        chunksize (int): Rows parsed per chunk
+        """
+        super().__init__(root)
+        self.chunksize = chunksize
+
+    def _load(self, symbol, interval, start, end) -> pd.DataFrame:
+        path = os.path.join(self.root, interval, f"{symbol}.csv")
+        chunks = []
+        ascending = None
+        for chunk in pd.read_csv(path, chunksize=self.chunksize):
+            chunk = _normalize(chunk)
+            if chunk.empty:
+                continue
+            if ascending is None:
+                ascending = chunk['date'].iloc[0] <= chunk['date'].iloc[-1]
+
+            first, last = chunk['date'].min(), chunk['date'].max()
+            if start is not None and last < start:
+                if ascending:
+                    continue
+                break
+            if end is not None and first > end:
+                if ascending:
+                    break
+                continue
+            chunks.append(chunk[_in_range(chunk['date'], start, end)])
+
+        if not chunks:
+            return empty_bars()
+        df = pd.concat(chunks, ignore_index=True)
+        return compact_bars(df.sort_values('date', ignore_index=True))
+
+
+@DataFetcherFactory.register("parquet")
+class ParquetStockDataFetcher(LocalStockDataFetcher):
+    """
+    Serves bars from root/<interval>/<symbol>.parquet.
+
+    Date bounds become Parquet filters, so row groups outside the range are
+    skipped using their min/max statistics without being decoded.
+    """
+
+    def _load(self, symbol, interval, start, end) -> pd.DataFrame:
+        path = os.path.join(self.root, interval, f"{symbol}.parquet")
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        date_column = self._date_column(path)
+        filters = []
+        if start is not None:
+            filters.append((date_column, '>=', start))
+        if end is not None:
+            filters.append((date_column, '<=', end))
+
+        df = pd.read_parquet(path, filters=filters or None)
+        df = _normalize(df)
+        return compact_bars(df.sort_values('date', ignore_index=True))
+
+    @staticmethod
+    def _date_column(path: str) -> str:
+        import pyarrow.parquet as pq
+
+        for name in pq.read_schema(path).names:
+            if COLUMN_ALIASES.get(name.lower()) == 'date':
+                return name
+        raise ValueError(f"No date column in {path}")
+
+
+@DataFetcherFactory.register("mmap")
+class MmapStockDataFetcher(LocalStockDataFetcher):
+    """
+    Serves bars from a BarStore: fixed-width binary records, memory-mapped.
+
+    Loading is an mmap, two binary searches on the timestamp column and a
+    copy of only the rows in range; nothing is parsed.
+    """
+
+    def __init__(self, root: str):
+        super().__init__(root)
+        self.store = BarStore(root)
+
+    def _load(self, symbol, interval, start, end) -> pd.DataFrame:
+        return self.store.read(symbol, interval, start, end).to_frame()
+
+
+class BarStore:
+    """
+    Append-friendly binary bar files, one per (interval, symbol).
+
+    Each file is a flat array of BAR_RECORD, sorted by timestamp, at
+    root/<interval>/<symbol>.bars.
+
+    Attributes:
+    root (str): Store directory
+    """
+
+    def __init__(self, root: str):
+        """
+        Parameters:
+        root (str): Store directory
+        """
+        self.root = os.path.abspath(root)
+
+    def path(self, symbol: str, interval="daily") -> str:
+        return os.path.join(self.root, interval, f"{symbol}.bars")
+
+    def records(self, symbol: str, interval="daily") -> np.ndarray:
+        """
+        Memory-mapped records for a symbol (read-only, nothing loaded yet).
+        """
+        path = self.path(symbol, interval)
+        if os.path.getsize(path) % BAR_RECORD.itemsize:
+            raise ValueError(f"Truncated bar file: {path}")
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=BAR_RECORD)
+        return np.memmap(path, dtype=BAR_RECORD, mode='r')
+
+    def read(self, symbol: str, interval="daily", start=None, end=None) -> Bars:
+        """
+        Bars in [start, end] (inclusive, None = unbounded).
+
+        Raises:
+        FileNotFoundError: If the symbol has no file
+        """
+        records = self.records(symbol, interval)
+        ts = records['ts']
+        lo = 0 if start is None else int(np.searchsorted(ts, _epoch_ns(start), side='left'))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, _epoch_ns(end), side='right'))
+
+        rows = records[lo:hi]
+        return Bars(rows['ts'], rows['open'], rows['high'], rows['low'],
+                    rows['close'], rows['volume'], symbol=symbol)
+
+    def write(self, symbol: str, df: pd.DataFrame, interval="daily") -> int:
+        """
+        Add bars for a symbol. Bars after the last stored one are appended in
+        place; anything else triggers a merge and rewrite (new values win).
+
+        Parameters:
+        symbol (str): Stock symbol
+        df (pd.DataFrame): OHLCV frame with a 'date' column
+
+        Returns:
+        int: Number of records written
+        """
+        new = _to_records(df)
+        path = self.path(symbol, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        try:
+            existing = self.records(symbol, interval)
+        except FileNotFoundError:
+            existing = np.empty(0, dtype=BAR_RECORD)
+
+        if not len(new):
+            return 0
+        if not len(existing) or new['ts'][0] > existing['ts'][-1]:
+            with open(path, 'ab') as f:
+                new.tofile(f)
+            return len(new)
+
+        merged = np.concatenate([existing, new])
+        # Stable sort on the reversed array keeps the newest duplicate first
+        merged = merged[::-1][np.argsort(merged['ts'][::-1], kind='stable')]
+        keep = np.ones(len(merged), dtype=bool)
+        keep[1:] = merged['ts'][1:] != merged['ts'][:-1]
+        merged = merged[keep]
+        del existing
+
+        with open(f"{path}.tmp", 'wb') as f:
+            merged.tofile(f)
+        os.replace(f"{path}.tmp", path)
+        return len(new)
+
+    def import_from(self, fetcher: StockDataFetcher, symbols, interval="daily") -> dict:
+        """
+        Copy full history for several symbols from another fetcher into the store.
+
+        Returns:
+        dict[str, int]: Records written per symbol
+        """
+        written = {}
+        for symbol in symbols:
+            if interval == "daily":
+                df = fetcher.get_daily_data(symbol, outputsize="full")
+            else:
+                df = fetcher.get_intraday_data(symbol, interval=interval, outputsize="full")
+            written[symbol] = self.write(symbol, df, interval) if not df.empty else 0
+        return written
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Map known column spellings to the bar layout and parse dates.
+    """
+    df = df.rename(columns=lambda c: COLUMN_ALIASES.get(str(c).lower(), c))
+    df = df[['date', 'Open', 'High', 'Low', 'Close', 'Volume']].dropna()
+    df['date'] = pd.to_datetime(df['date'])
+    return df
+
+
+def _in_range(dates: pd.Series, start, end) -> pd.Series:
+    mask = pd.Series(True, index=dates.index)
+    if start is not None:
+        mask &= dates >= start
+    if end is not None:
+        mask &= dates <= end
+    return mask
+
+
+def _timestamp(value):
+    return None if value is None else pd.Timestamp(value)
+
+
+def _epoch_ns(value) -> int:
+    return pd.Timestamp(value).as_unit('ns').value
+
+
+def _to_records(df: pd.DataFrame) -> np.ndarray:
+    df = df.sort_values('date')
+    records = np.empty(len(df), dtype=BAR_RECORD)
+    records['ts'] = np.asarray(df['date'], dtype='datetime64[ns]').view(np.int64)
+    records['open'] = df['Open'].to_numpy()
+    records['high'] = df['High'].to_numpy()
+    records['low'] = df['Low'].to_numpy()
+    records['close'] = df['Close'].to_numpy()
+    records['volume'] = df['Volume'].to_numpy()
+    return records
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+
+    # python -m modules.file_fetchers <csv_dir> <store_dir> SYMBOL [SYMBOL ...]
+    csv_dir, store_dir, *symbols = sys.argv[1:]
+
+    csv_fetcher = DataFetcherFactory.get_data_fetcher("csv", root=csv_dir)
+    print(BarStore(store_dir).import_from(csv_fetcher, symbols))
+
+    fetcher = DataFetcherFactory.get_data_fetcher("mmap", root=store_dir)
+    for symbol in symbols:
+        print(fetcher.get_daily_data(symbol, outputsize="full", start="2015-01-01").head())
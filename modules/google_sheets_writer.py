@@ -1,26 +1,43 @@
-import gspread
-from gspread_dataframe import set_with_dataframe
-from oauth2client.service_account import ServiceAccountCredentials
+import numpy as np
 import pandas as pd 
 import os
+import time
+
+from .instrumentation import metrics
+from .rate_limiter import backoff_delay
 
-from strategy import TradingStrategy
 
 class GoogleSheetsLogger:
     """
     A class to handle logging data to Google Sheets using gspread.
+
+    Writes are staged per tab with queue_dataframe() and sent by flush() as one
+    batched request, so a run costs a constant number of API calls no matter
+    how many symbols or tabs it touches. Spreadsheet and tab metadata are
+    cached after the first flush.
     """
     
-    def __init__(self, sheet_name:str):
+    # HTTP statuses worth retrying: quota exhaustion and transient server errors
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, sheet_name:str, client=None, max_retries=5):
         """
         Intialize Google Sheets client and open the target spreadsheet
 
         Parameters:
         sheet_name (str): Name of the Google Spreadsheet
+        client (gspread.Client, optional): Pre-authorized client, e.g. a fake in tests
+        max_retries (int): Retries for quota and transient server errors
         """
         
         self.sheet_name = sheet_name
-        self.client = self._authorize()
+        self.client = client if client is not None else self._authorize()
+        self.max_retries = max_retries
+
+        self._spreadsheet = None
+        self._sheets = None    # title -> {"rows": int, "cols": int}
+        self._contents = {}    # title -> (header, key columns, set of row keys, rows used)
+        self._pending = {}     # title -> staged write
         
     def _authorize(self):
         """
@@ -38,11 +55,24 @@ class GoogleSheetsLogger:
         creds_path = os.path.join(os.path.dirname(__file__), "..", "credentials.json")
         
         try:
+            # gspread and oauth2client load only when a real client is needed
+            import gspread
+            from oauth2client.service_account import ServiceAccountCredentials
+
             creds = ServiceAccountCredentials.from_json_keyfile_name(creds_path, scope)
             return gspread.authorize(creds)
         except Exception as e:
             print(f"failed to open spreadsheet '{self.sheet_name}':{e}")
             raise
+
+    @property
+    def spreadsheet(self):
+        """
+        Spreadsheet handle, opened (one Drive lookup) on first use only.
+        """
+        if self._spreadsheet is None:
+            self._spreadsheet = self._call(self.client.open, self.sheet_name)
+        return self._spreadsheet
         
     def write_dataframe(self, df: pd.DataFrame, tab_name: str):
         """
@@ -52,31 +82,249 @@ class GoogleSheetsLogger:
         df (pd.DataFrame): DataFrame to write
         tab_name (str): Name of the sheet tab to write to
         """
+        self.queue_dataframe(df, tab_name, mode="replace")
+        self.flush()
+
+    def queue_dataframe(self, df: pd.DataFrame, tab_name: str, mode="append", key_columns=None):
+        """
+        Stage a DataFrame for the next flush().
+
+        Parameters:
+        df (pd.DataFrame): Rows to write
+        tab_name (str): Name of the sheet tab to write to
+        mode (str): "append" adds only rows not already in the tab;
+            "replace" overwrites the tab
+        key_columns (list[str], optional): Columns identifying a row in append
+            mode; defaults to all columns
+        """
+        if mode not in ("append", "replace"):
+            raise ValueError(f"Unknown write mode: {mode}")
+
+        pending = self._pending.get(tab_name)
+        if mode == "replace" or pending is None:
+            self._pending[tab_name] = {"mode": mode, "frames": [df], "key_columns": key_columns}
+        else:
+            pending["frames"].append(df)
+
+    def flush(self):
+        """
+        Send all staged writes as one batched request.
+
+        Costs at most: metadata fetch (first flush only), one batch_update to
+        create/grow tabs, one read of append tabs not seen before, one clear of
+        replaced tabs, and one values_batch_update.
+
+        On failure the writes stay staged for the next flush (appends skip
+        rows already in the tab, so a partial write is not duplicated).
+
+        Returns:
+        bool: False if the write failed
+        """
+        if not self._pending:
+            return True
+
+        pending, self._pending = self._pending, {}
         try:
-            spreadsheet = self.client.open(self.sheet_name)
+            with metrics.span("sheets_flush", sheet=self.sheet_name) as span:
+                span.set(rows=self._flush(pending))
         except Exception as e:
-            print(f"Failed to open spreadsheet '{self.sheet_name}': {e}")
+            # Cached tab state may no longer match the sheet; re-read it next time
+            self._sheets, self._contents = None, {}
+            for tab, job in pending.items():
+                self._pending.setdefault(tab, job)
+            print(f"Failed to write data to Google Sheets '{self.sheet_name}': {e}")
+            return False
+
+        print(f"Data successfully written to Google Sheets tabs: {', '.join(repr(t) for t in pending)}")
+        return True
+
+    def _flush(self, pending: dict):
+        sheets = self._sheet_properties()
+        self._load_contents({tab: job["key_columns"] for tab, job in pending.items()
+                             if job["mode"] == "append" and tab in sheets})
+
+        data, to_clear, new_size = [], [], {}
+        for tab, job in pending.items():
+            df = pd.concat(job["frames"], ignore_index=True) if len(job["frames"]) > 1 else job["frames"][0]
+            df = df.rename(columns=str)
+
+            if job["mode"] == "replace":
+                if tab in sheets:
+                    to_clear.append(_range_name(tab))
+                header = list(df.columns)
+                rows = self._to_values(df)
+                values = [header] + rows
+                self._contents[tab] = (header, None, {self._row_key(header, r, header) for r in rows},
+                                       len(values))
+                start = 1
+            else:
+                existing_header, _, seen, used = self._contents.get(tab, (None, None, set(), 0))
+                values = []
+                if existing_header is None:
+                    existing_header, used = list(df.columns), 0
+                    values.append(existing_header)
+
+                # Line new rows up with the columns already in the tab
+                header = existing_header
+                rows = self._to_values(df.reindex(columns=header))
+                key_columns = [str(c) for c in job["key_columns"] or header]
+                for row in rows:
+                    key = self._row_key(header, row, key_columns)
+                    if key not in seen:
+                        seen.add(key)
+                        values.append(row)
+                if not values:
+                    continue
+                start = used + 1
+                self._contents[tab] = (existing_header, job["key_columns"], seen, used + len(values))
+
+            data.append({"range": _range_name(tab, f"A{start}"), "values": values})
+            new_size[tab] = (start - 1 + len(values), len(header))
+
+        self._ensure_sheets(new_size)
+        if to_clear:
+            self._call(self.spreadsheet.values_batch_clear, body={"ranges": to_clear})
+        if data:
+            self._call(self.spreadsheet.values_batch_update,
+                       body={"valueInputOption": "RAW", "data": data})
+        return sum(len(d["values"]) for d in data)
+
+    def _sheet_properties(self) -> dict:
+        """
+        Tab titles and grid sizes, fetched once and kept up to date locally.
+        """
+        if self._sheets is None:
+            metadata = self._call(self.spreadsheet.fetch_sheet_metadata)
+            self._sheets = {}
+            for sheet in metadata.get("sheets", []):
+                self._remember_sheet(sheet["properties"])
+        return self._sheets
+
+    def _remember_sheet(self, properties: dict):
+        grid = properties.get("gridProperties", {})
+        self._sheets[properties["title"]] = {
+            "id": properties.get("sheetId"),
+            "rows": grid.get("rowCount", 1000),
+            "cols": grid.get("columnCount", 26),
+        }
+
+    def _ensure_sheets(self, sizes: dict):
+        """
+        Create missing tabs and grow undersized ones in a single batch_update.
+        """
+        requests = []
+        for tab, (rows, cols) in sizes.items():
+            sheet = self._sheets.get(tab)
+            if sheet is None:
+                requests.append({"addSheet": {"properties": {
+                    "title": tab,
+                    "gridProperties": {"rowCount": max(rows, 1000), "columnCount": max(cols, 20)},
+                }}})
+            elif rows > sheet["rows"] or cols > sheet["cols"]:
+                sheet["rows"], sheet["cols"] = max(rows, sheet["rows"] * 2), max(cols, sheet["cols"])
+                requests.append({"updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheet["id"],
+                        "gridProperties": {"rowCount": sheet["rows"], "columnCount": sheet["cols"]},
+                    },
+                    "fields": "gridProperties(rowCount,columnCount)",
+                }})
+
+        if not requests:
             return
+        response = self._call(self.spreadsheet.batch_update, {"requests": requests})
+        for reply in response.get("replies", []):
+            if "addSheet" in reply:
+                self._remember_sheet(reply["addSheet"]["properties"])
 
-        try:
+    def _load_contents(self, key_columns: dict):
+        """
+        Read header and row keys of append tabs, in one request.
+
+        Tabs are read once and then tracked locally; a tab is read again only
+        if it is appended to with other key columns than its keys were built on.
+
+        Parameters:
+        key_columns (dict): Tab title -> key columns of its pending append (None for all)
+        """
+        tabs = [tab for tab, columns in key_columns.items()
+                if tab not in self._contents or self._contents[tab][1] != columns]
+        if not tabs:
+            return
+
+        response = self._call(
+            self.spreadsheet.values_batch_get,
+            [_range_name(tab) for tab in tabs],
+            params={"valueRenderOption": "UNFORMATTED_VALUE"},
+        )
+        for tab, value_range in zip(tabs, response.get("valueRanges", [])):
+            values = value_range.get("values", [])
+            if not values:
+                self._contents[tab] = (None, key_columns[tab], set(), 0)
+                continue
+            header = [str(col) for col in values[0]]
+            columns = [str(c) for c in key_columns[tab] or header]
+            keys = {self._row_key(header, row, columns) for row in values[1:]}
+            self._contents[tab] = (header, key_columns[tab], keys, len(values))
+
+    @staticmethod
+    def _to_values(df: pd.DataFrame) -> list:
+        """
+        Convert a DataFrame to JSON-safe cell values; NaN becomes an empty cell.
+        """
+        out = df.astype(object).where(df.notna(), "")
+        for col in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                out[col] = df[col].astype(str).where(df[col].notna(), "")
+        return [[v.item() if isinstance(v, np.generic) else v for v in row]
+                for row in out.itertuples(index=False, name=None)]
+
+    @staticmethod
+    def _row_key(header: list, row: list, key_columns: list) -> tuple:
+        """
+        Normalized identity of a row, comparable between local and sheet values.
+        """
+        key = []
+        for col in key_columns:
+            i = header.index(col) if col in header else -1
+            value = row[i] if 0 <= i < len(row) else ""
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = round(float(value), 6)
+            key.append(str(value))
+        return tuple(key)
+
+    def _call(self, method, *args, **kwargs):
+        """
+        Call the Sheets API, backing off on quota (429) and transient errors.
+        """
+        from gspread.exceptions import APIError
+
+        for attempt in range(self.max_retries + 1):
+            metrics.inc("sheets_api_calls_total", method=method.__name__)
             try:
-                worksheet = spreadsheet.worksheet(tab_name)
-                worksheet.clear()
-            except gspread.exceptions.WorksheetNotFound:
-                worksheet = spreadsheet.add_worksheet(title=tab_name, rows="1000", cols="20")
+                return method(*args, **kwargs)
+            except APIError as e:
+                if attempt == self.max_retries or getattr(e, "code", None) not in self.RETRY_STATUSES:
+                    raise
+                metrics.inc("sheets_retries_total", method=method.__name__)
+                delay = backoff_delay(attempt, base=2.0, cap=64.0)
+                print(f"[Sheets] API error {e.code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
 
-            set_with_dataframe(worksheet, df)
-            print(f"Data successfully written to Google Sheets tab: '{tab_name}'")
 
-        except Exception as e:
-            print(f"Failed to write data to Google Sheets tab '{tab_name}': {e}")
+def _range_name(tab: str, cell=None) -> str:
+    """
+    A1 range for a whole tab or a cell in it, with the tab name quoted
+    (same format as gspread.utils.absolute_range_name).
+    """
+    quoted = "'{}'".format(tab.replace("'", "''"))
+    return f"{quoted}!{cell}" if cell else quoted
 
 
 #Example usage
 if __name__ == "__main__":
-    from data_fetcher import DataFetcherFactory
-    from google_sheets_writer import GoogleSheetsLogger
-    import pandas as pd
+    from .data_fetcher import DataFetcherFactory
+    from .strategy import TradingStrategy
 
     print("🚀 Fetching stock data...")
     fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
@@ -98,17 +346,21 @@ if __name__ == "__main__":
                 # ✅ Replace with your actual sheet name
                 sheet_logger = GoogleSheetsLogger(sheet_name="Stock Signals")
 
-                # Write trade log
-                sheet_logger.write_dataframe(results, "Trade Log")
+                # Append new trades; rows already in the tab are skipped
+                results.insert(0, "Symbol", "RELIANCE.BSE")
+                sheet_logger.queue_dataframe(results, "Trade Log", mode="append")
 
-                # Write summary
+                # Replace summary
                 summary = pd.DataFrame({
+                    "Symbol": ["RELIANCE.BSE"],
                     "Total Trades": [len(results)],
                     "Win Ratio": [(results["Result"] == "Win").mean()],
                     "Total P&L (₹)": [results["Profit ₹"].sum()]
                 })
-                sheet_logger.write_dataframe(summary, "Summary")
+                sheet_logger.queue_dataframe(summary, "Summary", mode="replace")
+
+                # One batched request for both tabs
+                sheet_logger.flush()
 
             except Exception as e:
                 print(f"Google Sheets logging failed: {e}")
-     
\ No newline at end of file
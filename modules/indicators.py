@@ -0,0 +1,257 @@
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+# Batch mode: vectorized over a full price history
+
+def sma(values: pd.Series, window: int) -> pd.Series:
+    """
+    Simple moving average.
+
+    Parameters:
+    values (pd.Series): Input series (usually Close)
+    window (int): Number of bars in the window
+
+    Returns:
+    pd.Series: Rolling mean, NaN until the window is full
+    """
+    return values.rolling(window=window).mean()
+
+
+def ema(values: pd.Series, span: int) -> pd.Series:
+    """
+    Exponential moving average seeded with the first value (adjust=False).
+
+    Parameters:
+    values (pd.Series): Input series
+    span (int): EMA span; alpha = 2 / (span + 1)
+
+    Returns:
+    pd.Series: Exponential moving average
+    """
+    return values.ewm(span=span, adjust=False).mean()
+
+
+def rsi(close: pd.Series, window: int = 14) -> pd.Series:
+    """
+    Relative Strength Index using simple rolling means of gains and losses.
+
+    Parameters:
+    close (pd.Series): Close prices
+    window (int): Lookback window
+
+    Returns:
+    pd.Series: RSI in [0, 100], NaN for the first `window` bars
+    """
+    delta = close.diff()
+
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+
+    avg_gain = gain.rolling(window=window).mean()
+    avg_loss = loss.rolling(window=window).mean()
+
+    rs = avg_gain / (avg_loss + 1e-10)  # Avoid division by zero
+    return 100 - (100 / (1 + rs))
+
+
+def macd(close: pd.Series, fast: int = 12, slow: int = 26) -> pd.Series:
+    """
+    MACD line: fast EMA minus slow EMA.
+
+    Parameters:
+    close (pd.Series): Close prices
+    fast (int): Fast EMA span
+    slow (int): Slow EMA span
+
+    Returns:
+    pd.Series: MACD line
+    """
+    return ema(close, fast) - ema(close, slow)
+
+
+# Panel mode: numpy arrays of any shape (e.g. symbols x bars), time along the last axis
+
+def panel_sma(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average along the last axis, for many series at once.
+
+    A window containing NaN (padding before a symbol's first bar, or a
+    missing bar) gives NaN, so each gap-free row matches `sma`.
+
+    Parameters:
+    values (np.ndarray): Input values, time along the last axis
+    window (int): Number of bars in the window
+
+    Returns:
+    np.ndarray: Rolling mean, same shape as `values`
+    """
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+
+    # Prefix sums with a leading zero, so any window sum is one subtraction
+    zero = np.zeros(values.shape[:-1] + (1,))
+    sums = np.concatenate([zero, np.cumsum(np.where(valid, values, 0.0), axis=-1)], axis=-1)
+    counts = np.concatenate([zero, np.cumsum(valid, axis=-1)], axis=-1)
+
+    out = np.full(values.shape, np.nan)
+    window_sums = sums[..., window:] - sums[..., :-window]
+    full = (counts[..., window:] - counts[..., :-window]) == window
+    out[..., window - 1:] = np.where(full, window_sums / window, np.nan)
+    return out
+
+
+def panel_rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """
+    RSI along the last axis, for many series at once; see `rsi`.
+
+    Parameters:
+    close (np.ndarray): Close prices, time along the last axis
+    window (int): Lookback window
+
+    Returns:
+    np.ndarray: RSI in [0, 100], NaN where the window is incomplete
+    """
+    close = np.asarray(close, dtype=float)
+    delta = np.diff(close, axis=-1, prepend=np.nan)
+
+    avg_gain = panel_sma(np.clip(delta, 0, None), window)
+    avg_loss = panel_sma(np.clip(-delta, 0, None), window)
+
+    rs = avg_gain / (avg_loss + 1e-10)  # Avoid division by zero
+    return 100 - (100 / (1 + rs))
+
+
+# Streaming mode: O(1) state updates, one bar at a time
+
+class RollingMean:
+    """
+    Rolling mean over a fixed window, backed by a ring buffer and a running sum.
+
+    Attributes:
+    window (int): Number of values in the window
+    value (float): Current mean, NaN until the window is full
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.value = math.nan
+        self._buffer = deque(maxlen=window)
+        self._sum = 0.0
+        self._updates = 0
+
+    def update(self, x: float) -> float:
+        """
+        Push a new value and return the updated mean.
+        """
+        if len(self._buffer) == self.window:
+            self._sum -= self._buffer[0]
+        self._buffer.append(x)
+        self._sum += x
+        self._updates += 1
+
+        # Re-sum once per window to stop floating-point drift; amortized O(1)
+        if self._updates % self.window == 0:
+            self._sum = math.fsum(self._buffer)
+
+        if len(self._buffer) == self.window:
+            self.value = self._sum / self.window
+        return self.value
+
+
+class StreamingEMA:
+    """
+    Exponential moving average updated one value at a time (adjust=False).
+
+    Attributes:
+    span (int): EMA span
+    value (float): Current EMA, NaN before the first update
+    """
+
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        """
+        Push a new value and return the updated EMA.
+        """
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self.value = self.alpha * x + (1 - self.alpha) * self.value
+        return self.value
+
+
+class StreamingRSI:
+    """
+    RSI updated one close at a time; matches the batch `rsi` output.
+
+    Attributes:
+    window (int): Lookback window
+    value (float): Current RSI, NaN until `window` price changes are seen
+    """
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.value = math.nan
+        self._prev_close = None
+        self._avg_gain = RollingMean(window)
+        self._avg_loss = RollingMean(window)
+
+    def update(self, close: float) -> float:
+        """
+        Push a new close and return the updated RSI.
+        """
+        if self._prev_close is not None:
+            delta = close - self._prev_close
+            avg_gain = self._avg_gain.update(max(delta, 0.0))
+            avg_loss = self._avg_loss.update(max(-delta, 0.0))
+
+            if not math.isnan(avg_gain):
+                rs = avg_gain / (avg_loss + 1e-10)
+                self.value = 100 - (100 / (1 + rs))
+        self._prev_close = close
+        return self.value
+
+
+class StreamingMACD:
+    """
+    MACD line updated one close at a time; matches the batch `macd` output.
+
+    Attributes:
+    value (float): Current MACD, NaN before the first update
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26):
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        """
+        Push a new close and return the updated MACD.
+        """
+        self.value = self._fast.update(close) - self._slow.update(close)
+        return self.value
+
+
+def replay(indicator, values) -> np.ndarray:
+    """
+    Feed a whole series through a streaming indicator.
+
+    Useful for priming streaming state from history and for checking
+    that streaming and batch modes agree.
+
+    Parameters:
+    indicator: Any streaming indicator with an `update` method
+    values (iterable): Values to push, oldest first
+
+    Returns:
+    np.ndarray: Indicator value after each update
+    """
+    return np.array([indicator.update(float(x)) for x in values])
@@ -0,0 +1,191 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+from .feature_store import FeatureState
+
+# Bump when the artifact layout changes in a way older loaders cannot read
+ARTIFACT_VERSION = 1
+
+
+def save_model(model, path: str, features, **metadata):
+    """
+    Persist a fitted model with the metadata needed to score with it later.
+
+    Parameters:
+    model: Fitted estimator or Pipeline exposing predict_proba
+    path (str): Destination file
+    features (list[str]): Feature columns, in the order the model expects
+    **metadata: Extra fields to store (e.g. symbols, training window)
+    """
+    import joblib
+    import sklearn
+
+    artifact = {
+        "artifact_version": ARTIFACT_VERSION,
+        "sklearn_version": sklearn.__version__,
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "features": list(features),
+        "metadata": metadata,
+        "model": model,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    joblib.dump(artifact, path)
+
+
+def load_model(path: str) -> dict:
+    """
+    Load a model artifact written by save_model.
+
+    Returns:
+    dict: Artifact with 'model', 'features' and version metadata
+    """
+    import joblib
+    import sklearn
+
+    artifact = joblib.load(path)
+    if artifact.get("artifact_version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported model artifact version {artifact.get('artifact_version')} "
+            f"(expected {ARTIFACT_VERSION})"
+        )
+    if artifact["sklearn_version"] != sklearn.__version__:
+        print(f"[WARN] model saved with scikit-learn {artifact['sklearn_version']}, "
+              f"running {sklearn.__version__}")
+    return artifact
+
+
+class BatchScorer:
+    """
+    Scores the latest bar of many symbols with one predict_proba call.
+
+    Each symbol keeps a streaming FeatureState, so scoring after new bars
+    arrive only featurizes those bars, not the full history.
+
+    Attributes:
+    model: Fitted estimator exposing predict_proba
+    features (list[str]): Feature columns the model expects
+    """
+
+    def __init__(self, artifact: dict):
+        """
+        Parameters:
+        artifact (dict): Loaded model artifact (see load_model)
+        """
+        self.model = artifact["model"]
+        self.features = artifact["features"]
+        self._states = {}
+        self._latest = {}
+
+    @classmethod
+    def from_path(cls, path: str) -> "BatchScorer":
+        return cls(load_model(path))
+
+    def update(self, symbol: str, bars: pd.DataFrame):
+        """
+        Feed bars for a symbol; only bars newer than the last one seen are used.
+
+        The first call should pass enough history to warm up the indicators.
+
+        Parameters:
+        symbol (str): Stock symbol
+        bars (pd.DataFrame): Frame with 'date', 'Close' and 'Volume', oldest first
+        """
+        for date, close, volume in zip(bars['date'], bars['Close'].to_numpy(dtype=float),
+                                       bars['Volume'].to_numpy(dtype=float)):
+            self.update_bar(symbol, date, close, volume)
+
+    def update_bar(self, symbol: str, date, close: float, volume: float):
+        """
+        Feed a single bar for a symbol; O(1). Bars at or before the last one seen are ignored.
+        """
+        state = self._states.get(symbol)
+        if state is None:
+            state = self._states[symbol] = FeatureState()
+        elif date <= state.last_date:
+            return
+        self._latest[symbol] = state.update(date, close, volume)
+
+    def score(self, latest_bars=None) -> pd.DataFrame:
+        """
+        Probability that the next bar closes higher, for every tracked symbol.
+
+        Parameters:
+        latest_bars (pd.DataFrame or dict[str, pd.DataFrame], optional): New bars
+            to ingest before scoring, either one long-format frame with a 'symbol'
+            column (fastest) or a per-symbol dict
+
+        Returns:
+        pd.DataFrame: Indexed by symbol with 'date' (bar scored) and
+            'Probability'; symbols still warming up get NaN
+        """
+        if isinstance(latest_bars, pd.DataFrame):
+            # Pull columns out once; per-symbol DataFrame slicing dominates otherwise
+            for row in zip(latest_bars['symbol'], latest_bars['date'],
+                           latest_bars['Close'].to_numpy(dtype=float),
+                           latest_bars['Volume'].to_numpy(dtype=float)):
+                self.update_bar(*row)
+        else:
+            for symbol, bars in (latest_bars or {}).items():
+                self.update(symbol, bars)
+
+        symbols = list(self._latest)
+        if not symbols:
+            return pd.DataFrame({"date": [], "Probability": []}, index=pd.Index([], name="symbol"))
+
+        latest = [self._latest[s] for s in symbols]
+        X = np.array([[row[f] for f in self.features] for row in latest], dtype=np.float32)
+        proba = np.full(len(symbols), np.nan)
+        ready = np.isfinite(X).all(axis=1)
+        if ready.any():
+            proba[ready] = self.model.predict_proba(X[ready])[:, 1]
+
+        return pd.DataFrame(
+            {"date": [row["date"] for row in latest], "Probability": proba},
+            index=pd.Index(symbols, name="symbol"),
+        )
+
+
+def gate_signals(signals: pd.DataFrame, scores: pd.DataFrame, min_probability=0.5) -> pd.DataFrame:
+    """
+    Keep only BUY signals the model agrees with.
+
+    Parameters:
+    signals (pd.DataFrame): Signal rows with a 'symbol' column, e.g. the latest
+        bar of TradingStrategy.generate_signals per symbol
+    scores (pd.DataFrame): Output of BatchScorer.score
+    min_probability (float): Minimum up-move probability to keep a signal
+
+    Returns:
+    pd.DataFrame: Surviving signals with a 'Probability' column
+    """
+    gated = signals.join(scores["Probability"], on="symbol")
+    return gated[gated["Probability"] >= min_probability]
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+    from .ml_model import StockMlModel
+    from .strategy import TradingStrategy
+
+    symbols = ["RELIANCE.BSE", "TCS.BSE", "INFY.BSE"]
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    frames = fetcher.get_daily_data_batch(symbols, outputsize="full")
+
+    model = StockMlModel(frames[symbols[0]])
+    model.engineer_features()
+    model.train_and_evaluate()
+    model.save("models/stock_ml_model.joblib")
+
+    scorer = BatchScorer.from_path("models/stock_ml_model.joblib")
+    scores = scorer.score(frames)
+    print(scores)
+
+    latest = pd.concat([
+        TradingStrategy(df).generate_signals().tail(1).assign(symbol=symbol)
+        for symbol, df in frames.items() if not df.empty
+    ])
+    print(gate_signals(latest, scores, min_probability=0.55))
@@ -0,0 +1,239 @@
+import atexit
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+# Latency buckets in seconds, Prometheus-style (upper bounds, +Inf implied)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+
+class _NullSpan:
+    """
+    Shared no-op span handed out while instrumentation is disabled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **values):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    Times a block of work and records its outcome on exit.
+
+    Values passed to set() (e.g. rows=len(df)) are added to counters named
+    "<span>_<key>_total" with the span's labels.
+    """
+
+    def __init__(self, metrics, name: str, labels: dict):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.values = {}
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        self.metrics.observe(f"{self.name}_seconds", elapsed, **self.labels)
+        self.metrics.inc(f"{self.name}_total", **self.labels)
+        if exc_type is not None:
+            self.metrics.inc(f"{self.name}_errors_total", **self.labels)
+        for key, value in self.values.items():
+            self.metrics.inc(f"{self.name}_{key}_total", value, **self.labels)
+
+        self.metrics.log({
+            "span": self.name,
+            "seconds": round(elapsed, 6),
+            "error": exc_type.__name__ if exc_type else None,
+            **self.labels,
+            **self.values,
+        })
+        return False
+
+    def set(self, **values):
+        self.values.update(values)
+
+
+class Metrics:
+    """
+    Lightweight in-process counters, histograms and timing spans.
+
+    Disabled by default; while disabled every call returns immediately, so
+    instrumented hot paths cost one attribute check. Enable with enable() or
+    the ALGO_METRICS=1 environment variable.
+
+    Attributes:
+    enabled (bool): Whether anything is recorded
+    """
+
+    def __init__(self, enabled=False, log_path=None, buckets=DEFAULT_BUCKETS):
+        """
+        Parameters:
+        enabled (bool): Start recording immediately
+        log_path (str, optional): JSON-lines file receiving one record per span
+        buckets (tuple[float]): Histogram bucket upper bounds
+        """
+        self.enabled = enabled
+        self.log_path = log_path
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def enable(self, log_path=None):
+        self.enabled = True
+        if log_path:
+            self.log_path = log_path
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def span(self, name: str, **labels):
+        """
+        Context manager timing a block of work.
+
+        Usage:
+        with metrics.span("fetch", symbol="TCS.BSE") as span:
+            df = ...
+            span.set(rows=len(df))
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, labels)
+
+    def timed(self, name: str, **labels):
+        """
+        Decorator form of span().
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, name, labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def inc(self, name: str, value=1, **labels):
+        """
+        Add `value` to a counter.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """
+        Record one observation in a histogram.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = {"buckets": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            hist["buckets"][bisect.bisect_left(self.buckets, value)] += 1
+            hist["sum"] += value
+            hist["count"] += 1
+
+    def log(self, record: dict):
+        """
+        Append a structured record to the JSON-lines log, if one is configured.
+        """
+        if not self.log_path:
+            return
+        line = json.dumps({"ts": time.time(), **record}, default=str)
+        with self._lock:
+            with open(self.log_path, "a") as f:
+                f.write(line + "\n")
+
+    def snapshot(self) -> dict:
+        """
+        Copy of all counters and histograms, keyed by (name, labels).
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {k: {**v, "buckets": list(v["buckets"])} for k, v in self._histograms.items()},
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        snap = self.snapshot()
+        lines = []
+
+        for name in sorted({name for name, _ in snap["counters"]}):
+            lines.append(f"# TYPE {name} counter")
+            for (n, labels), value in sorted(snap["counters"].items()):
+                if n == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for name in sorted({name for name, _ in snap["histograms"]}):
+            lines.append(f"# TYPE {name} histogram")
+            for (n, labels), hist in sorted(snap["histograms"].items()):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), hist["buckets"]):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {hist['sum']}")
+                lines.append(f"{name}_count{_format_labels(labels)} {hist['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """
+        Write the Prometheus text format to a file (e.g. for node_exporter's textfile collector).
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Process-wide registry used by all modules
+metrics = Metrics(
+    enabled=os.getenv("ALGO_METRICS", "").lower() in ("1", "true", "yes"),
+    log_path=os.getenv("ALGO_METRICS_LOG"),
+)
+
+if os.getenv("ALGO_METRICS_FILE"):
+    atexit.register(metrics.write_prometheus, os.getenv("ALGO_METRICS_FILE"))
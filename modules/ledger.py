@@ -0,0 +1,362 @@
+import inspect
+import json
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import metrics
+from .strategy import TradingStrategy
+
+DEFAULT_LEDGER_PATH = os.path.join(os.path.dirname(__file__), "..", "state", "ledger.sqlite")
+
+# Trade log columns as built by build_trade_log
+TRADE_LOG_COLUMNS = ["Buy Date", "Buy Price", "Sell Date", "Sell Price", "Profit ₹", "Result"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strategies (
+    id      INTEGER PRIMARY KEY,
+    params  TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS trades (
+    symbol          TEXT NOT NULL,
+    params_id       INTEGER NOT NULL REFERENCES strategies (id),
+    holding_period  INTEGER NOT NULL,
+    buy_date        TEXT NOT NULL,
+    buy_price       REAL NOT NULL,
+    sell_date       TEXT NOT NULL,
+    sell_price      REAL NOT NULL,
+    profit          REAL NOT NULL,
+    result          TEXT NOT NULL,
+    mirrored        INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (symbol, params_id, holding_period, buy_date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trades_by_date ON trades (buy_date);
+CREATE INDEX IF NOT EXISTS trades_by_params ON trades (params_id, buy_date);
+CREATE INDEX IF NOT EXISTS trades_unmirrored ON trades (mirrored) WHERE mirrored = 0;
+
+CREATE TABLE IF NOT EXISTS signals (
+    symbol      TEXT NOT NULL,
+    params_id   INTEGER NOT NULL REFERENCES strategies (id),
+    date        TEXT NOT NULL,
+    close       REAL NOT NULL,
+    rsi         REAL,
+    fast_ma     REAL,
+    slow_ma     REAL,
+    PRIMARY KEY (symbol, params_id, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS signals_by_date ON signals (date);
+"""
+
+# Re-recording an identical row is a no-op; a changed trade is updated and re-mirrored
+UPSERT_TRADE = """
+INSERT INTO trades (symbol, params_id, holding_period, buy_date, buy_price, sell_date,
+                    sell_price, profit, result)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (symbol, params_id, holding_period, buy_date) DO UPDATE SET
+    buy_price = excluded.buy_price, sell_date = excluded.sell_date,
+    sell_price = excluded.sell_price, profit = excluded.profit,
+    result = excluded.result, mirrored = 0
+WHERE (buy_price, sell_date, sell_price, profit, result) IS NOT
+      (excluded.buy_price, excluded.sell_date, excluded.sell_price, excluded.profit, excluded.result)
+"""
+
+UPSERT_SIGNAL = """
+INSERT INTO signals (symbol, params_id, date, close, rsi, fast_ma, slow_ma)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (symbol, params_id, date) DO UPDATE SET
+    close = excluded.close, rsi = excluded.rsi,
+    fast_ma = excluded.fast_ma, slow_ma = excluded.slow_ma
+WHERE (close, rsi, fast_ma, slow_ma) IS NOT
+      (excluded.close, excluded.rsi, excluded.fast_ma, excluded.slow_ma)
+"""
+
+
+def strategy_key(params=None) -> str:
+    """
+    Canonical text for a set of TradingStrategy parameters.
+
+    Missing parameters take TradingStrategy's defaults and whole floats are
+    written as ints, so {}, {"oversold": 30.0} and the full default set all
+    map to the same key.
+
+    Parameters:
+    params (dict, optional): Keyword arguments passed to TradingStrategy
+
+    Returns:
+    str: JSON object with sorted keys
+    """
+    resolved = {
+        name: p.default
+        for name, p in inspect.signature(TradingStrategy.__init__).parameters.items()
+        if p.default is not inspect.Parameter.empty
+    }
+    resolved.update(params or {})
+    resolved = {k: int(v) if isinstance(v, float) and v.is_integer() else v for k, v in resolved.items()}
+    return json.dumps(resolved, sort_keys=True, separators=(",", ":"))
+
+
+class TradeLedger:
+    """
+    Embedded SQLite store of backtested trades and signals; the system of
+    record that the Sheets log mirrors.
+
+    Trades are keyed by (symbol, strategy parameters, holding period, buy
+    date), so recording the same backtest twice leaves one copy of each
+    trade. Parameter sets are interned in a strategies table and trades
+    refer to them by integer id, which keeps the keys and indexes small.
+    Dates are stored as ISO text and indexed, so date-range and per-symbol
+    queries and aggregates run in SQL without loading the table.
+
+    Attributes:
+    path (str): Database file
+    """
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        """
+        Open (and create if needed) the ledger.
+
+        Parameters:
+        path (str): Database file, or ":memory:"
+        """
+        self.path = path if path == ":memory:" else os.path.abspath(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        # One connection shared by the pipeline threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Bulk upserts touch every index; keep their pages cached (64 MiB)
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.executescript(SCHEMA)
+        self._strategy_ids = {}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def record_trades(self, symbol: str, trades: pd.DataFrame, params=None, holding_period=5) -> int:
+        """
+        Upsert a trade log from TradingStrategy.backtest_signals.
+
+        Parameters:
+        symbol (str): Stock symbol
+        trades (pd.DataFrame): Trade log; a 'Holding Period' column overrides `holding_period`
+        params (dict, optional): Strategy parameters the log was produced with
+        holding_period (int): Holding period of a single-period log
+
+        Returns:
+        int: Trades inserted or changed (unchanged re-runs count 0)
+        """
+        if trades.empty:
+            return 0
+
+        periods = trades["Holding Period"] if "Holding Period" in trades else \
+            pd.Series(holding_period, index=trades.index)
+        rows = zip(
+            [symbol] * len(trades),
+            [self._strategy_id(params)] * len(trades),
+            periods.astype(int).tolist(),
+            _iso(trades["Buy Date"]),
+            trades["Buy Price"].astype(float).tolist(),
+            _iso(trades["Sell Date"]),
+            trades["Sell Price"].astype(float).tolist(),
+            trades["Profit ₹"].astype(float).tolist(),
+            trades["Result"].tolist(),
+        )
+        with metrics.span("ledger_write", symbol=symbol, table="trades") as span:
+            changed = self._write(UPSERT_TRADE, rows)
+            span.set(rows=changed)
+        return changed
+
+    def record_signals(self, symbol: str, signals: pd.DataFrame, params=None) -> int:
+        """
+        Upsert BUY signals from TradingStrategy.generate_signals.
+
+        Parameters:
+        symbol (str): Stock symbol
+        signals (pd.DataFrame): Signal rows with 'date', 'Close', 'RSI' and
+            the two moving-average columns (MA<fast>, MA<slow>)
+        params (dict, optional): Strategy parameters the signals were produced with
+
+        Returns:
+        int: Signals inserted or changed
+        """
+        if signals.empty:
+            return 0
+
+        resolved = json.loads(strategy_key(params))
+        fast, slow = f"MA{resolved['fast_window']}", f"MA{resolved['slow_window']}"
+        rows = zip(
+            [symbol] * len(signals),
+            [self._strategy_id(params)] * len(signals),
+            _iso(signals["date"]),
+            signals["Close"].astype(float).tolist(),
+            signals["RSI"].astype(float).tolist(),
+            signals[fast].astype(float).tolist(),
+            signals[slow].astype(float).tolist(),
+        )
+        with metrics.span("ledger_write", symbol=symbol, table="signals") as span:
+            changed = self._write(UPSERT_SIGNAL, rows)
+            span.set(rows=changed)
+        return changed
+
+    def trades(self, symbols=None, start=None, end=None, result=None, params=None,
+               holding_period=None) -> pd.DataFrame:
+        """
+        Query recorded trades, e.g. all wins on TCS.BSE last quarter:
+        ledger.trades("TCS.BSE", start="2024-07-01", end="2024-09-30", result="Win").
+
+        Parameters:
+        symbols (str or list[str], optional): Restrict to these symbols
+        start, end (str or datetime, optional): Inclusive bounds on the buy date
+        result (str, optional): "Win" or "Loss"
+        params (dict, optional): Restrict to one strategy parameter set
+        holding_period (int, optional): Restrict to one holding period
+
+        Returns:
+        pd.DataFrame: Trade log columns plus 'Symbol' and 'Holding Period',
+            ordered by symbol and buy date
+        """
+        where, args = self._filters(symbols, start, end, result, params, holding_period)
+        sql = (
+            "SELECT symbol, holding_period, buy_date, buy_price, sell_date, sell_price, profit, result "
+            f"FROM trades {where} ORDER BY symbol, buy_date, holding_period"
+        )
+        df = self._query(sql, args)
+        df.columns = ["Symbol", "Holding Period", *TRADE_LOG_COLUMNS]
+        df["Buy Date"] = pd.to_datetime(df["Buy Date"])
+        df["Sell Date"] = pd.to_datetime(df["Sell Date"])
+        return df
+
+    def summary(self, symbols=None, start=None, end=None, params=None, holding_period=None) -> pd.DataFrame:
+        """
+        Per-symbol trade count, win ratio and total P&L, aggregated in SQL.
+
+        Takes the same filters as trades().
+
+        Returns:
+        pd.DataFrame: Columns 'Symbol', 'Total Trades', 'Win Ratio', 'Total P&L (₹)'
+        """
+        where, args = self._filters(symbols, start, end, None, params, holding_period)
+        sql = (
+            "SELECT symbol, COUNT(*), AVG(result = 'Win'), ROUND(SUM(profit), 2) "
+            f"FROM trades {where} GROUP BY symbol ORDER BY symbol"
+        )
+        df = self._query(sql, args)
+        df.columns = ["Symbol", "Total Trades", "Win Ratio", "Total P&L (₹)"]
+        return df
+
+    def mirror(self, sheets, tab="Trade Log") -> bool:
+        """
+        Append trades not yet mirrored to a Google Sheets tab and flush.
+
+        Rows are marked mirrored only after the flush succeeds, so the sheet
+        can fall behind (quota, outage) and catch up on a later call without
+        losing or duplicating rows. The tab is append-only: a trade whose
+        values change after it was mirrored is not rewritten there. Each row
+        carries its strategy parameters (as JSON) in a 'Params' column, so
+        the same trade under two parameter sets is mirrored twice.
+
+        Parameters:
+        sheets (GoogleSheetsLogger): Target spreadsheet
+        tab (str): Tab receiving the trades
+
+        Returns:
+        bool: False if the flush failed
+        """
+        df = self._query(
+            "SELECT t.symbol, t.params_id, s.params, t.holding_period, t.buy_date, t.buy_price, "
+            "t.sell_date, t.sell_price, t.profit, t.result "
+            "FROM trades t JOIN strategies s ON s.id = t.params_id "
+            "WHERE t.mirrored = 0 ORDER BY t.symbol, t.buy_date, t.holding_period", [])
+        keys = list(df[["symbol", "params_id", "holding_period", "buy_date"]].itertuples(index=False, name=None))
+        if keys:
+            df = df.drop(columns="params_id")
+            df.columns = ["Symbol", "Params", "Holding Period", *TRADE_LOG_COLUMNS]
+            sheets.queue_dataframe(df, tab, mode="append",
+                                   key_columns=["Symbol", "Params", "Holding Period", "Buy Date"])
+
+        if not sheets.flush():
+            return False
+        if keys:
+            self._write(
+                "UPDATE trades SET mirrored = 1 "
+                "WHERE symbol = ? AND params_id = ? AND holding_period = ? AND buy_date = ?", keys)
+        return True
+
+    def _filters(self, symbols, start, end, result, params, holding_period):
+        clauses, args = [], []
+        if symbols is not None:
+            symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+            clauses.append(f"symbol IN ({', '.join('?' * len(symbols))})")
+            args += symbols
+        if start is not None:
+            clauses.append("buy_date >= ?")
+            args.append(_iso_one(start))
+        if end is not None:
+            # Date-only bounds include the whole day
+            clauses.append("buy_date <= ?")
+            args.append(_iso_one(end, end_of_day=True))
+        if result is not None:
+            clauses.append("result = ?")
+            args.append(result)
+        if params is not None:
+            clauses.append("params_id = (SELECT id FROM strategies WHERE params = ?)")
+            args.append(strategy_key(params))
+        if holding_period is not None:
+            clauses.append("holding_period = ?")
+            args.append(int(holding_period))
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def _strategy_id(self, params) -> int:
+        key = strategy_key(params)
+        if key not in self._strategy_ids:
+            with self._lock, self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO strategies (params) VALUES (?)", (key,))
+                (self._strategy_ids[key],) = self._conn.execute(
+                    "SELECT id FROM strategies WHERE params = ?", (key,)).fetchone()
+        return self._strategy_ids[key]
+
+    def _write(self, sql: str, rows) -> int:
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(sql, rows)
+            return self._conn.total_changes - before
+
+    def _query(self, sql: str, args) -> pd.DataFrame:
+        with self._lock:
+            cursor = self._conn.execute(sql, args)
+            return pd.DataFrame(cursor.fetchall(), columns=[d[0] for d in cursor.description])
+
+
+def _iso(dates: pd.Series) -> list:
+    seconds = np.asarray(dates, dtype="datetime64[s]")
+    return np.char.replace(np.datetime_as_string(seconds), "T", " ").tolist()
+
+
+def _iso_one(value, end_of_day=False) -> str:
+    ts = pd.Timestamp(value)
+    if end_of_day and ts == ts.normalize() and not (isinstance(value, str) and ":" in value):
+        ts += pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+    return ts.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    ledger = TradeLedger()
+
+    for symbol in ["RELIANCE.BSE", "TCS.BSE"]:
+        trades = TradingStrategy(fetcher.get_daily_data(symbol, outputsize="full")).backtest_signals()
+        print(symbol, ledger.record_trades(symbol, trades), "trades recorded")
+
+    print(ledger.summary())
+    print(ledger.trades("TCS.BSE", start="2024-07-01", end="2024-09-30", result="Win"))
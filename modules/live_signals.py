@@ -0,0 +1,234 @@
+import math
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from .indicators import RollingMean, StreamingRSI
+from .strategy import TradingStrategy
+
+
+class StreamingSignalEngine:
+    """
+    Incremental RSI + MA crossover signal for one symbol.
+
+    Each new bar is an O(1) state update, however much history came before it.
+    The rule is the same as TradingStrategy.generate_signals on the newest bar.
+
+    Attributes:
+    symbol (str): Symbol the engine tracks
+    last_date: Date of the last bar ingested
+    """
+
+    def __init__(self, symbol: str, rsi_window=14, oversold=30, fast_window=20, slow_window=50):
+        """
+        Parameters:
+        symbol (str): Stock symbol
+        rsi_window (int): RSI lookback window
+        oversold (float): RSI level below which a bar counts as oversold
+        fast_window (int): Fast moving average window
+        slow_window (int): Slow moving average window
+        """
+        self.symbol = symbol
+        self.oversold = oversold
+        self.fast_col = f'MA{fast_window}'
+        self.slow_col = f'MA{slow_window}'
+        self.last_date = None
+
+        self._rsi = StreamingRSI(rsi_window)
+        self._fast = RollingMean(fast_window)
+        self._slow = RollingMean(slow_window)
+
+    def update(self, date, close: float):
+        """
+        Ingest one bar and return a BUY event if it triggers the rule.
+
+        Parameters:
+        date: Bar timestamp
+        close (float): Bar close price
+
+        Returns:
+        dict or None: Event with the bar's indicators, or None
+        """
+        fast_prev, slow_prev = self._fast.value, self._slow.value
+
+        rsi = self._rsi.update(close)
+        fast = self._fast.update(close)
+        slow = self._slow.update(close)
+        self.last_date = date
+
+        # NaN compares False, so warm-up bars never fire
+        if rsi < self.oversold and fast_prev < slow_prev and fast > slow:
+            return {
+                "symbol": self.symbol,
+                "date": date,
+                "Close": close,
+                "RSI": rsi,
+                self.fast_col: fast,
+                self.slow_col: slow,
+                "Signal": "BUY",
+            }
+        return None
+
+    def ingest(self, df: pd.DataFrame) -> list:
+        """
+        Feed every bar in `df` newer than the last one seen.
+
+        Parameters:
+        df (pd.DataFrame): Bars with 'date' and 'Close', oldest first
+
+        Returns:
+        list[dict]: BUY events, in bar order
+        """
+        if self.last_date is not None:
+            df = df[df['date'] > self.last_date]
+
+        events = []
+        for date, close in zip(df['date'], df['Close'].to_numpy(dtype=float)):
+            event = self.update(date, close)
+            if event is not None:
+                events.append(event)
+        return events
+
+
+class LiveSignalRunner:
+    """
+    Polls intraday bars for a set of symbols and pushes BUY events to a notifier.
+
+    Each symbol is primed silently from the first snapshot, then only bars
+    newer than the last one seen are ingested on each poll.
+    """
+
+    def __init__(self, fetcher, symbols, notifier=None, interval="15min", poll_seconds=60,
+                 warmup_outputsize="full", **strategy_params):
+        """
+        Parameters:
+        fetcher (StockDataFetcher): Source of intraday bars
+        symbols (list[str]): Symbols to watch
+        notifier: Object with send_alert(message), e.g. TelegramAlertQueue
+        interval (str): Intraday bar interval
+        poll_seconds (float): Seconds between polls
+        warmup_outputsize (str): Output size of the first (priming) fetch
+        **strategy_params: rsi_window, oversold, fast_window, slow_window
+        """
+        self.fetcher = fetcher
+        self.notifier = notifier
+        self.interval = interval
+        self.poll_seconds = poll_seconds
+        self.warmup_outputsize = warmup_outputsize
+        self.engines = {symbol: StreamingSignalEngine(symbol, **strategy_params) for symbol in symbols}
+        self._stop = threading.Event()
+
+    def poll_once(self) -> list:
+        """
+        Fetch the latest bars for every symbol and return the new BUY events.
+        """
+        events = []
+        for symbol, engine in self.engines.items():
+            priming = engine.last_date is None
+            df = self.fetcher.get_intraday_data(
+                symbol,
+                interval=self.interval,
+                outputsize=self.warmup_outputsize if priming else "compact",
+            )
+            if df.empty:
+                continue
+
+            new_events = engine.ingest(df.sort_values('date'))
+            if priming:
+                continue  # History only warms up state; its signals are stale
+            for event in new_events:
+                self._emit(event)
+            events.extend(new_events)
+        return events
+
+    def run(self):
+        """
+        Poll until stop() is called.
+        """
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll_once()
+            self._stop.wait(max(0.0, self.poll_seconds - (time.monotonic() - started)))
+
+    def stop(self):
+        self._stop.set()
+
+    def _emit(self, event: dict):
+        message = (
+            f"BUY Signal for {event['symbol']}\n"
+            f"Bar: {event['date']}\n"
+            f"Close: ₹{event['Close']:.2f}\n"
+            f"RSI: {event['RSI']:.1f}"
+        )
+        print(message)
+        if self.notifier is not None:
+            self.notifier.send_alert(message)
+
+
+def replay_csv(path: str, symbol="REPLAY", **strategy_params) -> pd.DataFrame:
+    """
+    Feed a historical CSV through the streaming engine bar by bar.
+
+    Parameters:
+    path (str): CSV with 'date' and 'Close' columns
+    symbol (str): Symbol to tag events with
+    **strategy_params: rsi_window, oversold, fast_window, slow_window
+
+    Returns:
+    pd.DataFrame: One row per BUY event
+    """
+    df = pd.read_csv(path, parse_dates=['date']).sort_values('date', ignore_index=True)
+    engine = StreamingSignalEngine(symbol, **strategy_params)
+    return pd.DataFrame(engine.ingest(df))
+
+
+def check_replay(path: str, **strategy_params) -> bool:
+    """
+    Check that replaying a CSV emits the same signals as a batch generate_signals run.
+
+    Parameters:
+    path (str): CSV with 'date' and 'Close' columns
+    **strategy_params: rsi_window, oversold, fast_window, slow_window
+
+    Returns:
+    bool: True if both runs flag exactly the same bars
+    """
+    df = pd.read_csv(path, parse_dates=['date']).sort_values('date', ignore_index=True)
+    batch = TradingStrategy(df, **strategy_params).generate_signals()
+    stream = replay_csv(path, **strategy_params)
+
+    batch_dates = list(batch['date'])
+    stream_dates = list(stream['date']) if not stream.empty else []
+    if batch_dates != stream_dates:
+        print(f"[REPLAY] mismatch: batch={batch_dates} stream={stream_dates}")
+        return False
+
+    if batch_dates:
+        drift = max(
+            abs(b - s) for col in ('RSI', 'Close')
+            for b, s in zip(batch[col], stream[col]) if not (math.isnan(b) or math.isnan(s))
+        )
+        print(f"[REPLAY] {len(batch_dates)} signals match (max indicator drift {drift:.2e})")
+    else:
+        print("[REPLAY] no signals in either run")
+    return True
+
+
+# Example usage
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # python -m modules.live_signals history.csv -> replay and compare with batch
+        sys.exit(0 if check_replay(sys.argv[1]) else 1)
+
+    from .data_fetcher import DataFetcherFactory
+    from .telegram_notifier import TelegramAlertQueue, TelegramNotifier
+
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    with TelegramAlertQueue(TelegramNotifier()) as alerts:
+        runner = LiveSignalRunner(fetcher, ["RELIANCE.BSE", "TCS.BSE"], notifier=alerts, poll_seconds=900)
+        try:
+            runner.run()
+        except KeyboardInterrupt:
+            runner.stop()
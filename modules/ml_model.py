@@ -1,10 +1,13 @@
+import time
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-import seaborn as sns
-import matplotlib.pyplot as plt
+
+# scikit-learn, joblib, seaborn and matplotlib are imported inside the methods
+# that use them: together they take seconds to load, and scoring or feature
+# engineering alone needs none of them
+from .bars import Bars
+from .indicators import rsi, macd
+from .inference import save_model
 
 class StockMlModel:
     """
@@ -12,9 +15,34 @@ class StockMlModel:
     using Logistic Regression.
     """
 
+    FEATURES = ['RSI', 'MACD', 'Volume']
+
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
-        self.model = LogisticRegression(solver='liblinear', random_state=42)
+        """
+        Parameters:
+        df (pd.DataFrame or Bars): Historical stock data; shared, not copied
+        """
+        if isinstance(df, Bars):
+            df = df.to_frame()
+        self.df = df.copy(deep=False)
+        self._model = None
+        self._X = None
+        self._y = None
+
+    @property
+    def model(self):
+        """
+        The classifier; a liblinear LogisticRegression unless replaced.
+        """
+        if self._model is None:
+            from sklearn.linear_model import LogisticRegression
+
+            self._model = LogisticRegression(solver='liblinear', random_state=42)
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
 
     def engineer_features(self):
         """
@@ -28,19 +56,8 @@ class StockMlModel:
         Target:
         - 1 if the next day's Close price is greater than today's, else 0.
         """
-        # Compute RSI
-        delta = self.df['Close'].diff()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-        avg_gain = gain.rolling(14).mean()
-        avg_loss = loss.rolling(14).mean()
-        rs = avg_gain / (avg_loss + 1e-10)
-        self.df['RSI'] = 100 - (100 / (1 + rs))
-
-        # Compute MACD
-        exp1 = self.df['Close'].ewm(span=12, adjust=False).mean()
-        exp2 = self.df['Close'].ewm(span=26, adjust=False).mean()
-        self.df['MACD'] = exp1 - exp2
+        self.df['RSI'] = rsi(self.df['Close'], window=14)
+        self.df['MACD'] = macd(self.df['Close'], fast=12, slow=26)
 
         # Confirm MACD is added
         if 'MACD' not in self.df.columns:
@@ -53,6 +70,29 @@ class StockMlModel:
         self.df.dropna(inplace=True)
         print("Columns after dropna:", self.df.columns.tolist())
 
+        # Features changed; rebuild the cached matrix on next use
+        self._X = None
+        self._y = None
+
+    def feature_matrix(self):
+        """
+        Return the feature matrix and target as contiguous arrays.
+
+        Built once from the engineered columns and cached, so training and
+        walk-forward folds slice the same memory instead of re-reading pandas.
+
+        Returns:
+        tuple[np.ndarray, np.ndarray]: X as C-contiguous float32 (rows x FEATURES), y as int8
+        """
+        if self._X is None:
+            missing = [f for f in self.FEATURES if f not in self.df.columns]
+            if missing:
+                raise ValueError(f"Missing features: {missing}")
+
+            self._X = np.ascontiguousarray(self.df[self.FEATURES].to_numpy(dtype=np.float32))
+            self._y = self.df['Target'].to_numpy(dtype=np.int8)
+        return self._X, self._y
+
     def eda_summary(self):
         """
         Prints basic EDA summaries:
@@ -73,12 +113,29 @@ class StockMlModel:
         print("\nCorrelation matrix:")
         print(self.df[['RSI', 'MACD', 'Volume', 'Target']].corr())
 
-    def visualize_data(self):
+    def visualize_data(self, output_dir=None):
         """
         Display EDA visualizations:
         - Histogram of RSI
         - Scatter plot of MACD vs RSI with target as hue
+
+        Parameters:
+        output_dir (str, optional): Write the charts to a PNG in this
+            directory instead of displaying them. Needs no display, and the
+            scatter becomes a 2-D histogram per target class so the file
+            stays the same size however many rows there are.
+
+        Returns:
+        str or None: Path of the PNG when output_dir is given
         """
+        if output_dir is not None:
+            from .reporting import ReportWriter
+
+            return ReportWriter(output_dir).feature_chart(self.df, "features.png")
+
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.histplot(self.df['RSI'], kde=True)
         plt.title("RSI Distribution")
         plt.show()
@@ -89,19 +146,20 @@ class StockMlModel:
 
     def train_and_evaluate(self):
         """
-        Splits the data into training and test sets, trains a Logistic Regression model,
-        and evaluates performance using accuracy, classification report, and confusion matrix.
+        Splits the data chronologically into training (first 80%) and test (last 20%)
+        sets, trains a Logistic Regression model, and evaluates performance using
+        accuracy, classification report, and confusion matrix.
+
+        The split is not shuffled, so the model never trains on bars that come
+        after the ones it is tested on.
         """
-        features = ['RSI', 'MACD', 'Volume']
-        missing = [f for f in features if f not in self.df.columns]
-        if missing:
-            raise ValueError(f"Missing features: {missing}")
+        from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+        from sklearn.model_selection import train_test_split
 
-        X = self.df[features]
-        y = self.df['Target']
+        X, y = self.feature_matrix()
 
         # Train-test split
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, shuffle=False)
 
         # Train model
         self.model.fit(X_train, y_train)
@@ -119,10 +177,130 @@ class StockMlModel:
         print("\nConfusion Matrix:")
         print(confusion_matrix(y_test, predictions))
 
+    def save(self, path: str):
+        """
+        Save the trained model as a versioned artifact for BatchScorer.
+
+        Parameters:
+        path (str): Destination file, e.g. "models/stock_ml_model.joblib"
+        """
+        dates = self.df['date'] if 'date' in self.df.columns else None
+        save_model(
+            self.model, path, self.FEATURES,
+            trained_rows=len(self.df),
+            train_start=str(dates.iloc[0]) if dates is not None and len(dates) else None,
+            train_end=str(dates.iloc[-1]) if dates is not None and len(dates) else None,
+        )
+        print(f"Model saved to {path}")
+
+    def walk_forward(self, n_splits=5, window="expanding", train_size=None, test_size=None,
+                     gap=0, n_jobs=-1) -> pd.DataFrame:
+        """
+        Walk-forward evaluation: retrain on past bars, test on the following block.
+
+        Folds are fitted in parallel with joblib. Each fold reads a contiguous
+        slice of the cached float32 feature matrix, so no per-fold copy is made.
+
+        Parameters:
+        n_splits (int): Number of train/test folds
+        window (str): "expanding" (train from the first bar) or "rolling"
+            (train on the last `train_size` bars only)
+        train_size (int, optional): Training bars per fold; required for "rolling"
+        test_size (int, optional): Test bars per fold; defaults to len / (n_splits + 1)
+        gap (int): Bars skipped between train and test to avoid target overlap
+        n_jobs (int): joblib workers; -1 uses all cores
+
+        Returns:
+        pd.DataFrame: One row per fold with date ranges, metrics and timings
+        """
+        from joblib import Parallel, delayed
+        from sklearn.base import clone
+        from sklearn.model_selection import TimeSeriesSplit
+
+        if window not in ("expanding", "rolling"):
+            raise ValueError(f"Unknown window type: {window}")
+        if window == "rolling" and not train_size:
+            raise ValueError("train_size is required for a rolling window.")
+
+        X, y = self.feature_matrix()
+        splitter = TimeSeriesSplit(
+            n_splits=n_splits,
+            max_train_size=train_size if window == "rolling" else None,
+            test_size=test_size,
+            gap=gap,
+        )
+        # TimeSeriesSplit folds are contiguous, so they can be slices (views)
+        folds = [
+            (slice(train[0], train[-1] + 1), slice(test[0], test[-1] + 1))
+            for train, test in splitter.split(X)
+        ]
+
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_fit_fold)(clone(self.model), X, y, train, test) for train, test in folds
+        )
+
+        dates = self.df['date'].to_numpy() if 'date' in self.df.columns else np.arange(len(X))
+        report = pd.DataFrame([
+            {
+                "Fold": i + 1,
+                "Train Start": dates[train.start],
+                "Train End": dates[train.stop - 1],
+                "Test Start": dates[test.start],
+                "Test End": dates[test.stop - 1],
+                "Train Rows": train.stop - train.start,
+                "Test Rows": test.stop - test.start,
+                **metrics,
+            }
+            for i, ((train, test), metrics) in enumerate(zip(folds, results))
+        ])
+
+        print(f"\nWalk-forward ({window}, {n_splits} folds) mean accuracy: "
+              f"{report['Accuracy'].mean() * 100:.2f}%")
+        return report
+
+
+def _fit_fold(model, X, y, train: slice, test: slice) -> dict:
+    """
+    Fit and score one walk-forward fold.
+
+    Parameters:
+    model: Unfitted estimator
+    X (np.ndarray): Full feature matrix
+    y (np.ndarray): Full target vector
+    train (slice): Training rows
+    test (slice): Test rows
+
+    Returns:
+    dict: Accuracy, precision, recall and fit/predict timings
+    """
+    from sklearn.metrics import accuracy_score, precision_score, recall_score
+
+    X_train, y_train, X_test, y_test = X[train], y[train], X[test], y[test]
+    if len(np.unique(y_train)) < 2:
+        # A single-class window cannot be fitted
+        return {"Accuracy": np.nan, "Precision": np.nan, "Recall": np.nan,
+                "Fit Seconds": 0.0, "Predict Seconds": 0.0}
+
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions = model.predict(X_test)
+    predict_seconds = time.perf_counter() - start
+
+    return {
+        "Accuracy": accuracy_score(y_test, predictions),
+        "Precision": precision_score(y_test, predictions, zero_division=0),
+        "Recall": recall_score(y_test, predictions, zero_division=0),
+        "Fit Seconds": fit_seconds,
+        "Predict Seconds": predict_seconds,
+    }
+
 
 # Example usage
 if __name__ == "__main__":
-    from data_fetcher import DataFetcherFactory
+    from .data_fetcher import DataFetcherFactory
 
     print("\nFetching data for ML model...")
     fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
@@ -136,3 +314,4 @@ if __name__ == "__main__":
         model.eda_summary()
         # model.visualize_data()  # Uncomment to visualize
         model.train_and_evaluate()
+        print(model.walk_forward(n_splits=10, window="expanding"))
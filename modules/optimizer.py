@@ -0,0 +1,178 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .indicators import rsi, sma
+
+
+class StrategyOptimizer:
+    """
+    Grid search over the RSI + MA crossover parameters.
+
+    Every distinct rolling window is computed once per symbol and reused across
+    grid points. For each (RSI window, fast MA, slow MA) combination, all
+    oversold thresholds and holding periods are scored together with a few
+    matrix products instead of one TradingStrategy per grid point.
+
+    Attributes:
+    frames (dict[str, pd.DataFrame]): Symbol -> frame with a 'Close' column
+    """
+
+    def __init__(self, frames):
+        """
+        Parameters:
+        frames (pd.DataFrame or dict[str, pd.DataFrame]): One price frame,
+            or a mapping of symbol -> price frame
+        """
+        if isinstance(frames, pd.DataFrame):
+            frames = {"": frames}
+        self.frames = {symbol: df for symbol, df in frames.items() if not df.empty}
+
+    def run(self, rsi_windows=(14,), oversold=(30,), fast_windows=(20,), slow_windows=(50,),
+            holding_periods=(5,), rank_by="Total P&L", by_symbol=False) -> pd.DataFrame:
+        """
+        Evaluate every parameter combination and rank the results.
+
+        Combinations with fast window >= slow window are skipped.
+
+        Parameters:
+        rsi_windows (iterable of int): RSI lookback windows
+        oversold (iterable of float): RSI oversold thresholds
+        fast_windows (iterable of int): Fast MA windows
+        slow_windows (iterable of int): Slow MA windows
+        holding_periods (iterable of int): Bars to hold each trade
+        rank_by (str): Result column to sort by, descending
+        by_symbol (bool): Keep one row per symbol instead of pooling the universe
+
+        Returns:
+        pd.DataFrame: One row per grid point with Total Trades, Win Ratio and Total P&L
+        """
+        thresholds = np.asarray(sorted(set(oversold)), dtype=float)
+        periods = np.asarray(sorted(set(holding_periods)), dtype=np.intp)
+        windows = [
+            (r, f, s)
+            for r, f, s in itertools.product(sorted(set(rsi_windows)), sorted(set(fast_windows)),
+                                             sorted(set(slow_windows)))
+            if f < s
+        ]
+
+        results = []
+        for symbol, df in self.frames.items():
+            trades, wins, pnl = self._score_symbol(df['Close'].to_numpy(dtype=float), windows,
+                                                   thresholds, periods)
+            results.append((symbol, trades, wins, pnl))
+
+        if by_symbol:
+            table = pd.concat(
+                [self._to_frame(windows, thresholds, periods, t, w, p).assign(Symbol=symbol)
+                 for symbol, t, w, p in results],
+                ignore_index=True,
+            ) if results else pd.DataFrame()
+        else:
+            shape = (len(windows), len(thresholds), len(periods))
+            trades = sum((r[1] for r in results), np.zeros(shape))
+            wins = sum((r[2] for r in results), np.zeros(shape))
+            pnl = sum((r[3] for r in results), np.zeros(shape))
+            table = self._to_frame(windows, thresholds, periods, trades, wins, pnl)
+
+        if table.empty:
+            return table
+        return table.sort_values(rank_by, ascending=False, ignore_index=True, na_position="last")
+
+    @staticmethod
+    def _score_symbol(close: np.ndarray, windows, thresholds, periods):
+        """
+        Score all grid points for one symbol.
+
+        Returns:
+        tuple[np.ndarray]: Trade counts, win counts and P&L, each shaped
+            (window combinations, thresholds, holding periods)
+        """
+        n = len(close)
+        series = pd.Series(close)
+        rsi_cache, sma_cache, cross_cache = {}, {}, {}
+
+        def cached_sma(window):
+            if window not in sma_cache:
+                sma_cache[window] = sma(series, window).to_numpy()
+            return sma_cache[window]
+
+        # Forward P&L for every bar and holding period, computed like the trade
+        # log: wins from the raw difference, P&L rounded to the paisa; bars
+        # whose exit falls past the end count as no trade
+        exit_idx = np.arange(n)[None, :] + periods[:, None]
+        valid = exit_idx < n
+        profit = np.zeros((len(periods), n))
+        profit[valid] = close[exit_idx[valid]] - np.broadcast_to(close, valid.shape)[valid]
+        won = (profit > 0).astype(float)
+        profit = np.round(profit, 2)
+        valid = valid.astype(float)
+
+        shape = (len(windows), len(thresholds), len(periods))
+        trades, wins, pnl = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+
+        for k, (rsi_window, fast, slow) in enumerate(windows):
+            if rsi_window not in rsi_cache:
+                rsi_cache[rsi_window] = rsi(series, rsi_window).to_numpy()
+            if (fast, slow) not in cross_cache:
+                fast_ma, slow_ma = cached_sma(fast), cached_sma(slow)
+                cross = np.zeros(n, dtype=bool)
+                cross[1:] = (fast_ma[:-1] < slow_ma[:-1]) & (fast_ma[1:] > slow_ma[1:])
+                cross_cache[(fast, slow)] = cross
+
+            # (thresholds, bars) signal matrix, same rule as buy_signal_mask
+            signals = (rsi_cache[rsi_window][None, :] < thresholds[:, None]) & cross_cache[(fast, slow)]
+            signals[:, 0] = False
+            signals = signals.astype(float)
+
+            trades[k] = signals @ valid.T
+            wins[k] = signals @ won.T
+            pnl[k] = signals @ profit.T
+
+        return trades, wins, pnl
+
+    @staticmethod
+    def _to_frame(windows, thresholds, periods, trades, wins, pnl) -> pd.DataFrame:
+        """
+        Flatten the score cubes into a results table.
+        """
+        if not windows:
+            return pd.DataFrame()
+
+        grid = np.array(windows)
+        k, t, h = np.meshgrid(np.arange(len(windows)), np.arange(len(thresholds)),
+                              np.arange(len(periods)), indexing="ij")
+        k, t, h = k.ravel(), t.ravel(), h.ravel()
+        trades, wins, pnl = trades.ravel(), wins.ravel(), pnl.ravel()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            win_ratio = np.where(trades > 0, wins / trades, np.nan)
+
+        return pd.DataFrame({
+            "RSI Window": grid[k, 0],
+            "Oversold": thresholds[t],
+            "Fast MA": grid[k, 1],
+            "Slow MA": grid[k, 2],
+            "Holding Period": periods[h],
+            "Total Trades": trades.astype(np.int64),
+            "Win Ratio": win_ratio,
+            "Total P&L": np.round(pnl, 2),
+        })
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    frames = fetcher.get_daily_data_batch(["RELIANCE.BSE", "TCS.BSE"], outputsize="full")
+
+    table = StrategyOptimizer(frames).run(
+        rsi_windows=range(7, 22, 7),
+        oversold=range(20, 45, 5),
+        fast_windows=(5, 10, 20),
+        slow_windows=(30, 50, 100),
+        holding_periods=range(1, 31),
+    )
+    print(table.head(20))
@@ -0,0 +1,254 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from .strategy import TradingStrategy
+
+
+class PortfolioResult:
+    """
+    Output of PortfolioBacktester.run.
+
+    Attributes:
+    trades (pd.DataFrame): One row per closed trade
+    equity (pd.DataFrame): Cash, position value, equity and drawdown per timestamp
+    stats (dict): Summary statistics (returns, drawdown, Sharpe, trade counts)
+    """
+
+    def __init__(self, trades: pd.DataFrame, equity: pd.DataFrame, stats: dict):
+        self.trades = trades
+        self.equity = equity
+        self.stats = stats
+
+    def __repr__(self):
+        return "PortfolioResult(" + ", ".join(f"{k}={v:.4g}" for k, v in self.stats.items()) + ")"
+
+
+class PortfolioBacktester:
+    """
+    Event-driven backtest of the RSI + MA strategy on one shared capital pool.
+
+    Bars from every symbol are merged into a single time-ordered stream.
+    Each bar first checks the open position in that symbol for stop-loss,
+    take-profit or time exits, then acts on a BUY signal from TradingStrategy
+    if cash and the position limit allow. Fills include
+    slippage and a proportional commission; positions are marked to market on
+    every bar, giving an equity curve with drawdowns.
+
+    Attributes:
+    initial_cash (float): Starting capital
+    position_size (float): Fraction of current equity committed per entry
+    max_positions (int): Maximum simultaneous open positions
+    commission (float): Commission as a fraction of traded value, per side
+    slippage (float): Adverse price move as a fraction of price, per side
+    stop_loss (float, optional): Exit when price falls this fraction below entry
+    take_profit (float, optional): Exit when price rises this fraction above entry
+    holding_period (int, optional): Exit at the close this many bars after entry
+    """
+
+    def __init__(self, frames: dict, initial_cash=1_000_000.0, position_size=0.05, max_positions=20,
+                 commission=0.0003, slippage=0.0005, stop_loss=0.05, take_profit=0.10,
+                 holding_period=5, periods_per_year=252, **strategy_params):
+        """
+        Parameters:
+        frames (dict[str, pd.DataFrame]): Symbol -> OHLCV frame, oldest first
+        periods_per_year (int): Bars per year, used to annualize returns and Sharpe
+        **strategy_params: Passed to TradingStrategy (rsi_window, oversold, ...)
+        """
+        self.frames = {symbol: df for symbol, df in frames.items() if not df.empty}
+        self.initial_cash = initial_cash
+        self.position_size = position_size
+        self.max_positions = max_positions
+        self.commission = commission
+        self.slippage = slippage
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.holding_period = holding_period
+        self.periods_per_year = periods_per_year
+        self.strategy_params = strategy_params
+
+    def run(self) -> PortfolioResult:
+        """
+        Generate signals for every symbol and simulate the portfolio.
+
+        Returns:
+        PortfolioResult: Trades, equity curve and summary statistics
+        """
+        symbols = list(self.frames)
+        series = [self._series(self.frames[symbol]) for symbol in symbols]
+
+        # Plain lists: scalar indexing is several times faster than on ndarrays
+        opens, highs, lows, closes, signals = zip(*[
+            (s['open'], s['high'], s['low'], s['close'], s['signal']) for s in series
+        ]) if series else ((), (), (), (), ())
+        stream = _merge_streams([s['ts'] for s in series])
+
+        buy_cost = (1 + self.slippage) * (1 + self.commission)
+        sell_yield = (1 - self.slippage) * (1 - self.commission)
+        stop = self.stop_loss
+        target = self.take_profit
+        horizon = self.holding_period
+
+        cash = float(self.initial_cash)
+        position_value = 0.0
+        positions = {}  # sid -> [shares, entry_price, entry_index, entry_ts, entry_cost]
+        last_close = [math.nan] * len(series)
+        trades = []
+        curve_ts, curve_cash, curve_value = [], [], []
+        current_ts = None
+
+        for ts, sid, i in stream:
+            if ts != current_ts:
+                if current_ts is not None:
+                    curve_ts.append(current_ts)
+                    curve_cash.append(cash)
+                    curve_value.append(position_value)
+                current_ts = ts
+
+            close = closes[sid][i]
+            position = positions.get(sid)
+
+            if position is not None:
+                shares, entry_price, entry_i = position[0], position[1], position[2]
+                position_value += shares * (close - last_close[sid])
+
+                exit_price = None
+                if stop is not None and lows[sid][i] <= entry_price * (1 - stop):
+                    # Gaps through the stop fill at the open, not the stop price
+                    exit_price, reason = min(opens[sid][i], entry_price * (1 - stop)), "Stop Loss"
+                elif target is not None and highs[sid][i] >= entry_price * (1 + target):
+                    exit_price, reason = max(opens[sid][i], entry_price * (1 + target)), "Take Profit"
+                elif horizon is not None and i - entry_i >= horizon:
+                    exit_price, reason = close, "Time Exit"
+
+                if exit_price is not None:
+                    proceeds = shares * exit_price * sell_yield
+                    cash += proceeds
+                    position_value -= shares * close
+                    del positions[sid]
+                    trades.append((sid, position[3], entry_price, shares, ts, exit_price,
+                                   reason, proceeds - position[4]))
+
+            elif signals[sid][i] and len(positions) < self.max_positions:
+                equity = cash + position_value
+                shares = math.floor(equity * self.position_size / (close * buy_cost))
+                cost = shares * close * buy_cost
+                if shares > 0 and cost <= cash:
+                    cash -= cost
+                    position_value += shares * close
+                    positions[sid] = [shares, close, i, ts, cost]
+
+            last_close[sid] = close
+
+        if current_ts is not None:
+            curve_ts.append(current_ts)
+            curve_cash.append(cash)
+            curve_value.append(position_value)
+
+        equity = self._equity_frame(curve_ts, curve_cash, curve_value)
+        trade_log = self._trade_frame(symbols, trades)
+        open_positions = {symbols[sid]: position[0] for sid, position in positions.items()}
+        return PortfolioResult(trade_log, equity, self._stats(equity, trade_log, open_positions))
+
+    def _series(self, df: pd.DataFrame) -> dict:
+        """
+        Per-symbol bar arrays plus the BUY mask from TradingStrategy.
+        """
+        strategy = TradingStrategy(df, **self.strategy_params)
+        strategy.generate_signals()
+
+        close = df['Close'].to_numpy(dtype=float)
+        signal = np.zeros(len(df), dtype=bool)
+        signal[strategy.signal_idx] = True
+        return {
+            'ts': np.asarray(df['date'], dtype='datetime64[ns]').view(np.int64),
+            'open': df['Open'].to_numpy(dtype=float).tolist() if 'Open' in df else close.tolist(),
+            'high': df['High'].to_numpy(dtype=float).tolist() if 'High' in df else close.tolist(),
+            'low': df['Low'].to_numpy(dtype=float).tolist() if 'Low' in df else close.tolist(),
+            'close': close.tolist(),
+            'signal': signal.tolist(),
+        }
+
+    @staticmethod
+    def _equity_frame(ts, cash, value) -> pd.DataFrame:
+        equity = np.asarray(cash) + np.asarray(value)
+        peak = np.maximum.accumulate(equity) if len(equity) else equity
+        return pd.DataFrame({
+            "date": np.asarray(ts, dtype=np.int64).view('datetime64[ns]'),
+            "Cash": np.round(cash, 2),
+            "Positions Value": np.round(value, 2),
+            "Equity": np.round(equity, 2),
+            "Drawdown": equity / peak - 1 if len(equity) else equity,
+        })
+
+    @staticmethod
+    def _trade_frame(symbols, trades) -> pd.DataFrame:
+        columns = ["Symbol", "Buy Date", "Buy Price", "Shares", "Sell Date", "Sell Price",
+                   "Exit Reason", "Profit ₹", "Result"]
+        if not trades:
+            return pd.DataFrame(columns=columns)
+
+        sid, buy_ts, buy_price, shares, sell_ts, sell_price, reason, profit = map(np.asarray, zip(*trades))
+        return pd.DataFrame({
+            "Symbol": np.asarray(symbols, dtype=object)[sid],
+            "Buy Date": buy_ts.astype(np.int64).view('datetime64[ns]'),
+            "Buy Price": np.round(buy_price, 2),
+            "Shares": shares,
+            "Sell Date": sell_ts.astype(np.int64).view('datetime64[ns]'),
+            "Sell Price": np.round(sell_price, 2),
+            "Exit Reason": reason,
+            "Profit ₹": np.round(profit, 2),
+            "Result": np.where(profit > 0, "Win", "Loss"),
+        })
+
+    def _stats(self, equity: pd.DataFrame, trades: pd.DataFrame, open_positions: dict) -> dict:
+        curve = equity["Equity"].to_numpy(dtype=float)
+        final = curve[-1] if len(curve) else self.initial_cash
+        returns = np.diff(curve) / curve[:-1] if len(curve) > 1 else np.empty(0)
+        years = len(curve) / self.periods_per_year
+
+        volatility = returns.std() if len(returns) > 1 else 0.0
+        return {
+            "Final Equity": final,
+            "Total Return": final / self.initial_cash - 1,
+            "CAGR": (final / self.initial_cash) ** (1 / years) - 1 if years > 0 and final > 0 else math.nan,
+            "Max Drawdown": equity["Drawdown"].min() if len(curve) else 0.0,
+            "Sharpe": returns.mean() / volatility * math.sqrt(self.periods_per_year) if volatility > 0 else math.nan,
+            "Total Trades": len(trades),
+            "Win Ratio": (trades["Result"] == "Win").mean() if len(trades) else math.nan,
+            "Open Positions": len(open_positions),
+        }
+
+
+def _merge_streams(timestamps) -> zip:
+    """
+    K-way merge of per-symbol timestamp arrays into one (ts, symbol id, bar index) stream.
+
+    A stable sort of the concatenated runs is a k-way merge done in C (timsort
+    merges the pre-sorted runs), several times faster than heapq.merge over
+    Python tuples; ties keep symbol order.
+    """
+    if not timestamps:
+        return zip()
+    lengths = [len(ts) for ts in timestamps]
+    ts = np.concatenate(timestamps)
+    sid = np.repeat(np.arange(len(timestamps)), lengths)
+    index = np.concatenate([np.arange(n) for n in lengths])
+
+    order = np.argsort(ts, kind='stable')
+    return zip(ts[order].tolist(), sid[order].tolist(), index[order].tolist())
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    symbols = ["RELIANCE.BSE", "TCS.BSE", "INFY.BSE"]
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    frames = fetcher.get_daily_data_batch(symbols, outputsize="full")
+
+    result = PortfolioBacktester(frames, initial_cash=1_000_000, position_size=0.1).run()
+    print(result)
+    print(result.trades.tail())
+    print(result.equity.tail())
@@ -0,0 +1,79 @@
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for client-side API rate limiting.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Each call takes one token and blocks until one is available.
+
+    Attributes:
+    rate (float): Tokens added per second
+    capacity (float): Maximum burst size
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, clock=time.monotonic, sleep=time.sleep):
+        """
+        Parameters:
+        rate (float): Tokens added per second
+        capacity (float): Maximum number of tokens that can accumulate
+        clock (callable): Monotonic time source; injectable for tests
+        sleep (callable): Sleep function; injectable for tests
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls: float, burst: float = 1) -> "TokenBucket":
+        """
+        Build a bucket from a provider quota expressed in calls per minute.
+        """
+        return cls(rate=calls / 60.0, capacity=burst)
+
+    def acquire(self):
+        """
+        Take one token, waiting until the bucket has refilled enough.
+        """
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """
+        Drain the bucket so no call is made for `seconds`, e.g. after a 429.
+        """
+        with self._lock:
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+            self._updated = self.clock()
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Parameters:
+    attempt (int): Zero-based retry attempt
+    base (float): Delay scale in seconds
+    cap (float): Upper bound on the delay in seconds
+
+    Returns:
+    float: Seconds to sleep before the next attempt
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,343 @@
+import base64
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import metrics
+from .strategy import TradingStrategy
+
+# matplotlib is imported inside the render functions, and only its Figure and
+# Agg canvas: no pyplot, no GUI backend, no display needed
+
+# Points kept per line series; rendering cost and PNG size stop growing past this
+DEFAULT_MAX_POINTS = 2_000
+
+# Bins per axis of the 2-D histograms that replace scatter plots
+DEFAULT_BINS = 60
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ccc; padding: 0.25em 0.6em; text-align: right; }}
+img {{ max-width: 100%; }}
+</style></head>
+<body>
+<h1>{title}</h1>
+{body}
+</body></html>
+"""
+
+
+def lttb(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of n_out - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. Peaks, troughs
+    and the overall shape survive, unlike plain striding.
+
+    Parameters:
+    x (array-like): Ascending x values (e.g. int64 timestamps)
+    y (array-like): Values, without NaN
+    n_out (int): Number of points to keep
+
+    Returns:
+    np.ndarray: Indices of the kept points, ascending
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket i spans [edges[i], edges[i + 1]); the "next bucket" of the last
+    # one is the final point itself
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    sizes = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / sizes, y[-1])
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - mean_x[i + 1]) * (y[lo:hi] - y[a]) -
+            (x[a] - x[lo:hi]) * (mean_y[i + 1] - y[a])
+        )
+        a = lo + int(area.argmax())
+        kept[i + 1] = a
+    return kept
+
+
+def downsample(dates, values, max_points=DEFAULT_MAX_POINTS):
+    """
+    LTTB-downsample a dated series, dropping NaN first.
+
+    Returns:
+    tuple: (datetime64[ns] dates, float values), at most `max_points` long
+    """
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    dates, values = dates[valid], values[valid]
+    kept = lttb(dates.view(np.int64), values, max_points)
+    return dates[kept], values[kept]
+
+
+class ReportWriter:
+    """
+    Renders strategy, equity and feature charts to PNG, and per-symbol
+    HTML reports embedding them, without a display.
+
+    Line series are LTTB-downsampled to `max_points` and scatters are
+    replaced by fixed-size 2-D histograms, so render time and file size
+    stay flat however long the history is.
+
+    Attributes:
+    output_dir (str): Directory receiving the files
+    max_points (int): Points kept per line series
+    bins (int): Bins per axis of 2-D histograms
+    dpi (int): PNG resolution
+    """
+
+    def __init__(self, output_dir: str, max_points=DEFAULT_MAX_POINTS, bins=DEFAULT_BINS, dpi=100):
+        """
+        Parameters:
+        output_dir (str): Output directory, created if missing
+        max_points (int): Points kept per line series
+        bins (int): Bins per axis of 2-D histograms
+        dpi (int): PNG resolution
+        """
+        self.output_dir = os.path.abspath(output_dir)
+        self.max_points = max_points
+        self.bins = bins
+        self.dpi = dpi
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def indicator_chart(self, strategy: TradingStrategy, filename: str) -> str:
+        """
+        Close with both moving averages and BUY markers, above RSI with the
+        oversold line.
+
+        Parameters:
+        strategy (TradingStrategy): Strategy; signals are generated if needed
+        filename (str): PNG name inside output_dir
+
+        Returns:
+        str: Path of the PNG
+        """
+        if 'RSI' not in strategy.df:
+            strategy.generate_signals()
+        df = strategy.df
+        dates = df['date'].to_numpy()
+
+        fig = _figure(2, height_ratios=[3, 1])
+        price, osc = fig.axes
+        for col, style in [('Close', dict(color='black', lw=0.8)),
+                           (strategy.fast_col, dict(color='tab:blue', lw=0.8)),
+                           (strategy.slow_col, dict(color='tab:orange', lw=0.8))]:
+            price.plot(*downsample(dates, df[col].to_numpy(), self.max_points), label=col, **style)
+
+        buys = strategy.signal_idx
+        price.scatter(dates[buys], df['Close'].to_numpy()[buys], marker='^', color='tab:green',
+                      s=30, zorder=3, label='BUY')
+        price.set_title(f"{strategy.symbol or 'Strategy'}: price, moving averages and signals")
+        price.legend(loc='upper left', fontsize='small')
+
+        osc.plot(*downsample(dates, df['RSI'].to_numpy(), self.max_points), color='tab:purple', lw=0.8)
+        osc.axhline(strategy.oversold, color='tab:red', lw=0.8, ls='--')
+        osc.set_ylim(0, 100)
+        osc.set_ylabel('RSI')
+        return self._save(fig, filename)
+
+    def equity_chart(self, equity: pd.Series, filename: str, title="Equity") -> str:
+        """
+        Equity curve above its drawdown from the running peak.
+
+        Parameters:
+        equity (pd.Series): Equity (or cumulative P&L) indexed by date
+        filename (str): PNG name inside output_dir
+        title (str): Chart title
+
+        Returns:
+        str: Path of the PNG
+        """
+        values = equity.to_numpy(dtype=float)
+        drawdown = values - np.maximum.accumulate(values)
+        dates = equity.index.to_numpy()
+
+        fig = _figure(2, height_ratios=[3, 1])
+        top, bottom = fig.axes
+        top.plot(*downsample(dates, values, self.max_points), color='tab:blue', lw=0.8)
+        top.set_title(title)
+        d_dates, d_values = downsample(dates, drawdown, self.max_points)
+        bottom.fill_between(d_dates, d_values, 0, color='tab:red', alpha=0.4, lw=0)
+        bottom.set_ylabel('Drawdown')
+        return self._save(fig, filename)
+
+    def feature_chart(self, df: pd.DataFrame, filename: str) -> str:
+        """
+        RSI distribution, and MACD vs RSI as 2-D histograms per target class
+        (the binned form of a scatter with target as hue).
+
+        Parameters:
+        df (pd.DataFrame): Frame with 'RSI', 'MACD' and 'Target' columns
+        filename (str): PNG name inside output_dir
+
+        Returns:
+        str: Path of the PNG
+        """
+        df = df[['RSI', 'MACD', 'Target']].dropna()
+        rsi, macd, target = df['RSI'].to_numpy(), df['MACD'].to_numpy(), df['Target'].to_numpy()
+
+        fig = _figure(3, ncols=True)
+        hist, *density = fig.axes
+        counts, edges = np.histogram(rsi, bins=self.bins, range=(0, 100))
+        hist.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='tab:blue')
+        hist.set_title("RSI Distribution")
+        hist.set_xlabel('RSI')
+
+        # Shared bins so the two classes are directly comparable
+        macd_range = np.nanpercentile(macd, [0.5, 99.5]) if len(macd) else (-1, 1)
+        for ax, cls in zip(density, (0, 1)):
+            ax.hist2d(macd[target == cls], rsi[target == cls], bins=self.bins,
+                      range=[macd_range, (0, 100)], cmap='viridis', norm='log')
+            ax.set_title(f"MACD vs RSI, Target = {cls}")
+            ax.set_xlabel('MACD')
+            ax.set_ylabel('RSI')
+        return self._save(fig, filename)
+
+    def symbol_report(self, symbol: str, df: pd.DataFrame, holding_period=5, **strategy_params) -> dict:
+        """
+        Backtest one symbol and write its charts and an HTML report.
+
+        Parameters:
+        symbol (str): Stock symbol, used in file names
+        df (pd.DataFrame): OHLCV frame, oldest first
+        holding_period (int): Bars to hold each trade
+        **strategy_params: Passed to TradingStrategy
+
+        Returns:
+        dict: Summary row ('Symbol', 'Total Trades', 'Win Ratio',
+            'Total P&L (₹)') plus 'Report', the HTML path
+        """
+        with metrics.span("render_report", symbol=symbol):
+            name = _safe(symbol)
+            strategy = TradingStrategy(df, **strategy_params)
+            strategy.symbol = strategy.symbol or symbol
+            trades = strategy.backtest_signals(holding_period=holding_period)
+
+            images = [self.indicator_chart(strategy, f"{name}_signals.png")]
+            if not trades.empty:
+                pnl = trades.sort_values('Sell Date').set_index('Sell Date')['Profit ₹'].cumsum()
+                images.append(self.equity_chart(pnl, f"{name}_equity.png", title="Cumulative P&L (₹)"))
+
+            summary = {
+                "Symbol": symbol,
+                "Total Trades": len(trades),
+                "Win Ratio": float((trades["Result"] == "Win").mean()) if len(trades) else 0.0,
+                "Total P&L (₹)": float(trades["Profit ₹"].sum()) if len(trades) else 0.0,
+            }
+            body = [pd.DataFrame([summary]).to_html(index=False, float_format="{:.2f}".format)]
+            body += [f'<p><img src="data:image/png;base64,{_b64(path)}" alt="{os.path.basename(path)}"></p>'
+                     for path in images]
+            if not trades.empty:
+                # The table is capped too, so the report size does not grow with history
+                body.append("<h2>Latest trades</h2>")
+                body.append(trades.tail(20).to_html(index=False, float_format="{:.2f}".format))
+
+            path = os.path.join(self.output_dir, f"{name}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(HTML_TEMPLATE.format(title=html.escape(symbol), body="\n".join(body)))
+        return {**summary, "Report": path}
+
+    def _save(self, fig, filename: str) -> str:
+        path = os.path.join(self.output_dir, filename)
+        fig.savefig(path, dpi=self.dpi)
+        return path
+
+
+def render_universe(frames: dict, output_dir: str, max_workers=None, holding_period=5,
+                    **strategy_params) -> pd.DataFrame:
+    """
+    Write a report per symbol in parallel, plus an index.html ranking them.
+
+    Parameters:
+    frames (dict[str, pd.DataFrame]): Symbol -> OHLCV frame
+    output_dir (str): Output directory
+    max_workers (int, optional): Worker processes; defaults to the CPU count
+    holding_period (int): Bars to hold each trade
+    **strategy_params: Passed to TradingStrategy
+
+    Returns:
+    pd.DataFrame: One summary row per symbol with the report path, by P&L
+    """
+    output_dir = os.path.abspath(output_dir)
+    jobs = [(symbol, df, output_dir, holding_period, strategy_params)
+            for symbol, df in frames.items() if not df.empty]
+
+    with metrics.span("render_universe") as span:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as pool:
+            rows = list(pool.map(_render_worker, jobs))
+        span.set(symbols=len(rows))
+
+    summary = pd.DataFrame(rows, columns=["Symbol", "Total Trades", "Win Ratio", "Total P&L (₹)", "Report"])
+    summary = summary.sort_values("Total P&L (₹)", ascending=False, ignore_index=True)
+
+    index = summary.assign(Report=[f'<a href="{os.path.basename(p)}">report</a>' for p in summary["Report"]])
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(HTML_TEMPLATE.format(
+            title="Universe report",
+            body=index.to_html(index=False, escape=False, float_format="{:.2f}".format),
+        ))
+    return summary
+
+
+def _render_worker(job) -> dict:
+    symbol, df, output_dir, holding_period, strategy_params = job
+    return ReportWriter(output_dir).symbol_report(symbol, df, holding_period, **strategy_params)
+
+
+def _figure(n_axes: int, ncols=False, height_ratios=None):
+    """
+    A display-free figure with `n_axes` axes stacked (or side by side).
+    """
+    from matplotlib.figure import Figure
+
+    if ncols:
+        fig = Figure(figsize=(5 * n_axes, 4), layout='constrained')
+        fig.subplots(1, n_axes)
+    else:
+        fig = Figure(figsize=(12, 6), layout='constrained')
+        fig.subplots(n_axes, 1, sharex=True, gridspec_kw={'height_ratios': height_ratios})
+    return fig
+
+
+def _safe(symbol: str) -> str:
+    return "".join(c if c.isalnum() or c in "._-" else "_" for c in symbol)
+
+
+def _b64(path: str) -> str:
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode("ascii")
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    symbols = ["RELIANCE.BSE", "TCS.BSE", "INFY.BSE"]
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    frames = fetcher.get_daily_data_batch(symbols, outputsize="full")
+
+    # python -m modules.reporting; open reports/index.html
+    print(render_universe(frames, "reports"))
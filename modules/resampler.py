@@ -0,0 +1,465 @@
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .bars import COMPACT_ROWS, Bars, empty_bars
+from .data_fetcher import StockDataFetcher
+from .instrumentation import metrics
+
+NS_PER_MINUTE = 60 * 10 ** 9
+MINUTES_PER_DAY = 24 * 60
+
+
+def interval_minutes(interval: str) -> int:
+    """
+    Width of a bar interval in minutes: "daily" or "<n>min" (e.g. "15min").
+
+    Raises:
+    ValueError: If the interval is not recognised
+    """
+    if interval == "daily":
+        return MINUTES_PER_DAY
+    match = re.fullmatch(r"(\d+)min", interval)
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Unknown interval '{interval}', expected 'daily' or e.g. '15min'")
+    return int(match.group(1))
+
+
+def bucket_starts(timestamps: np.ndarray, interval: str, offset_minutes=0) -> np.ndarray:
+    """
+    Label each timestamp with the start of the bucket it falls in.
+
+    Intraday buckets are aligned to midnight shifted by `offset_minutes`
+    (e.g. 15 so hourly bars start at 09:15); daily buckets are calendar days.
+
+    Parameters:
+    timestamps (np.ndarray): int64 epoch nanoseconds
+    interval (str): Target interval
+    offset_minutes (int): Bucket alignment for intraday intervals
+
+    Returns:
+    np.ndarray: int64 bucket start per timestamp
+    """
+    width = interval_minutes(interval) * NS_PER_MINUTE
+    offset = 0 if interval == "daily" else offset_minutes * NS_PER_MINUTE
+    return (timestamps - offset) // width * width + offset
+
+
+def resample_bars(bars: Bars, interval: str, offset_minutes=0) -> Bars:
+    """
+    Aggregate bars to a coarser interval: first open, max high, min low,
+    last close and summed volume per bucket. Each bar is labelled with its
+    bucket start; empty buckets produce no bar.
+
+    Parameters:
+    bars (Bars): Source bars, oldest first
+    interval (str): Target interval
+    offset_minutes (int): Bucket alignment for intraday intervals
+
+    Returns:
+    Bars: Resampled bars
+    """
+    if not len(bars):
+        return bars
+
+    keys = bucket_starts(bars.timestamps, interval, offset_minutes)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    return Bars(
+        keys[starts],
+        bars.open[starts],
+        np.maximum.reduceat(bars.high, starts),
+        np.minimum.reduceat(bars.low, starts),
+        bars.close[ends],
+        np.add.reduceat(bars.volume, starts),
+        symbol=bars.symbol,
+    )
+
+
+class BarResampler:
+    """
+    Base-interval bars for one symbol plus memoized coarser timeframes.
+
+    Timeframes are derived on first request and kept. Each series lives in
+    preallocated arrays that grow geometrically. When new base bars arrive,
+    they are written after the last bar, and each memoized timeframe keeps
+    the buckets that end before the first new bar and rewrites only from
+    there. A live update therefore costs the new bars plus one bucket per
+    timeframe, whatever the length of the history.
+
+    Bars returned by get() are read-only snapshots that later updates never
+    change. They share the arrays until an update would rewrite bars a
+    snapshot covers; that update first copies the series to fresh arrays.
+
+    Not thread-safe; ResampledStockDataFetcher serializes access per symbol.
+
+    Attributes:
+    base_interval (str): Interval of the stored bars, e.g. "5min"
+    offset_minutes (int): Bucket alignment for intraday intervals
+    """
+
+    def __init__(self, bars: Bars, base_interval="5min", offset_minutes=0):
+        """
+        Parameters:
+        bars (Bars): Initial base bars, oldest first
+        base_interval (str): Interval of `bars`
+        offset_minutes (int): Bucket alignment for intraday intervals
+        """
+        self.base_interval = base_interval
+        self.offset_minutes = offset_minutes
+        self.symbol = bars.symbol
+        self._base = _BarBuffer(bars)
+        self._derived = {}
+
+    @property
+    def base(self) -> Bars:
+        """
+        Stored base bars.
+        """
+        return self._base.bars(self.symbol)
+
+    @property
+    def last_date(self):
+        """
+        Date of the latest base bar, or None if there are no bars.
+        """
+        if not len(self._base):
+            return None
+        return self._base.timestamps[-1:].view('datetime64[ns]')[0]
+
+    def get(self, interval: str) -> Bars:
+        """
+        Bars at `interval`, computed once and then served from memory.
+
+        Raises:
+        ValueError: If `interval` is not a whole multiple of the base interval
+        """
+        if interval == self.base_interval:
+            return self.base
+        if interval not in self._derived:
+            self._check(interval)
+            with metrics.span("resample", symbol=self.symbol, interval=interval) as span:
+                self._derived[interval] = _BarBuffer(
+                    resample_bars(self._base.view(), interval, self.offset_minutes))
+                span.set(rows=len(self._derived[interval]))
+        return self._derived[interval].bars(self.symbol)
+
+    def update(self, bars: Bars) -> int:
+        """
+        Merge new base bars (new values win on equal timestamps) and bring
+        memoized timeframes up to date.
+
+        Returns:
+        int: Number of base bars that were added or replaced
+        """
+        added = len(bars)
+        if not added:
+            return 0
+
+        base = self._base.view()
+        # Position of the earliest added or replaced bar; bars before it are untouched
+        changed_from = int(np.searchsorted(base.timestamps, bars.timestamps[0], side='left'))
+        if changed_from < len(base):
+            bars = _merge(_slice(base, changed_from), bars)
+        self._base.write(changed_from, bars)
+        base = self._base.view()
+
+        first_changed = base.timestamps[changed_from]
+        for interval, derived in self._derived.items():
+            bucket = bucket_starts(first_changed, interval, self.offset_minutes)
+            keep = int(np.searchsorted(derived.timestamps, bucket, side='left'))
+            tail_from = int(np.searchsorted(base.timestamps, bucket, side='left'))
+            derived.write(keep, resample_bars(_slice(base, tail_from), interval, self.offset_minutes))
+        return added
+
+    def _check(self, interval: str):
+        base, target = interval_minutes(self.base_interval), interval_minutes(interval)
+        if target < base or target % base:
+            raise ValueError(
+                f"Cannot derive {interval} bars from {self.base_interval} bars; "
+                f"the target must be a whole multiple of the base interval"
+            )
+
+
+class ResampledStockDataFetcher(StockDataFetcher):
+    """
+    Serves every timeframe from one intraday series per symbol.
+
+    The first request for a symbol fetches its base-interval history; all
+    intraday intervals that are multiples of the base, and daily bars, are
+    then resampled locally. After `ttl` seconds the next request tops the
+    base up with one compact fetch, which updates every timeframe at once.
+
+    Daily history only goes back as far as the base series does; use the
+    wrapped fetcher's get_daily_data directly for long daily backtests.
+
+    Attributes:
+    fetcher (StockDataFetcher): Fetcher for the base series (may be cached)
+    base_interval (str): Interval requested from the fetcher
+    offset_minutes (int): Bucket alignment for intraday intervals
+    ttl (float): Seconds before a symbol's base series is refreshed; None never refreshes
+    """
+
+    def __init__(self, fetcher: StockDataFetcher, base_interval="5min", offset_minutes=0,
+                 ttl=60.0, clock=time.time):
+        """
+        Parameters:
+        fetcher (StockDataFetcher): Underlying fetcher
+        base_interval (str): Finest interval to fetch, e.g. "1min" or "5min"
+        offset_minutes (int): Bucket alignment, e.g. 15 for hourly bars from 09:15
+        ttl (float): Refresh interval in seconds; None to never refresh
+        clock (callable): Returns the current epoch time; injectable for tests
+        """
+        interval_minutes(base_interval)
+        self.fetcher = fetcher
+        self.base_interval = base_interval
+        self.offset_minutes = offset_minutes
+        self.ttl = ttl
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._symbols = {}
+
+    def get_daily_data(self, symbol: str, outputsize='compact') -> pd.DataFrame:
+        """
+        Daily bars resampled from the base series.
+
+        Parameters:
+        symbol (str): Stock symbol
+        outputsize (str): "compact" (last 100) or "full"
+
+        Returns:
+        pd.DataFrame: OHLCV frame, oldest first; empty if the base fetch failed
+        """
+        return self._get(symbol, "daily", outputsize)
+
+    def get_intraday_data(self, symbol: str, interval="15min", outputsize="compact") -> pd.DataFrame:
+        """
+        Intraday bars resampled from the base series.
+
+        Parameters:
+        symbol (str): Stock symbol
+        interval (str): Any whole multiple of the base interval
+        outputsize (str): "compact" (last 100) or "full"
+
+        Returns:
+        pd.DataFrame: OHLCV frame, oldest first; empty if the base fetch failed
+        """
+        return self._get(symbol, interval, outputsize)
+
+    def get_bars(self, symbol: str, interval="15min") -> Bars:
+        """
+        Like get_intraday_data, but returns the memoized Bars without a frame.
+        """
+        bars = self._bars(symbol, interval)
+        return bars if bars is not None else Bars.from_frame(empty_bars(), symbol)
+
+    def ingest(self, symbol: str, df: pd.DataFrame) -> int:
+        """
+        Add base-interval bars obtained elsewhere (e.g. a live poll).
+
+        Returns:
+        int: Number of base bars added or replaced
+        """
+        bars = Bars.from_frame(df.sort_values('date'), symbol=symbol)
+        with self._entry(symbol) as entry:
+            if entry["resampler"] is None:
+                entry["resampler"] = BarResampler(bars, self.base_interval, self.offset_minutes)
+                return len(bars)
+            return entry["resampler"].update(bars)
+
+    def refresh(self, symbol: str) -> int:
+        """
+        Top up a symbol's base series with a compact fetch.
+
+        Returns:
+        int: Number of base bars added or replaced
+        """
+        with self._entry(symbol) as entry:
+            return self._refresh(symbol, entry)
+
+    def _get(self, symbol, interval, outputsize) -> pd.DataFrame:
+        bars = self._bars(symbol, interval)
+        if bars is None:
+            return pd.DataFrame()
+        df = bars.to_frame()
+        if outputsize == "compact":
+            df = df.tail(COMPACT_ROWS).reset_index(drop=True)
+            df.attrs['symbol'] = symbol
+        return df
+
+    def _bars(self, symbol: str, interval: str):
+        """
+        The symbol's bars at `interval`, fetching or refreshing its base series
+        as needed; None if there is no data. Runs under the symbol's lock, so
+        it never overlaps an update of the same symbol.
+        """
+        with self._entry(symbol) as entry:
+            if entry["resampler"] is None:
+                df = self._fetch(symbol, "full")
+                if df.empty:
+                    return None
+                entry["resampler"] = BarResampler(
+                    Bars.from_frame(df, symbol=symbol), self.base_interval, self.offset_minutes)
+                entry["fetched_at"] = self.clock()
+            elif self.ttl is not None and self.clock() - entry["fetched_at"] >= self.ttl:
+                self._refresh(symbol, entry)
+            return entry["resampler"].get(interval)
+
+    def _refresh(self, symbol, entry) -> int:
+        resampler = entry["resampler"]
+        fresh = self._fetch(symbol, "compact")
+        if fresh.empty:
+            print(f"[RESAMPLE] refresh failed for {symbol}, serving existing bars")
+            return 0
+        # A compact window that starts after our last bar leaves a gap
+        if resampler is not None and resampler.last_date is not None and \
+                fresh['date'].iloc[0] > resampler.last_date:
+            fresh = self._fetch(symbol, "full")
+            if fresh.empty:
+                return 0
+
+        entry["fetched_at"] = self.clock()
+        bars = Bars.from_frame(fresh, symbol=symbol)
+        if resampler is None:
+            entry["resampler"] = BarResampler(bars, self.base_interval, self.offset_minutes)
+            return len(bars)
+        return resampler.update(bars)
+
+    def _fetch(self, symbol, outputsize) -> pd.DataFrame:
+        return self.fetcher.get_intraday_data(symbol, interval=self.base_interval, outputsize=outputsize)
+
+    def _entry(self, symbol: str):
+        with self._lock:
+            if symbol not in self._symbols:
+                self._symbols[symbol] = _Entry()
+            return self._symbols[symbol]
+
+
+class _Entry(dict):
+    """
+    Per-symbol state; used as a context manager so different symbols can be
+    fetched concurrently while each symbol is fetched at most once.
+    """
+
+    def __init__(self):
+        super().__init__(resampler=None, fetched_at=0.0)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+
+
+class _BarBuffer:
+    """
+    Growable OHLCV arrays with copy-on-write snapshots.
+
+    Bars are written in place, and the arrays are reallocated at twice the
+    size only when they run out of room. Snapshots from bars() share the
+    arrays, so a write into positions a snapshot covers moves the series to
+    fresh arrays first; appending after them never does.
+    """
+
+    FIELDS = ('timestamps', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, bars: Bars):
+        self._arrays = {name: getattr(bars, name).copy() for name in self.FIELDS}
+        self._length = len(bars)
+        self._shared = 0        # Positions of the current arrays that snapshots cover
+        self._snapshot = None   # Last snapshot, reused until the next write
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._arrays['timestamps'][:self._length]
+
+    def view(self) -> Bars:
+        """
+        Bars over the arrays as they are now, for use before the next write.
+        """
+        return Bars(*(self._arrays[name][:self._length] for name in self.FIELDS))
+
+    def bars(self, symbol: str) -> Bars:
+        """
+        Read-only snapshot that later writes leave unchanged.
+        """
+        if self._snapshot is None or self._snapshot.symbol != symbol:
+            self._snapshot = Bars(*(self._arrays[name][:self._length] for name in self.FIELDS), symbol=symbol)
+            self._shared = max(self._shared, self._length)
+        return self._snapshot
+
+    def write(self, start: int, bars: Bars):
+        """
+        Replace everything from position `start` on with `bars`.
+        """
+        end = start + len(bars)
+        # Leading bars equal to the stored ones need no write (e.g. a compact
+        # refresh overlapping the history), so they never force a copy
+        overlap = min(end, self._length) - start
+        if overlap > 0:
+            differs = np.zeros(overlap, dtype=bool)
+            for name in self.FIELDS:
+                differs |= self._arrays[name][start:start + overlap] != getattr(bars, name)[:overlap]
+            same = int(np.argmax(differs)) if differs.any() else overlap
+            bars, start = _slice(bars, same), start + same
+        if start == end:
+            # Nothing new; at most the series got shorter, which no snapshot sees
+            if end != self._length:
+                self._length, self._snapshot = end, None
+            return
+
+        capacity = len(self._arrays['timestamps'])
+        if end > capacity or start < self._shared:
+            capacity = max(end, 2 * capacity, 64) if end > capacity else capacity
+            for name, array in self._arrays.items():
+                fresh = np.empty(capacity, dtype=array.dtype)
+                fresh[:start] = array[:start]
+                self._arrays[name] = fresh
+            self._shared = 0
+        for name, array in self._arrays.items():
+            array[start:end] = getattr(bars, name)
+        self._length = end
+        self._snapshot = None
+
+
+def _slice(bars: Bars, start=0, stop=None) -> Bars:
+    s = slice(start, stop)
+    return Bars(bars.timestamps[s], bars.open[s], bars.high[s], bars.low[s],
+                bars.close[s], bars.volume[s], symbol=bars.symbol)
+
+
+def _merge(old: Bars, new: Bars) -> Bars:
+    """
+    Union of two bar sets, sorted by time; `new` wins on equal timestamps.
+    """
+    merged = Bars(*(np.concatenate([getattr(new, name), getattr(old, name)])
+                    for name in _BarBuffer.FIELDS), symbol=new.symbol or old.symbol)
+    # Stable sort keeps the bar from `new` first among duplicates
+    order = np.argsort(merged.timestamps, kind='stable')
+    ts = merged.timestamps[order]
+    keep = order[np.r_[True, ts[1:] != ts[:-1]]]
+    return Bars(*(getattr(merged, name)[keep]
+                  for name in _BarBuffer.FIELDS), symbol=merged.symbol)
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+    from .strategy import TradingStrategy
+
+    # One 5min download per symbol serves every timeframe below
+    fetcher = ResampledStockDataFetcher(DataFetcherFactory.get_data_fetcher("alpha_vantage"))
+    for interval in ["5min", "15min", "30min", "60min"]:
+        bars = fetcher.get_bars("RELIANCE.BSE", interval)
+        print(interval, len(bars), "bars,", len(TradingStrategy(bars).backtest_signals()), "trades")
+    print(fetcher.get_daily_data("RELIANCE.BSE").tail())
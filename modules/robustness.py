@@ -0,0 +1,254 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import metrics
+
+STATISTICS = ["Total P&L", "Win Ratio", "Max Drawdown", "Sharpe"]
+
+
+class RobustnessResult:
+    """
+    Output of RobustnessAnalyzer.bootstrap and .shuffle.
+
+    Attributes:
+    method (str): "bootstrap" or "shuffle"
+    observed (dict): Statistics of the original sequence
+    samples (dict[str, np.ndarray]): Statistic -> value per resample
+    summary (pd.DataFrame): Observed value, mean, confidence interval and
+        share of resamples at or below zero, one row per statistic
+    """
+
+    def __init__(self, method: str, observed: dict, samples: dict, confidence: float):
+        self.method = method
+        self.observed = observed
+        self.samples = samples
+
+        tail = (1 - confidence) / 2 * 100
+        rows = []
+        for name in STATISTICS:
+            values = samples[name]
+            finite = values[np.isfinite(values)]
+            low, high = np.percentile(finite, [tail, 100 - tail]) if len(finite) else (math.nan, math.nan)
+            rows.append({
+                "Statistic": name,
+                "Observed": observed[name],
+                "Mean": finite.mean() if len(finite) else math.nan,
+                f"CI {confidence:.0%} Low": low,
+                f"CI {confidence:.0%} High": high,
+                "P(<= 0)": (finite <= 0).mean() if len(finite) else math.nan,
+            })
+        self.summary = pd.DataFrame(rows).set_index("Statistic")
+
+    def __repr__(self):
+        return f"RobustnessResult({self.method}, {len(self.samples['Sharpe'])} resamples)\n{self.summary}"
+
+
+class RobustnessAnalyzer:
+    """
+    Monte Carlo robustness checks for a backtest: is the edge real or luck?
+
+    Works on a sequence of per-trade (or per-bar) outcomes and resamples it
+    many times:
+    - bootstrap: draw the sequence with replacement (optionally in blocks,
+      to keep serial dependence), giving intervals for every statistic
+    - shuffle: permute the order, which leaves P&L, win ratio and Sharpe
+      unchanged but shows how much drawdown depended on the trade order
+
+    Resamples are generated as (resamples x sequence) arrays, in chunks
+    sized to `max_bytes`, so tens of thousands of them over a long trade log
+    stay in bounded memory.
+
+    Statistics: total P&L, win ratio, max drawdown (of cumulative P&L,
+    negative) and annualized Sharpe of the per-step returns.
+
+    Attributes:
+    pnl (np.ndarray): P&L per step, in order (₹ per trade, or bar returns)
+    returns (np.ndarray): Return per step, used for Sharpe
+    periods_per_year (float): Steps per year, used to annualize Sharpe
+    max_bytes (int): Memory budget per chunk of resamples
+    """
+
+    def __init__(self, pnl, returns=None, periods_per_year=252, seed=None, max_bytes=64 * 1024 ** 2):
+        """
+        Parameters:
+        pnl (array-like): P&L per step, in order
+        returns (array-like, optional): Return per step; defaults to `pnl`
+        periods_per_year (float): Steps per year
+        seed (int, optional): Seed for reproducible resamples
+        max_bytes (int): Memory budget per chunk of resamples
+        """
+        self.pnl = np.asarray(pnl, dtype=float)
+        self.returns = self.pnl if returns is None else np.asarray(returns, dtype=float)
+        if len(self.returns) != len(self.pnl):
+            raise ValueError("pnl and returns must have the same length")
+        if not len(self.pnl):
+            raise ValueError("Nothing to resample: no trades or returns")
+        self.periods_per_year = periods_per_year
+        self.max_bytes = max_bytes
+        self._rng = np.random.default_rng(seed)
+
+        # Sharpe works on centered returns so its variance has no cancellation error
+        self._center = self.returns.mean()
+        self._centered = self.returns - self._center
+
+    @classmethod
+    def from_trades(cls, trades: pd.DataFrame, periods_per_year=None, **kwargs) -> "RobustnessAnalyzer":
+        """
+        Build from a trade log (TradingStrategy.backtest_signals, or several
+        symbols' logs concatenated), ordered by exit date.
+
+        Parameters:
+        trades (pd.DataFrame): Trade log with 'Buy Date', 'Buy Price',
+            'Sell Date', 'Sell Price' and 'Profit ₹'
+        periods_per_year (float, optional): Trades per year for Sharpe;
+            defaults to the log's own trade frequency
+
+        Raises:
+        ValueError: If the log mixes several holding periods
+        """
+        if "Holding Period" in trades and trades["Holding Period"].nunique() > 1:
+            raise ValueError("Trade log mixes holding periods; analyze one period at a time")
+
+        trades = trades.sort_values("Sell Date", kind="stable")
+        pnl = trades["Profit ₹"].to_numpy(dtype=float)
+        returns = trades["Sell Price"].to_numpy(dtype=float) / trades["Buy Price"].to_numpy(dtype=float) - 1
+
+        if periods_per_year is None:
+            years = (trades["Sell Date"].max() - trades["Buy Date"].min()).days / 365.25 if len(trades) else 0
+            periods_per_year = len(trades) / years if years > 0 else len(trades)
+        return cls(pnl, returns, periods_per_year=periods_per_year, **kwargs)
+
+    @classmethod
+    def from_returns(cls, returns, periods_per_year=252, **kwargs) -> "RobustnessAnalyzer":
+        """
+        Build from per-bar strategy returns (e.g. an equity curve's pct_change).
+
+        P&L and drawdown are then in return units (summed, not compounded).
+        """
+        returns = np.asarray(returns, dtype=float)
+        returns = returns[~np.isnan(returns)]
+        return cls(returns, returns, periods_per_year=periods_per_year, **kwargs)
+
+    def observed(self) -> dict:
+        """
+        Statistics of the original sequence.
+        """
+        return {name: float(values[0]) for name, values in self._statistics(
+            self.pnl[None, :], self._centered[None, :]).items()}
+
+    def bootstrap(self, n_resamples=10_000, block_size=1, confidence=0.95) -> RobustnessResult:
+        """
+        Resample the sequence with replacement.
+
+        Parameters:
+        n_resamples (int): Number of resampled sequences
+        block_size (int): Draw runs of this many consecutive steps (moving
+            block bootstrap); 1 treats steps as independent
+        confidence (float): Confidence level of the reported intervals
+
+        Returns:
+        RobustnessResult: Observed statistics, resample distributions and intervals
+        """
+        n = len(self.pnl)
+        block_size = max(1, min(block_size, n))
+        n_blocks = -(-n // block_size)
+        offsets = np.arange(block_size)
+
+        def resample(size):
+            if block_size == 1:
+                idx = self._rng.integers(0, n, size=(size, n))
+            else:
+                starts = self._rng.integers(0, n - block_size + 1, size=(size, n_blocks))
+                idx = (starts[:, :, None] + offsets).reshape(size, -1)[:, :n]
+            return self._statistics(self.pnl[idx], self._centered[idx])
+
+        return self._run("bootstrap", n_resamples, confidence, resample)
+
+    def shuffle(self, n_resamples=10_000, confidence=0.95) -> RobustnessResult:
+        """
+        Resample the order of the sequence without replacement.
+
+        Only path-dependent statistics (max drawdown) vary; the interval
+        shows the drawdown range the same trades could have produced.
+
+        Parameters:
+        n_resamples (int): Number of permutations
+        confidence (float): Confidence level of the reported intervals
+
+        Returns:
+        RobustnessResult: Observed statistics, resample distributions and intervals
+        """
+        observed = self.observed()
+
+        def resample(size):
+            # Order-independent statistics are the observed ones; permute P&L directly
+            pnl = self._rng.permuted(np.broadcast_to(self.pnl, (size, len(self.pnl))), axis=1)
+            stats = {name: np.full(size, value) for name, value in observed.items()}
+            stats["Max Drawdown"] = _max_drawdown(pnl)
+            return stats
+
+        return self._run("shuffle", n_resamples, confidence, resample)
+
+    def _run(self, method, n_resamples, confidence, resample) -> RobustnessResult:
+        n = len(self.pnl)
+        # Peak use per resample row: the index array plus ~4 float arrays of the same length
+        chunk = max(1, min(n_resamples, self.max_bytes // (n * 8 * 5)))
+
+        with metrics.span("robustness", method=method) as span:
+            parts = {name: [] for name in STATISTICS}
+            for start in range(0, n_resamples, chunk):
+                for name, values in resample(min(chunk, n_resamples - start)).items():
+                    parts[name].append(values)
+            samples = {name: np.concatenate(values) for name, values in parts.items()}
+            span.set(resamples=n_resamples)
+
+        return RobustnessResult(method, self.observed(), samples, confidence)
+
+    def _statistics(self, pnl: np.ndarray, centered: np.ndarray) -> dict:
+        """
+        Statistics of each row of (resamples x steps) arrays of P&L and
+        centered returns.
+        """
+        n = pnl.shape[1]
+        # Variance from a sum and a fused sum of squares: no temporary arrays
+        total = centered.sum(axis=1)
+        squares = np.einsum("ij,ij->i", centered, centered)
+        mean = total / n + self._center
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(np.maximum(squares - total * total / n, 0.0) / (n - 1))
+            sharpe = np.where(std > 0, mean / std * math.sqrt(self.periods_per_year), np.nan)
+
+        return {
+            "Total P&L": pnl.sum(axis=1),
+            "Win Ratio": np.count_nonzero(pnl > 0, axis=1) / n,
+            "Max Drawdown": _max_drawdown(pnl),
+            "Sharpe": sharpe,
+        }
+
+
+def _max_drawdown(pnl: np.ndarray) -> np.ndarray:
+    """
+    Largest fall of cumulative P&L from its running peak, per row (<= 0).
+    """
+    equity = np.cumsum(pnl, axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    # Equity starts at zero, so a losing first trade is already a drawdown
+    np.maximum(peak, 0.0, out=peak)
+    np.subtract(equity, peak, out=equity)
+    return equity.min(axis=1)
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+    from .universe_runner import UniverseBacktester
+
+    symbols = ["RELIANCE.BSE", "TCS.BSE", "INFY.BSE"]
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    trades = UniverseBacktester(fetcher.get_daily_data_batch(symbols, outputsize="full")).run()
+
+    analyzer = RobustnessAnalyzer.from_trades(trades, seed=0)
+    print(analyzer.bootstrap(10_000))
+    print(analyzer.shuffle(10_000))
@@ -0,0 +1,490 @@
+import datetime
+import json
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from .instrumentation import metrics
+from .strategy import TradingStrategy
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+def load_universe(path: str) -> dict:
+    """
+    Read a universe config file.
+
+    Example:
+    {
+        "symbols": ["RELIANCE.BSE", "TCS.BSE"],
+        "source": "alpha_vantage",
+        "source_options": {},
+        "holding_period": 5,
+        "strategy": {"rsi_window": 14, "oversold": 30},
+        "sheet_name": "Stock Signals",
+        "telegram": true,
+        "checkpoint": "state/checkpoint.json",
+        "ledger": "state/ledger.sqlite",
+        "jobs": [
+            {"name": "daily", "series": "daily", "at": "16:15"},
+            {"name": "intraday", "series": "15min", "every_minutes": 15, "between": ["09:15", "15:30"]}
+        ]
+    }
+
+    Returns:
+    dict: Parsed config with defaults filled in
+    """
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+
+    if not config.get("symbols"):
+        raise ValueError(f"No symbols in universe config: {path}")
+    config.setdefault("source", "alpha_vantage")
+    config.setdefault("source_options", {})
+    config.setdefault("holding_period", 5)
+    config.setdefault("strategy", {})
+    config.setdefault("jobs", [{"name": "daily", "series": "daily", "at": "16:15"}])
+    config.setdefault("checkpoint", os.path.join(os.path.dirname(os.path.abspath(path)), "checkpoint.json"))
+    return config
+
+
+class Job:
+    """
+    A scheduled run over the universe for one bar series.
+
+    Daily-style jobs run once per weekday at a fixed local time ("at").
+    Intraday jobs run every `every_minutes`, optionally only inside a
+    trading window ("between").
+
+    Attributes:
+    name (str): Job name, also the checkpoint key
+    series (str): "daily" or an intraday interval such as "15min"
+    outputsize (str): "compact" or "full"
+    """
+
+    def __init__(self, name: str, series="daily", at=None, every_minutes=None, between=None,
+                 outputsize="compact", weekdays_only=True):
+        if (at is None) == (every_minutes is None):
+            raise ValueError(f"Job '{name}' needs exactly one of 'at' or 'every_minutes'")
+        self.name = name
+        self.series = series
+        self.at = _parse_time(at) if at else None
+        self.every = datetime.timedelta(minutes=every_minutes) if every_minutes else None
+        self.between = tuple(_parse_time(t) for t in between) if between else None
+        self.outputsize = outputsize
+        self.weekdays_only = weekdays_only
+
+    def next_slot(self, after: datetime.datetime) -> datetime.datetime:
+        """
+        First scheduled time strictly after `after`.
+        """
+        if self.at is not None:
+            slot = datetime.datetime.combine(after.date(), self.at)
+            if slot <= after:
+                slot += datetime.timedelta(days=1)
+            while self.weekdays_only and slot.weekday() >= 5:
+                slot += datetime.timedelta(days=1)
+            return slot
+
+        midnight = datetime.datetime.combine(after.date(), datetime.time())
+        periods = (after - midnight) // self.every + 1
+        slot = midnight + periods * self.every
+        while not self._in_window(slot):
+            if self.between and slot.time() < self.between[0]:
+                slot = datetime.datetime.combine(slot.date(), self.between[0])
+            else:
+                slot = datetime.datetime.combine(slot.date() + datetime.timedelta(days=1),
+                                                 self.between[0] if self.between else datetime.time())
+        return slot
+
+    def current_slot(self, now: datetime.datetime) -> datetime.datetime:
+        """
+        Latest scheduled time at or before `now`: the slot a run started now belongs to.
+        """
+        for days_back in range(8):
+            day = now.date() - datetime.timedelta(days=days_back)
+            if self.weekdays_only and day.weekday() >= 5:
+                continue
+            latest = min(now, datetime.datetime.combine(day, datetime.time.max))
+            if self.at is not None:
+                slot = datetime.datetime.combine(day, self.at)
+            else:
+                if self.between:
+                    latest = min(latest, datetime.datetime.combine(day, self.between[1]))
+                midnight = datetime.datetime.combine(day, datetime.time())
+                slot = midnight + (latest - midnight) // self.every * self.every
+                if self.between and slot.time() < self.between[0]:
+                    slot = datetime.datetime.combine(day, self.between[0])
+            if slot <= latest:
+                return slot
+        return now.replace(second=0, microsecond=0)
+
+    def _in_window(self, slot: datetime.datetime) -> bool:
+        if self.weekdays_only and slot.weekday() >= 5:
+            return False
+        if self.between:
+            return self.between[0] <= slot.time() <= self.between[1]
+        return True
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Job":
+        return cls(**config)
+
+
+class Checkpoint:
+    """
+    Progress of each job's current run: its slot, finished symbols and their
+    summary rows, and whether the run completed.
+
+    Written atomically after every sink flush, so a restart resumes an
+    interrupted run and skips symbols whose results already reached the sinks.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._state = {}
+
+    def done(self, job: str, slot: datetime.datetime) -> dict:
+        """
+        Summary rows of the symbols already finished in this run, keyed by symbol.
+        """
+        with self._lock:
+            entry = self._state.get(job, {})
+            return dict(entry.get("done", {})) if entry.get("slot") == slot.isoformat() else {}
+
+    def interrupted(self, job: str):
+        """
+        Slot of the job's last run if it did not complete, else None.
+        """
+        with self._lock:
+            entry = self._state.get(job, {})
+        if entry and not entry.get("complete"):
+            return datetime.datetime.fromisoformat(entry["slot"])
+        return None
+
+    def mark_done(self, job: str, slot: datetime.datetime, rows: dict):
+        with self._lock:
+            entry = self._entry(job, slot)
+            entry["done"].update(rows)
+            self._save()
+
+    def mark_complete(self, job: str, slot: datetime.datetime):
+        with self._lock:
+            self._entry(job, slot)["complete"] = True
+            self._save()
+
+    def _entry(self, job: str, slot: datetime.datetime) -> dict:
+        entry = self._state.get(job)
+        if entry is None or entry.get("slot") != slot.isoformat():
+            entry = self._state[job] = {"slot": slot.isoformat(), "complete": False, "done": {}}
+        return entry
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=1, default=float)
+        os.replace(f"{self.path}.tmp", self.path)
+
+
+class Pipeline:
+    """
+    Fetch -> compute -> sink over a universe, with stages joined by bounded queues.
+
+    Fetch threads keep the (network-bound) API busy while the compute thread
+    backtests the symbols already downloaded and the sink thread writes
+    results out. Bounded queues stop a fast stage from running far ahead of
+    a slow one.
+
+    Attributes:
+    fetcher (StockDataFetcher): Data source
+    sheets (GoogleSheetsLogger, optional): Receives trade logs and the run summary
+    ledger (TradeLedger, optional): System of record for trades; when set,
+        Sheets only mirrors it and a failed Sheets write no longer holds
+        back checkpointing
+    notifier (optional): Object with send_alert(message), e.g. a TelegramAlertQueue
+    """
+
+    def __init__(self, fetcher, sheets=None, notifier=None, checkpoint=None, holding_period=5,
+                 strategy_params=None, fetch_workers=4, queue_size=8, flush_every=25, ledger=None):
+        """
+        Parameters:
+        fetcher (StockDataFetcher): Data source
+        sheets (GoogleSheetsLogger, optional): Sheets sink
+        notifier (optional): Alert sink with send_alert(message)
+        checkpoint (Checkpoint, optional): Progress store for resumable runs
+        holding_period (int): Bars to hold each backtested trade
+        strategy_params (dict, optional): Passed to TradingStrategy
+        fetch_workers (int): Concurrent fetch threads
+        queue_size (int): Capacity of each inter-stage queue
+        flush_every (int): Symbols between Sheets flushes (and checkpoint writes)
+        ledger (TradeLedger, optional): Trade ledger
+        """
+        self.fetcher = fetcher
+        self.sheets = sheets
+        self.notifier = notifier
+        self.checkpoint = checkpoint
+        self.holding_period = holding_period
+        self.strategy_params = strategy_params or {}
+        self.fetch_workers = fetch_workers
+        self.queue_size = queue_size
+        self.flush_every = flush_every
+        self.ledger = ledger
+
+    def run(self, job: Job, symbols, slot: datetime.datetime, stop_event=None) -> pd.DataFrame:
+        """
+        Process every symbol not yet checkpointed for the job's run at `slot`.
+
+        When `stop_event` is set, no new symbols are fetched; symbols already
+        in flight finish, sinks are flushed and progress is checkpointed.
+        Symbols that came back without data are not checkpointed, so a
+        resumed run tries them again.
+
+        Returns:
+        pd.DataFrame: Per-symbol summary of the whole run, including symbols
+            finished before a restart
+        """
+        stop_event = stop_event or threading.Event()
+        summaries = self.checkpoint.done(job.name, slot) if self.checkpoint else {}
+        todo = [s for s in dict.fromkeys(symbols) if s not in summaries]
+        if summaries:
+            print(f"[{job.name}] resuming run of {slot:%Y-%m-%d %H:%M}: "
+                  f"{len(summaries)} done, {len(todo)} left")
+
+        fetched = queue.Queue(maxsize=self.queue_size)
+        computed = queue.Queue(maxsize=self.queue_size)
+
+        with metrics.span("pipeline_run", job=job.name) as span:
+            compute = threading.Thread(target=self._compute_stage, args=(fetched, computed), daemon=True)
+            failed = []
+            sink = threading.Thread(target=self._sink_stage, args=(job, slot, computed, summaries, failed),
+                                    daemon=True)
+            compute.start()
+            sink.start()
+
+            # Submit no further ahead than the workers can take, so a stop takes effect quickly
+            slots = threading.Semaphore(self.fetch_workers)
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool:
+                for symbol in todo:
+                    while not slots.acquire(timeout=0.1):
+                        if stop_event.is_set():
+                            break
+                    if stop_event.is_set():
+                        print(f"[{job.name}] stopping; {symbol} and later symbols left for the next run")
+                        break
+                    pool.submit(self._fetch_stage, job, symbol, fetched).add_done_callback(
+                        lambda _: slots.release())
+
+            fetched.put(_DONE)
+            compute.join()
+            sink.join()
+            span.set(symbols=len(summaries))
+
+        if failed:
+            print(f"[{job.name}] results of {len(failed)} symbols were not recorded; "
+                  f"they are left for the next run")
+        if self.checkpoint is not None and not stop_event.is_set() and not failed:
+            self.checkpoint.mark_complete(job.name, slot)
+        return pd.DataFrame(list(summaries.values()))
+
+    def _fetch_stage(self, job: Job, symbol: str, out: queue.Queue):
+        try:
+            if job.series == "daily":
+                df = self.fetcher.get_daily_data(symbol, outputsize=job.outputsize)
+            else:
+                df = self.fetcher.get_intraday_data(symbol, interval=job.series, outputsize=job.outputsize)
+        except Exception as e:
+            print(f"[ERROR] fetch failed for {symbol}: {e}")
+            df = pd.DataFrame()
+        out.put((symbol, df))
+
+    def _compute_stage(self, inbox: queue.Queue, out: queue.Queue):
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                out.put(_DONE)
+                return
+            symbol, df = item
+            try:
+                trades = pd.DataFrame() if df.empty else TradingStrategy(df, **self.strategy_params) \
+                    .backtest_signals(holding_period=self.holding_period)
+            except Exception as e:
+                print(f"[ERROR] backtest failed for {symbol}: {e}")
+                trades = None
+            out.put((symbol, df, trades))
+
+    def _sink_stage(self, job: Job, slot: datetime.datetime, inbox: queue.Queue, summaries: dict,
+                    failed: list):
+        """
+        Record each symbol's results and commit them in batches.
+
+        A symbol whose results cannot be recorded is logged, added to `failed`
+        and left un-checkpointed, so the next run retries it; the stage keeps
+        draining its queue either way, so upstream stages never block on it.
+        """
+        pending = {}
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                break
+            symbol, df, trades = item
+            try:
+                if df.empty:
+                    self._alert(f"❌ No data for {symbol}.")
+                    continue
+                if trades is None:
+                    continue
+                pending[symbol] = self._emit(symbol, trades)
+            except Exception as e:
+                print(f"[ERROR] recording results failed for {symbol}: {e}")
+                failed.append(symbol)
+                continue
+
+            if len(pending) >= self.flush_every and self._commit(job, slot, pending, summaries):
+                pending = {}
+
+        if not self._commit(job, slot, pending, summaries, final=True):
+            failed.extend(pending)
+
+    def _emit(self, symbol: str, trades: pd.DataFrame) -> dict:
+        """
+        Record a symbol's trades (ledger, or Sheets directly), send its alert
+        and return its summary row.
+        """
+        if trades.empty:
+            message = f"⚠️ No trade signals for {symbol}."
+        else:
+            message = f"✅ {len(trades)} trades for {symbol}, P&L ₹{trades['Profit ₹'].sum():.2f}"
+            if self.ledger is not None:
+                self.ledger.record_trades(symbol, trades, params=self.strategy_params,
+                                          holding_period=self.holding_period)
+            elif self.sheets is not None:
+                self.sheets.queue_dataframe(trades.assign(Symbol=symbol)[["Symbol", *trades.columns]],
+                                            "Trade Log", mode="append")
+        self._alert(message)
+
+        return {
+            "Symbol": symbol,
+            "Total Trades": len(trades),
+            "Win Ratio": float((trades["Result"] == "Win").mean()) if len(trades) else 0.0,
+            "Total P&L (₹)": float(trades["Profit ₹"].sum()) if len(trades) else 0.0,
+        }
+
+    def _alert(self, message: str):
+        print(message)
+        if self.notifier is not None:
+            self.notifier.send_alert(message)
+
+    def _commit(self, job: Job, slot: datetime.datetime, pending: dict, summaries: dict,
+                final=False) -> bool:
+        """
+        Flush the Sheets sink, then checkpoint the symbols it covered.
+
+        With a ledger, trades are already durable, so Sheets is mirrored on a
+        best-effort basis: rows it misses are sent with the next commit. The
+        final commit of a run also replaces the Summary tab.
+
+        Returns:
+        bool: False if the flush or checkpoint failed; the writes stay staged
+            in the logger and the symbols stay pending
+        """
+        try:
+            if final and self.sheets is not None and (pending or summaries):
+                self.sheets.queue_dataframe(pd.DataFrame([*summaries.values(), *pending.values()]),
+                                            "Summary", mode="replace")
+            if self.ledger is not None:
+                if self.sheets is not None:
+                    self.ledger.mirror(self.sheets)
+            elif self.sheets is not None and not self.sheets.flush():
+                return False
+            if self.checkpoint is not None and pending:
+                self.checkpoint.mark_done(job.name, slot, pending)
+        except Exception as e:
+            print(f"[ERROR] commit of {len(pending)} symbols failed: {e}")
+            return False
+        summaries.update(pending)
+        return True
+
+
+class Scheduler:
+    """
+    Runs the universe's jobs on their schedules until stopped.
+
+    SIGINT/SIGTERM request a graceful stop: the current pipeline run
+    finishes its in-flight symbols, flushes and checkpoints, then exits.
+    """
+
+    def __init__(self, pipeline: Pipeline, jobs, symbols, clock=datetime.datetime.now):
+        """
+        Parameters:
+        pipeline (Pipeline): Pipeline used for every run
+        jobs (list[Job]): Scheduled jobs
+        symbols (list[str]): Universe
+        clock (callable): Returns the current local time; replaceable in tests
+        """
+        self.pipeline = pipeline
+        self.jobs = list(jobs)
+        self.symbols = list(symbols)
+        self.clock = clock
+        self.stop_event = threading.Event()
+
+    def install_signal_handlers(self):
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda signum, frame: self.stop())
+
+    def stop(self):
+        if not self.stop_event.is_set():
+            print("[SCHEDULER] shutdown requested; finishing in-flight work")
+        self.stop_event.set()
+
+    def run_job(self, job: Job, slot=None) -> pd.DataFrame:
+        """
+        Run one job now for slot `slot`.
+
+        By default the run belongs to the job's current slot, so running it
+        again in the same period (e.g. a restarted --once) resumes it and
+        skips checkpointed symbols instead of refetching everything. An
+        interrupted run of an earlier slot is not resumed here; run_forever
+        does that.
+        """
+        slot = slot or job.current_slot(self.clock())
+        print(f"[SCHEDULER] running {job.name} for {slot:%Y-%m-%d %H:%M}")
+        return self.pipeline.run(job, self.symbols, slot, self.stop_event)
+
+    def run_forever(self):
+        """
+        Resume interrupted runs, then sleep until the next due job, run it,
+        repeat; returns after stop().
+        """
+        checkpoint = self.pipeline.checkpoint
+        for job in self.jobs:
+            slot = checkpoint.interrupted(job.name) if checkpoint else None
+            if slot is not None and not self.stop_event.is_set():
+                self.run_job(job, slot)
+
+        now = self.clock()
+        due = {job.name: job.next_slot(now) for job in self.jobs}
+        while not self.stop_event.is_set():
+            job = min(self.jobs, key=lambda j: due[j.name])
+            slot = due[job.name]
+            wait = (slot - self.clock()).total_seconds()
+            if wait > 0:
+                print(f"[SCHEDULER] next: {job.name} at {slot:%Y-%m-%d %H:%M}")
+                if self.stop_event.wait(wait):
+                    break
+
+            self.run_job(job, slot)
+            due[job.name] = job.next_slot(max(slot, self.clock()))
+
+
+def _parse_time(value: str) -> datetime.time:
+    return datetime.datetime.strptime(value, "%H:%M").time()
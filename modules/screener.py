@@ -0,0 +1,231 @@
+import numpy as np
+import pandas as pd
+
+from .bars import Bars
+from .indicators import panel_rsi, panel_sma
+from .instrumentation import metrics
+from .strategy import buy_signal_mask
+
+
+def build_panel(frames: dict, column="Close", lookback=None):
+    """
+    Align one column of many symbols into a symbols x dates array.
+
+    The date axis is the union of all symbols' dates; a symbol without a
+    bar on a date holds NaN there. See bar_positions() for lining each
+    symbol's own bars up instead.
+
+    Parameters:
+    frames (dict[str, pd.DataFrame or Bars]): Symbol -> bars, oldest first
+    column (str): Column to load, e.g. "Close"
+    lookback (int, optional): Keep only each symbol's last `lookback` bars
+
+    Returns:
+    tuple: (symbols list, datetime64[ns] dates, float64 array of shape (symbols, dates))
+    """
+    symbols, stamps, values = [], [], []
+    for symbol, df in frames.items():
+        if len(df) == 0:
+            continue
+        if isinstance(df, Bars):
+            ts, vals = df.timestamps, getattr(df, column.lower())
+        else:
+            ts = np.asarray(df['date'], dtype='datetime64[ns]').view(np.int64)
+            vals = df[column].to_numpy()
+        if lookback is not None:
+            ts, vals = ts[-lookback:], vals[-lookback:]
+        symbols.append(symbol)
+        stamps.append(ts)
+        values.append(vals)
+
+    if not symbols:
+        return [], np.empty(0, dtype='datetime64[ns]'), np.empty((0, 0))
+
+    dates = np.unique(np.concatenate(stamps))
+    rows = np.repeat(np.arange(len(symbols)), [len(ts) for ts in stamps])
+    cols = np.searchsorted(dates, np.concatenate(stamps))
+    panel = np.full((len(symbols), len(dates)), np.nan)
+    panel[rows, cols] = np.concatenate(values)
+    return symbols, dates.view('datetime64[ns]'), panel
+
+
+def bar_positions(panel: np.ndarray) -> tuple:
+    """
+    Map a date-aligned panel onto each row's own bars, right-aligned.
+
+    In the bar-aligned layout a row holds only its symbol's bars, in order
+    and ending at the last column; rows with fewer bars (late listings) are
+    NaN-padded on the left. Indicators computed there never see a missing
+    bar in the middle of a window, so they match a per-symbol computation.
+
+    Parameters:
+    panel (np.ndarray): Date-aligned panel, NaN where a symbol has no bar
+
+    Returns:
+    tuple: (rows, date columns, bar columns, width): panel[rows, date columns]
+        are the bars, found at [rows, bar columns] in a (symbols, width) panel
+    """
+    rows, cols = np.nonzero(~np.isnan(panel))
+    counts = np.bincount(rows, minlength=len(panel))
+    width = int(counts.max()) if len(rows) else 0
+    # Rank of each bar within its row, then shift the row to end at the last column
+    firsts = np.cumsum(counts) - counts
+    bar_cols = width - counts[rows] + np.arange(len(rows)) - firsts[rows]
+    return rows, cols, bar_cols, width
+
+
+class Screener:
+    """
+    RSI + MA crossover screen over a whole universe in one vectorized pass.
+
+    Close prices are loaded into a symbols x dates panel and RSI, both
+    moving averages and the BUY mask are computed for every symbol at once
+    along the time axis, with the same rule as TradingStrategy. Windows run
+    over each symbol's own bars, so a date one symbol has no bar on does
+    not blank its indicators. By default only the bars the indicators need
+    for the latest bar are loaded.
+
+    Attributes:
+    symbols (list[str]): Panel rows
+    dates (np.ndarray): Panel columns, datetime64[ns]
+    close (np.ndarray): Close prices, symbols x dates, NaN-padded
+    rsi, fast_ma, slow_ma (np.ndarray): Indicator panels, after compute_indicators()
+    signals (np.ndarray): Boolean BUY panel, after generate_signals()
+    """
+
+    def __init__(self, frames: dict, rsi_window=14, oversold=30, fast_window=20, slow_window=50,
+                 lookback=None):
+        """
+        Parameters:
+        frames (dict[str, pd.DataFrame or Bars]): Symbol -> bars, oldest first
+        rsi_window (int): RSI lookback window
+        oversold (float): RSI level below which a bar counts as oversold
+        fast_window (int): Fast moving average window
+        slow_window (int): Slow moving average window
+        lookback (int, optional): Bars per symbol to load; defaults to the
+            warm-up the latest bar needs. Pass a larger value to screen
+            further back in time.
+        """
+        self.rsi_window = rsi_window
+        self.oversold = oversold
+        self.fast_window = fast_window
+        self.slow_window = slow_window
+        self.fast_col = f'MA{fast_window}'
+        self.slow_col = f'MA{slow_window}'
+
+        # RSI needs window + 1 closes; the crossover needs both MAs on the previous bar too
+        warmup = max(rsi_window, fast_window, slow_window) + 1
+        self.symbols, self.dates, self.close = build_panel(frames, "Close", lookback or warmup)
+        self._positions = bar_positions(self.close)
+        self.rsi = self.fast_ma = self.slow_ma = None
+        self.signals = None
+
+    def compute_indicators(self):
+        """
+        Compute the RSI and moving-average panels.
+        """
+        with metrics.span("compute_indicators", symbol="panel") as span:
+            close = self._by_bar(self.close)
+            self.rsi = self._by_date(panel_rsi(close, self.rsi_window))
+            self.fast_ma = self._by_date(panel_sma(close, self.fast_window))
+            self.slow_ma = self._by_date(panel_sma(close, self.slow_window))
+            span.set(rows=self.close.size)
+
+    def generate_signals(self) -> np.ndarray:
+        """
+        Compute the BUY mask for every symbol and date.
+
+        Returns:
+        np.ndarray: Boolean panel, symbols x dates
+        """
+        self.compute_indicators()
+        with metrics.span("generate_signals", symbol="panel") as span:
+            # The crossover compares with each symbol's previous bar, not the previous date
+            signals = buy_signal_mask(self._by_bar(self.rsi), self._by_bar(self.fast_ma),
+                                      self._by_bar(self.slow_ma), self.oversold)
+            self.signals = self._by_date(signals, fill=False)
+            span.set(signals=int(self.signals.sum()))
+        return self.signals
+
+    def _by_bar(self, panel: np.ndarray) -> np.ndarray:
+        rows, cols, bar_cols, width = self._positions
+        out = np.full((len(panel), width), np.nan)
+        out[rows, bar_cols] = panel[rows, cols]
+        return out
+
+    def _by_date(self, panel: np.ndarray, fill=np.nan) -> np.ndarray:
+        rows, cols, bar_cols, _ = self._positions
+        out = np.full(self.close.shape, fill, dtype=panel.dtype)
+        out[rows, cols] = panel[rows, bar_cols]
+        return out
+
+    def screen(self) -> pd.DataFrame:
+        """
+        Indicators and signal on each symbol's latest bar, ranked by RSI.
+
+        A symbol whose data ends before the others is screened on its own
+        last bar; check 'date' to spot stale symbols.
+
+        Returns:
+        pd.DataFrame: One row per symbol with 'Symbol', 'date', 'Close',
+            'RSI', the two MA columns, 'MA Spread' (fast / slow - 1),
+            'Signal' ("BUY" or "") and 'RSI Rank' (1 = most oversold),
+            sorted by RSI
+        """
+        if self.signals is None:
+            self.generate_signals()
+        if not self.symbols:
+            return pd.DataFrame(columns=['Symbol', 'date', 'Close', 'RSI', self.fast_col,
+                                         self.slow_col, 'MA Spread', 'Signal', 'RSI Rank'])
+
+        rows = np.arange(len(self.symbols))
+        valid = ~np.isnan(self.close)
+        last = self.close.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+
+        fast, slow = self.fast_ma[rows, last], self.slow_ma[rows, last]
+        df = pd.DataFrame({
+            'Symbol': self.symbols,
+            'date': self.dates[last],
+            'Close': self.close[rows, last],
+            'RSI': self.rsi[rows, last],
+            self.fast_col: fast,
+            self.slow_col: slow,
+            'MA Spread': fast / slow - 1,
+            'Signal': np.where(self.signals[rows, last], 'BUY', ''),
+        })
+        df['RSI Rank'] = df['RSI'].rank(method='min').astype('Int64')
+        return df.sort_values('RSI', kind='stable', ignore_index=True)
+
+    def latest_signals(self) -> list:
+        """
+        Symbols with a BUY signal on their latest bar, most oversold first.
+        """
+        screen = self.screen()
+        return screen.loc[screen['Signal'] == 'BUY', 'Symbol'].tolist()
+
+    def rank(self, by='RSI', ascending=True, top=None) -> pd.DataFrame:
+        """
+        Latest-bar screen sorted by any of its columns.
+
+        Parameters:
+        by (str): Column to sort on, e.g. 'RSI' or 'MA Spread'
+        ascending (bool): Sort direction; NaN always sorts last
+        top (int, optional): Return only the first `top` rows
+
+        Returns:
+        pd.DataFrame: Sorted screen
+        """
+        ranked = self.screen().sort_values(by, ascending=ascending, kind='stable', ignore_index=True)
+        return ranked if top is None else ranked.head(top)
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    symbols = ["RELIANCE.BSE", "TCS.BSE", "INFY.BSE", "HDFCBANK.BSE"]
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    screener = Screener(fetcher.get_daily_data_batch(symbols))
+
+    print(screener.screen())
+    print("BUY today:", screener.latest_signals())
@@ -1,13 +1,96 @@
 import pandas as pd
 import numpy as np
-import sys
-import os
 
-from data_fetcher import DataFetcherFactory
+from .bars import Bars
+from .indicators import rsi, sma
+from .instrumentation import metrics
+
+def buy_signal_mask(rsi, fast_ma, slow_ma, oversold=30.0) -> np.ndarray:
+    """
+    Columnar signal engine for the RSI + MA crossover rule.
+
+    A bar is a BUY when RSI is below the oversold threshold and the fast MA
+    crosses above the slow MA between the previous bar and this one. Works on
+    arrays of any shape; time runs along the last axis.
+
+    Parameters:
+    rsi (np.ndarray): RSI values
+    fast_ma (np.ndarray): Fast (20-bar) moving average
+    slow_ma (np.ndarray): Slow (50-bar) moving average
+    oversold (float): RSI threshold below which a bar counts as oversold
+
+    Returns:
+    np.ndarray: Boolean mask, True on bars that carry a BUY signal
+    """
+    rsi = np.asarray(rsi, dtype=float)
+    fast_ma = np.asarray(fast_ma, dtype=float)
+    slow_ma = np.asarray(slow_ma, dtype=float)
+
+    mask = np.zeros(rsi.shape, dtype=bool)
+    if rsi.shape[-1] < 2:
+        return mask
+
+    # NaN compares False, so warm-up bars drop out without explicit notna checks
+    mask[..., 1:] = (
+        (rsi[..., 1:] < oversold) &
+        (fast_ma[..., :-1] < slow_ma[..., :-1]) &
+        (fast_ma[..., 1:] > slow_ma[..., 1:])
+    )
+    return mask
+
+
+def build_trade_log(dates, close, buy_idx, holding_period=5) -> pd.DataFrame:
+    """
+    Compute fixed-horizon trades for every buy index in one array operation.
+
+    Parameters:
+    dates (np.ndarray): Bar dates, in bar order
+    close (np.ndarray): Close prices, in bar order
+    buy_idx (np.ndarray): Positional indices of the BUY bars
+    holding_period (int or sequence of int): Bars to hold each trade
+
+    Returns:
+    pd.DataFrame: Trade log; trades whose exit falls past the last bar are skipped.
+        A sequence of holding periods adds a 'Holding Period' column.
+    """
+    multi = not np.isscalar(holding_period)
+    periods = np.atleast_1d(np.asarray(holding_period, dtype=np.intp))
+    buy_idx = np.asarray(buy_idx, dtype=np.intp)
+
+    # One row per (holding period, signal) pair
+    sell_idx = (periods[:, None] + buy_idx[None, :]).ravel()
+    period_col = np.repeat(periods, len(buy_idx))
+    buy_col = np.tile(buy_idx, len(periods))
+
+    complete = sell_idx < len(close)  # Skip incomplete trades
+    sell_idx, period_col, buy_col = sell_idx[complete], period_col[complete], buy_col[complete]
+
+    buy, sell = np.asarray(close[buy_col]), np.asarray(close[sell_idx])
+    # P&L and Result come from the unrounded prices, as they always have
+    profit = sell.astype(np.float64) - buy
+
+    trade_log = pd.DataFrame({
+        "Buy Date": dates[buy_col],
+        "Buy Price": _quoted(buy),
+        "Sell Date": dates[sell_idx],
+        "Sell Price": _quoted(sell),
+        "Profit ₹": np.round(profit, 2),
+        "Result": np.where(profit > 0, "Win", "Loss"),
+    })
+    if multi:
+        trade_log.insert(0, "Holding Period", period_col)
+    return trade_log
+
+
+def _quoted(prices: np.ndarray) -> np.ndarray:
+    """
+    Prices as logged: float64 prices as they are; float32 bars as the
+    shortest decimal that maps back to them (101.4, not 101.4000015).
+    """
+    if prices.dtype == np.float32:
+        return prices.astype(str).astype(np.float64)
+    return prices.astype(np.float64, copy=False)
 
-# Add module path to import data_fetcher or other shared modules
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 class TradingStrategy:
     """
@@ -15,65 +98,68 @@ class TradingStrategy:
     Generates BUY signals and simulates basic backtesting.
     """
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, rsi_window=14, oversold=30, fast_window=20, slow_window=50):
         """
         Initialize with stock price data.
 
         Parameters:
-        df (pd.DataFrame): Historical stock data with 'Close' and 'date' columns.
+        df (pd.DataFrame or Bars): Historical stock data with 'Close' and 'date' columns.
+            The frame is shared, not copied; added indicator columns never
+            reach the caller's frame.
+        rsi_window (int): RSI lookback window
+        oversold (float): RSI level below which a bar counts as oversold
+        fast_window (int): Fast moving average window
+        slow_window (int): Slow moving average window
         """
-        self.df = df.copy()
+        if isinstance(df, Bars):
+            df = df.to_frame()
+        self.df = df.copy(deep=False)
+        self.rsi_window = rsi_window
+        self.oversold = oversold
+        self.fast_window = fast_window
+        self.slow_window = slow_window
+        self.fast_col = f'MA{fast_window}'
+        self.slow_col = f'MA{slow_window}'
+        self.symbol = df.attrs.get('symbol', '')
         self.signals = pd.DataFrame()
+        self.signal_idx = np.array([], dtype=np.intp)
 
     def compute_indicators(self):
         """
-        Compute RSI (Relative Strength Index),
-        20-day and 50-day moving averages for the DataFrame.
+        Compute RSI (Relative Strength Index) and the fast/slow
+        (by default 20-day and 50-day) moving averages for the DataFrame.
         """
-        close = self.df['Close']
-        delta = close.diff()
-
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
+        with metrics.span("compute_indicators", symbol=self.symbol) as span:
+            close = self.df['Close']
 
-        rs = avg_gain / (avg_loss + 1e-10)  # Avoid division by zero
-        rsi = 100 - (100 / (1 + rs))
-        self.df['RSI'] = rsi
-
-        self.df['MA20'] = close.rolling(window=20).mean()
-        self.df['MA50'] = close.rolling(window=50).mean()
+            self.df['RSI'] = rsi(close, window=self.rsi_window)
+            self.df[self.fast_col] = sma(close, window=self.fast_window)
+            self.df[self.slow_col] = sma(close, window=self.slow_window)
+            span.set(rows=len(close))
 
     def generate_signals(self) -> pd.DataFrame:
         """
         Generate BUY signals based on:
-        - RSI < 30
-        - 20-day MA crossing above 50-day MA
+        - RSI < oversold threshold (default 30)
+        - Fast MA (default 20-day) crossing above slow MA (default 50-day)
 
         Returns:
         pd.DataFrame: DataFrame containing the buy signal rows
         """
         self.compute_indicators()
-        buy_signals = []
-
-        for i in range(1, len(self.df)):
-            rsi = self.df.loc[i, 'RSI']
-            ma20_prev = self.df.loc[i - 1, 'MA20']
-            ma50_prev = self.df.loc[i - 1, 'MA50']
-            ma20_now = self.df.loc[i, 'MA20']
-            ma50_now = self.df.loc[i, 'MA50']
-
-            if (
-                pd.notna(rsi) and pd.notna(ma20_prev) and pd.notna(ma50_prev) and
-                rsi < 30 and
-                ma20_prev < ma50_prev and ma20_now > ma50_now
-            ):
-                buy_signals.append(self.df.loc[i, 'date'])
-
-        self.signals = self.df[self.df['date'].isin(buy_signals)].copy()
-        self.signals['Signal'] = 'BUY'
+        with metrics.span("generate_signals", symbol=self.symbol) as span:
+            mask = buy_signal_mask(
+                self.df['RSI'].to_numpy(dtype=float),
+                self.df[self.fast_col].to_numpy(dtype=float),
+                self.df[self.slow_col].to_numpy(dtype=float),
+                oversold=self.oversold,
+            )
+
+            # Positional indices let the backtest jump straight to each trade's bar
+            self.signal_idx = np.flatnonzero(mask)
+            self.signals = self.df[mask].copy()
+            self.signals['Signal'] = 'BUY'
+            span.set(rows=len(mask), signals=len(self.signal_idx))
         return self.signals
 
     def backtest_signals(self, holding_period=5):
@@ -81,41 +167,25 @@ class TradingStrategy:
         Backtest strategy with fixed holding period to calculate P&L.
 
         Args:
-            holding_period (int): Days to hold the stock after buy signal.
+            holding_period (int or sequence of int): Days to hold the stock after
+                buy signal. Passing several periods (e.g. range(1, 31)) backtests
+                all of them from a single signal pass.
 
         Returns:
             pd.DataFrame: Trade log with buy date, sell date, and profit/loss.
+                When several holding periods are given, the log gains a
+                'Holding Period' column with one block of trades per period.
         """
-        signals = self.generate_signals()
-        trade_log = []
-
-        for _, signal in signals.iterrows():
-            buy_date = signal['date']
-            buy_price = signal['Close']
-
-            # Find index of buy_date in original df
-            idx = self.df[self.df['date'] == buy_date].index[0]
-
-            # Calculate sell index and handle edge case
-            sell_idx = idx + holding_period
-            if sell_idx >= len(self.df):
-                continue  # Skip incomplete trades
-
-            sell_date = self.df.loc[sell_idx, 'date']
-            sell_price = self.df.loc[sell_idx, 'Close']
-            profit = sell_price - buy_price
-            result = "Win" if profit > 0 else "Loss"
-
-            trade_log.append({
-                "Buy Date": buy_date,
-                "Buy Price": buy_price,
-                "Sell Date": sell_date,
-                "Sell Price": sell_price,
-                "Profit ₹": round(profit, 2),
-                "Result": result
-            })
-
-        return pd.DataFrame(trade_log)
+        self.generate_signals()
+        with metrics.span("backtest_signals", symbol=self.symbol) as span:
+            trade_log = build_trade_log(
+                self.df['date'].to_numpy(),
+                self.df['Close'].to_numpy(),
+                self.signal_idx,
+                holding_period,
+            )
+            span.set(trades=len(trade_log))
+        return trade_log
 
     def backtest(self):
         """
@@ -123,11 +193,13 @@ class TradingStrategy:
         """
         signals = self.generate_signals()
         print("\nBuy signals found:")
-        print(signals[['date', 'Close', 'RSI', 'MA20', 'MA50', 'Signal']])
+        print(signals[['date', 'Close', 'RSI', self.fast_col, self.slow_col, 'Signal']])
         return signals
  
 # Example usage   
 if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
     fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
     df = fetcher.get_daily_data("RELIANCE.BSE", outputsize="full")
 
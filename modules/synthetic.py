@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+
+def generate_ohlcv(n_bars: int, seed=42, start="2000-01-03", freq="B", start_price=100.0,
+                   volatility=0.02, drift=0.0002) -> pd.DataFrame:
+    """
+    Seeded synthetic OHLCV bars shaped like AlphaVantageStockDataFetcher output.
+
+    Close follows a geometric random walk; Open/High/Low are drawn around it so
+    that Low <= Open, Close <= High always holds.
+
+    Parameters:
+    n_bars (int): Number of bars
+    seed (int): Random seed; the same seed always gives the same frame
+    start (str): First bar date
+    freq (str): Bar frequency, e.g. "B" (business days) or "15min"
+    start_price (float): First close
+    volatility (float): Standard deviation of per-bar log returns
+    drift (float): Mean per-bar log return
+
+    Returns:
+    pd.DataFrame: Columns date, Open, High, Low, Close, Volume, oldest first
+    """
+    rng = np.random.default_rng(seed)
+
+    close = start_price * np.exp(np.cumsum(rng.normal(drift, volatility, n_bars)))
+    open_ = np.empty(n_bars)
+    open_[0] = start_price
+    open_[1:] = close[:-1] * np.exp(rng.normal(0, volatility / 4, n_bars - 1))
+
+    body_high = np.maximum(open_, close)
+    body_low = np.minimum(open_, close)
+    high = body_high * (1 + np.abs(rng.normal(0, volatility / 2, n_bars)))
+    low = body_low * (1 - np.abs(rng.normal(0, volatility / 2, n_bars)))
+    volume = rng.lognormal(mean=13, sigma=0.5, size=n_bars).round()
+
+    return pd.DataFrame({
+        "date": pd.date_range(start, periods=n_bars, freq=freq),
+        "Open": open_.round(2),
+        "High": high.round(2),
+        "Low": low.round(2),
+        "Close": close.round(2),
+        "Volume": volume,
+    })
+
+
+def generate_raw_alpha_vantage(n_bars: int, seed=42, **kwargs) -> pd.DataFrame:
+    """
+    Synthetic bars in the raw layout alpha_vantage returns, for exercising _format_data.
+
+    Parameters:
+    n_bars (int): Number of bars
+    seed (int): Random seed
+    **kwargs: Passed to generate_ohlcv
+
+    Returns:
+    pd.DataFrame: Newest-first frame indexed by 'date' with '1. open' ... '5. volume' columns
+    """
+    df = generate_ohlcv(n_bars, seed=seed, **kwargs)
+    raw = df.set_index("date").iloc[::-1]
+    raw.columns = ["1. open", "2. high", "3. low", "4. close", "5. volume"]
+    return raw
+
+
+def generate_universe(n_symbols: int, n_bars: int, seed=42, **kwargs) -> dict:
+    """
+    Synthetic universe of independent symbols.
+
+    Parameters:
+    n_symbols (int): Number of symbols
+    n_bars (int): Bars per symbol
+    seed (int): Base seed; symbol i uses seed + i
+
+    Returns:
+    dict[str, pd.DataFrame]: Symbol -> OHLCV frame
+    """
+    return {
+        f"SYN{i:04d}.BSE": generate_ohlcv(n_bars, seed=seed + i, **kwargs)
+        for i in range(n_symbols)
+    }
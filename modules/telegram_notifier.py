@@ -1,18 +1,14 @@
-import os
-import sys
-import requests
-import pandas as pd
-from dotenv import load_dotenv
+import atexit
+import queue
+import threading
+import time
 
-# Add module paths
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from . import config
+from .instrumentation import metrics
+from .rate_limiter import TokenBucket
 
-from data_fetcher import DataFetcherFactory
-from strategy import TradingStrategy
-
-# Load .env
-load_dotenv()
+# Telegram rejects messages longer than this many characters
+MAX_MESSAGE_LENGTH = 4096
 
 class TelegramNotifier:
     """
@@ -20,33 +16,204 @@ class TelegramNotifier:
     Requires TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID to be defined in the .env file.
     """
 
-    def __init__(self):
-        self.token = os.getenv("TELEGRAM_BOT_TOKEN")
-        self.chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        self.api_url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+    def __init__(self, token=None, chat_id=None, api_base="https://api.telegram.org", timeout=10):
+        """
+        Parameters:
+        token (str, optional): Bot token; defaults to TELEGRAM_BOT_TOKEN
+        chat_id (str, optional): Target chat; defaults to TELEGRAM_CHAT_ID
+        api_base (str): Bot API root, e.g. a local mock server
+        timeout (float): Request timeout in seconds
+        """
+        self.token = token or config.telegram_bot_token()
+        self.chat_id = chat_id or config.telegram_chat_id()
+        self.api_url = f"{api_base}/bot{self.token}/sendMessage"
+        self.timeout = timeout
 
         if not self.token or not self.chat_id:
             raise ValueError("Missing Telegram credentials in environment variables.")
 
+        import requests
+
+        # Pooled keep-alive connection reused across messages
+        self.session = requests.Session()
+
     def send_alert(self, message: str):
         """
         Send a message to the Telegram chat.
         """
+        with metrics.span("telegram_send"):
+            try:
+                response = self._post(message)
+                if response.status_code != 200:
+                    print(f"[Telegram Error] {response.text}")
+            except Exception as e:
+                print(f"[Telegram Exception] {e}")
+
+    def _post(self, message: str) -> "requests.Response":
+        """
+        Post one message and return the raw response.
+        """
         payload = {
             "chat_id": self.chat_id,
             "text": message
         }
+        metrics.inc("telegram_api_calls_total")
+        return self.session.post(self.api_url, data=payload, timeout=self.timeout)
+
+
+class TelegramAlertQueue:
+    """
+    Non-blocking delivery queue in front of a TelegramNotifier.
+
+    send_alert() only enqueues. A background worker drains the queue, merges
+    bursts of alerts into as few messages as fit Telegram's size limit, paces
+    sends to the per-chat rate limit and honours 429 retry_after. Pending
+    alerts are flushed on close() and at interpreter exit.
+    """
+
+    def __init__(self, notifier: TelegramNotifier, min_interval=1.0, batch_window=0.5, max_retries=3):
+        """
+        Parameters:
+        notifier (TelegramNotifier): Notifier used to deliver messages
+        min_interval (float): Minimum seconds between messages to the chat
+        batch_window (float): Seconds to wait for more alerts before sending a batch
+        max_retries (int): Attempts per message on rate limits, network or
+            server errors; a chat that stays rate limited is given up on
+            rather than blocking every alert queued behind it
+        """
+        self.notifier = notifier
+        self.batch_window = batch_window
+        self.max_retries = max_retries
+        self.rate_limiter = TokenBucket(rate=1 / min_interval)
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="telegram-alerts", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def send_alert(self, message: str):
+        """
+        Queue a message for delivery; never blocks on the network.
+        """
+        if self._closed:
+            raise RuntimeError("Alert queue is closed.")
+        self._queue.put(message)
 
-        try:
-            response = requests.post(self.api_url, data=payload)
-            if response.status_code != 200:
-                print(f"[Telegram Error] {response.text}")
-        except Exception as e:
-            print(f"[Telegram Exception] {e}")
+    def close(self, timeout=30):
+        """
+        Deliver everything still queued, then stop the worker.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+
+            # Collect the rest of the burst
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+
+            metrics.inc("telegram_alerts_total", len(batch))
+            for message in merge_messages(batch):
+                with metrics.span("telegram_send"):
+                    self._deliver(message)
+
+    def _deliver(self, message: str):
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self.notifier._post(message)
+            except Exception as e:
+                response, error = None, e
+            else:
+                if response.status_code == 200:
+                    return
+                error = response.text
+
+                if response.status_code == 429:
+                    metrics.inc("telegram_rate_limited_total")
+                    retry_after = _retry_after(response)
+                    # Later messages wait out the penalty too, so no extra sleep here
+                    self.rate_limiter.penalize(retry_after)
+                    attempt += 1
+                    if attempt >= self.max_retries:
+                        print(f"[Telegram Exception] giving up after {attempt} attempts: still rate limited")
+                        return
+                    print(f"[Telegram] rate limited, retrying in {retry_after}s")
+                    continue
+                if response.status_code < 500:
+                    print(f"[Telegram Error] {error}")
+                    return
+
+            attempt += 1
+            metrics.inc("telegram_retries_total")
+            if attempt >= self.max_retries:
+                print(f"[Telegram Exception] giving up after {attempt} attempts: {error}")
+                return
+            time.sleep(2 ** attempt)
+
+
+def merge_messages(messages, limit=MAX_MESSAGE_LENGTH):
+    """
+    Pack alerts into as few messages as possible without exceeding `limit`.
+
+    Parameters:
+    messages (list[str]): Alerts in send order
+    limit (int): Maximum characters per message
+
+    Returns:
+    list[str]: Messages to send; oversized alerts are split
+    """
+    merged, current = [], ""
+    for message in messages:
+        for part in [message[i:i + limit] for i in range(0, len(message), limit)] or [""]:
+            if current and len(current) + 2 + len(part) <= limit:
+                current = f"{current}\n\n{part}"
+            else:
+                if current:
+                    merged.append(current)
+                current = part
+    if current:
+        merged.append(current)
+    return merged
+
+
+def _retry_after(response) -> float:
+    """
+    Seconds to wait from a 429 response, per the Bot API error format.
+    """
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except Exception:
+        return float(response.headers.get("Retry-After", 1))
 
 
 # Example Usage#
 if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+    from .strategy import TradingStrategy
+
     try:
         notifier = TelegramNotifier()
         fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
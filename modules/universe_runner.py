@@ -0,0 +1,140 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+from .strategy import TradingStrategy, build_trade_log
+
+
+class UniverseBacktester:
+    """
+    Runs the RSI + MA strategy over many symbols across CPU cores.
+
+    Each symbol's closes and dates are written once, in their own dtypes,
+    straight into one shared-memory block. Worker processes attach to it
+    and wrap zero-copy slices, so no DataFrame is pickled on the way in and
+    compact float32 bars are backtested exactly as TradingStrategy would.
+    Each worker runs the whole backtest for its symbols (indicators, signals
+    and trade logs); only the (small) trade logs travel back to be merged.
+
+    Attributes:
+    symbols (list[str]): Symbols in the universe
+    max_workers (int): Number of worker processes
+    """
+
+    def __init__(self, frames: dict, max_workers=None):
+        """
+        Parameters:
+        frames (dict[str, pd.DataFrame]): Symbol -> OHLCV frame with 'date' and 'Close'
+        max_workers (int, optional): Worker processes; defaults to the CPU count
+        """
+        self.symbols = [symbol for symbol, df in frames.items() if not df.empty]
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        # Views of the frames' columns; copied only into the shared block
+        self._close = [frames[symbol]['Close'].to_numpy() for symbol in self.symbols]
+        self._dates = [frames[symbol]['date'].to_numpy() for symbol in self.symbols]
+        lengths = np.array([len(close) for close in self._close], dtype=np.int64)
+        self._offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    def run(self, holding_period=5) -> pd.DataFrame:
+        """
+        Compute indicators, signals and trades for every symbol in parallel.
+
+        Parameters:
+        holding_period (int or sequence of int): Bars to hold each trade
+
+        Returns:
+        pd.DataFrame: Merged trade log with a leading 'Symbol' column
+        """
+        if not self.symbols:
+            return pd.DataFrame()
+
+        # Byte layout of the block: each symbol's closes, then its dates, 8-byte aligned
+        arrays = [a for pair in zip(self._close, self._dates) for a in pair]
+        sizes = [-(-a.nbytes // 8) * 8 for a in arrays]
+        starts = np.concatenate([[0], np.cumsum(sizes)]).tolist()
+        shm = SharedMemory(create=True, size=max(starts[-1], 1))
+        try:
+            for array, at in zip(arrays, starts):
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, offset=at)[:] = array
+            specs = [
+                (symbol, len(close), starts[2 * i], close.dtype, starts[2 * i + 1], dates.dtype)
+                for i, (symbol, close, dates) in enumerate(zip(self.symbols, self._close, self._dates))
+            ]
+            jobs = [(shm.name, specs[lo:hi], holding_period) for lo, hi in self._chunks()]
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                logs = [log for result in pool.map(_backtest_worker, jobs) for log in result]
+        finally:
+            shm.close()
+            shm.unlink()
+
+        if not logs:
+            return pd.DataFrame()
+        return pd.concat(logs, ignore_index=True)
+
+    def _chunks(self):
+        """
+        Split symbols into contiguous chunks of roughly equal bar count,
+        a few per worker so a slow chunk does not stall the pool.
+        """
+        n_chunks = min(len(self.symbols), self.max_workers * 4)
+        targets = np.linspace(0, self._offsets[-1], n_chunks + 1)[1:-1]
+        cuts = np.searchsorted(self._offsets[1:], targets) + 1
+        bounds = np.unique(np.concatenate([[0], cuts, [len(self.symbols)]]))
+        return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _backtest_worker(job):
+    """
+    Worker entry point: backtest a chunk of symbols.
+
+    Parameters:
+    job (tuple): (shared block name, per-symbol specs, holding period); a
+        spec is (symbol, bars, close offset, close dtype, dates offset,
+        dates dtype), offsets in bytes
+
+    Returns:
+    list[pd.DataFrame]: Non-empty trade logs with a 'Symbol' column
+    """
+    name, specs, holding_period = job
+    # Pool workers share the parent's resource tracker, so attaching here does
+    # not hand ownership of the block to the worker
+    shm = SharedMemory(name=name)
+    try:
+        return _chunk_backtest(shm, specs, holding_period)
+    finally:
+        shm.close()
+
+
+def _chunk_backtest(shm, specs, holding_period):
+    """
+    Backtest each symbol's slice of the shared block. Kept separate from the
+    worker so the buffer views are released before the block closes; the
+    trade logs it returns hold copies, not views.
+    """
+    logs = []
+    for symbol, n_bars, close_at, close_dtype, dates_at, dates_dtype in specs:
+        close = np.ndarray((n_bars,), dtype=close_dtype, buffer=shm.buf, offset=close_at)
+        dates = np.ndarray((n_bars,), dtype=dates_dtype, buffer=shm.buf, offset=dates_at)
+        # copy=False: wrap the shared slice instead of copying it into the frame
+        strategy = TradingStrategy(pd.DataFrame({'Close': close}, copy=False))
+        strategy.generate_signals()
+        log = build_trade_log(dates, close, strategy.signal_idx, holding_period)
+        if not log.empty:
+            log.insert(0, "Symbol", symbol)
+            logs.append(log)
+    return logs
+
+
+# Example usage
+if __name__ == "__main__":
+    from .data_fetcher import DataFetcherFactory
+
+    fetcher = DataFetcherFactory.get_data_fetcher("alpha_vantage")
+    frames = fetcher.get_daily_data_batch(["RELIANCE.BSE", "TCS.BSE", "INFY.BSE"], outputsize="full")
+
+    trades = UniverseBacktester(frames).run(holding_period=5)
+    print(trades.groupby("Symbol")["Profit ₹"].agg(["count", "sum"]))